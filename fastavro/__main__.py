@@ -1,13 +1,48 @@
+from argparse import ArgumentParser
+import ast
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
 from decimal import Decimal
+from functools import partial
+from io import BytesIO
+from itertools import islice
 import json
+import operator
+import os
+import random
+import shutil
+import sys
 from sys import stdout
+from tempfile import NamedTemporaryFile
+import threading
+import time
+from types import SimpleNamespace
 from uuid import UUID
 
 import fastavro as avro
+from fastavro.io.binary_decoder import BinaryDecoder
+from fastavro._logical_common import strip_logical_types
+from fastavro._schema_common import PRIMITIVES
+
+try:
+    from fastavro import _json_write
+except ImportError:
+    from fastavro import _json_write_py as _json_write  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 encoding = stdout.encoding or "UTF-8"
 
+# Number of records serialized and written to the output at a time
+DEFAULT_BATCH_SIZE = 1000
+
+# Minimum number of seconds between flushes of the output
+DEFAULT_FLUSH_INTERVAL = 1.0
+
 
 class CleanJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -21,13 +56,825 @@ class CleanJSONEncoder(json.JSONEncoder):
             return json.JSONEncoder.default(self, obj)
 
 
-def main(argv=None):
-    import sys
-    from argparse import ArgumentParser
+def _orjson_default(obj):
+    # orjson serializes dates, times and UUIDs itself
+    if isinstance(obj, Decimal):
+        return str(obj)
+    elif isinstance(obj, bytes):
+        return obj.decode("iso-8859-1")
+    raise TypeError
+
+
+def _json_dumps(pretty, use_orjson=False):
+    """Returns a function that serializes a record to a JSON string"""
+    if pretty:
+        encoder = CleanJSONEncoder(indent=4)
+    elif use_orjson:
+
+        def dumps(obj):
+            return orjson.dumps(obj, default=_orjson_default).decode()
+
+        return dumps
+    else:
+        encoder = CleanJSONEncoder()
+    return encoder.encode
+
+
+def _dump_records(records, dumps, out, batch_size, flush_interval):
+    """Writes the serialized records to out a batch at a time, flushing the
+    output at most every flush_interval seconds"""
+    records = iter(records)
+    last_flush = time.monotonic()
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        out.write("".join([dumps(record) + "\n" for record in batch]))
+        now = time.monotonic()
+        if now - last_flush >= flush_interval:
+            out.flush()
+            last_flush = now
+    out.flush()
+
+
+def _open_input(filename, seekable=False):
+    if filename == "-":
+        fo = sys.stdin.buffer
+        if seekable and not fo.seekable():
+            # Reading blocks needs the position in the input
+            fo = BytesIO(fo.read())
+        return fo
+    return open(filename, "rb")
+
+
+def count_records(fo):
+    """Returns the number of records in an avro file without decoding them"""
+    return sum(block.num_records for block in avro.block_reader(fo))
+
+
+def _is_comparable(schema):
+    """Returns whether the values of a field are primitive values (or null)
+    that the statistics are gathered for"""
+    record_type = avro.schema.extract_record_type(schema)
+    if record_type == "union":
+        types = [s for s in schema if s != "null"]
+        return len(types) == 1 and len(schema) == 2 and _is_comparable(types[0])
+    return record_type in PRIMITIVES and record_type != "null"
+
+
+def file_stats(fo):
+    """Returns statistics of the blocks of an avro file and the null count,
+    minimum and maximum of its fields with primitive values
+
+    Only those fields are decoded, the others are skipped while reading.
+    """
+    header = avro.block_reader(fo)
+    writer_schema = header.writer_schema
+    stats = {
+        "codec": header.codec,
+        "blocks": 0,
+        "records": 0,
+        "block_bytes": 0,
+        "uncompressed_bytes": 0,
+    }
+
+    fields = []
+    if avro.schema.extract_record_type(writer_schema) == "record":
+        for field in writer_schema["fields"]:
+            if _is_comparable(field["type"]):
+                fields.append({"name": field["name"], "type": field["type"]})
+
+    if fields:
+        # Read again with a reader schema of only the fields the statistics
+        # are gathered for
+        fo.seek(0)
+        reader_schema = {
+            "type": "record",
+            "name": writer_schema["name"],
+            "fields": fields,
+        }
+        blocks = avro.block_reader(fo, reader_schema)
+    else:
+        blocks = header
+
+    field_stats = {
+        field["name"]: {"nulls": 0, "min": None, "max": None} for field in fields
+    }
+    for block in blocks:
+        stats["blocks"] += 1
+        stats["records"] += block.num_records
+        stats["block_bytes"] += block.size
+        with block.bytes_.getbuffer() as view:
+            stats["uncompressed_bytes"] += view.nbytes
+        if not fields:
+            continue
+        for record in block:
+            for name, value in record.items():
+                values = field_stats[name]
+                if value is None:
+                    values["nulls"] += 1
+                elif values["min"] is None:
+                    values["min"] = values["max"] = value
+                elif value < values["min"]:
+                    values["min"] = value
+                elif value > values["max"]:
+                    values["max"] = value
+
+    if stats["block_bytes"]:
+        stats["compression_ratio"] = round(
+            stats["uncompressed_bytes"] / stats["block_bytes"], 3
+        )
+    else:
+        stats["compression_ratio"] = None
+    stats["fields"] = field_stats
+    return stats
+
+
+def _merge_blocks(blocks, sync_interval):
+    """Yields blocks made of consecutive blocks with at least sync_interval
+    bytes of records (except the last one). The records are not decoded so
+    larger blocks are not split."""
+    num_records = 0
+    pending = []
+    size = 0
+    for block in blocks:
+        data = block.bytes_.getvalue()
+        num_records += block.num_records
+        pending.append(data)
+        size += len(data)
+        if size >= sync_interval:
+            yield SimpleNamespace(
+                num_records=num_records, bytes_=BytesIO(b"".join(pending))
+            )
+            num_records = 0
+            pending = []
+            size = 0
+    if pending:
+        yield SimpleNamespace(
+            num_records=num_records, bytes_=BytesIO(b"".join(pending))
+        )
+
+
+def _ordered_map(executor, fn, items, ahead):
+    """Yields fn(item) for each of the items in order, with up to ahead calls
+    submitted to the executor at a time"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def recodec_file(fo, out, codec, compression_level=None, sync_interval=None, threads=1):
+    """Copies an avro file to out with a different codec without decoding the
+    records
+
+    Parameters
+    ----------
+    fo: file-like
+        Input avro file
+    out: file-like
+        Output stream
+    codec: str
+        Codec of the output
+    compression_level: int, optional
+        Compression level of the codec
+    sync_interval: int, optional
+        If given, consecutive blocks are combined into blocks of at least
+        this many bytes before compression
+    threads: int, optional
+        Number of threads that compress blocks at a time
+    """
+    blocks = avro.block_reader(fo)
+    # The schema is written as it was in the input
+    schema = json.loads(blocks.metadata["avro.schema"])
+    metadata = {
+        key: value
+        for key, value in blocks.metadata.items()
+        if not key.startswith("avro.")
+    }
+    output = avro.write.Writer(
+        out, schema, codec, metadata=metadata, compression_level=compression_level
+    )
+
+    if sync_interval:
+        blocks = _merge_blocks(blocks, sync_interval)
+
+    if threads <= 1:
+        for block in blocks:
+            output.write_block(block)
+        output.flush()
+        return
+
+    local = threading.local()
+
+    def compress(block):
+        # Each thread writes the blocks to a memory buffer with a writer of
+        # its own and the encoded block is taken from after the header
+        if not hasattr(local, "writer"):
+            local.buffer = BytesIO()
+            local.writer = avro.write.Writer(
+                local.buffer,
+                schema,
+                codec,
+                sync_marker=output.sync_marker,
+                compression_level=compression_level,
+            )
+            local.start = local.buffer.tell()
+        local.writer.write_block(block)
+        encoded = local.buffer.getvalue()[local.start :]
+        local.buffer.seek(local.start)
+        local.buffer.truncate()
+        return encoded
+
+    output.flush()
+    with ThreadPoolExecutor(threads) as executor:
+        for encoded in _ordered_map(executor, compress, blocks, threads * 2):
+            out.write(encoded)
+    out.flush()
+
+
+def _block_at(blocks, fo, offset):
+    """Returns the block at an offset of the file that blocks reads from"""
+    fo.seek(offset)
+    return next(blocks)
+
+
+def _block_offsets(fo, start):
+    """Yields the offsets of the blocks of a file from the first one at start,
+    seeking past their contents"""
+    decoder = BinaryDecoder(fo)
+    fo.seek(start)
+    while True:
+        offset = fo.tell()
+        try:
+            decoder.read_long()
+        except StopIteration:
+            return
+        size = decoder.read_long()
+        fo.seek(size + avro.read.SYNC_SIZE, os.SEEK_CUR)
+        yield offset
+
+
+def _block_offsets_from_end(fo, sync_marker, start, chunk_size=64 * 1024):
+    """Yields the offsets of the blocks of a file from the last one backwards,
+    found by scanning for the sync markers that end the blocks from the end of
+    the file. The first block is at start."""
+    end = fo.seek(0, os.SEEK_END)
+    overlap = b""
+    pos = end
+    while pos > start:
+        chunk_start = max(pos - chunk_size, start)
+        fo.seek(chunk_start)
+        # Keep the start of the chunk after this one to find the markers that
+        # are split between them
+        data = fo.read(pos - chunk_start) + overlap
+        stop = len(data)
+        while True:
+            index = data.rfind(sync_marker, 0, stop)
+            if index < 0:
+                break
+            offset = chunk_start + index + len(sync_marker)
+            if offset < end:
+                yield offset
+            stop = index + len(sync_marker) - 1
+        overlap = data[: len(sync_marker) - 1]
+        pos = chunk_start
+    if start < end:
+        yield start
+
+
+def head_records(fo, n):
+    """Returns the first n records of an avro file"""
+    return list(islice(avro.reader(fo), n))
+
+
+def tail_records(fo, n):
+    """Returns the last n records of an avro file, only reading the blocks
+    that they are in"""
+    blocks = avro.block_reader(fo)
+    start = fo.tell()
+    tail = []
+    count = 0
+    next_offset = None
+    for offset in _block_offsets_from_end(fo, blocks._header["sync"], start):
+        if count >= n:
+            break
+        block = _block_at(blocks, fo, offset)
+        if next_offset is not None and offset + block.size != next_offset:
+            # The sync marker happened to be in the data of a block
+            continue
+        next_offset = offset
+        tail.append(block)
+        count += block.num_records
+    records = [record for block in reversed(tail) for record in block]
+    return records[len(records) - n :] if n else []
+
+
+def sample_records(fo, fraction, seed=None):
+    """Returns the records of a random fraction of the blocks of an avro
+    file, only reading the chosen blocks"""
+    blocks = avro.block_reader(fo)
+    rng = random.Random(seed)
+    offsets = [
+        offset for offset in _block_offsets(fo, fo.tell()) if rng.random() < fraction
+    ]
+    return [record for offset in offsets for record in _block_at(blocks, fo, offset)]
+
+
+def _count_file(filename):
+    with _open_input(filename, seekable=True) as fo:
+        return count_records(fo)
+
+
+def _file_stats(filename):
+    with _open_input(filename, seekable=True) as fo:
+        return dict(file=filename, **file_stats(fo))
+
+
+def _field_tree(paths):
+    """Returns a tree of dictionaries of the field names of the paths, where
+    None selects the whole value of a field"""
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path[:-1]:
+            node = node.setdefault(name, {})
+            if node is None:
+                # The whole value is already selected
+                break
+        else:
+            node[path[-1]] = None
+    return tree
+
+
+def _project_record(schema, tree, named_schemas, expand, prefix):
+    names = {field["name"] for field in schema["fields"]}
+    for name in tree:
+        if name not in names:
+            raise ValueError(f"unknown field: {prefix}{name}")
+
+    fields = []
+    for field in schema["fields"]:
+        name = field["name"]
+        if name in tree:
+            field_type = field["type"]
+            if tree[name] is not None:
+                field_type = _project_type(
+                    field_type, tree[name], named_schemas, expand, f"{prefix}{name}"
+                )
+            fields.append({"name": name, "type": field_type})
+    return {"type": schema["type"], "name": schema["name"], "fields": fields}
+
+
+def _record_schema(schema, named_schemas):
+    if isinstance(schema, str):
+        schema = named_schemas.get(schema)
+    if isinstance(schema, dict) and schema["type"] in ("record", "error"):
+        return schema
+    return None
+
+
+def _project_type(schema, tree, named_schemas, expand, path):
+    if isinstance(schema, list):
+        if not any(_record_schema(s, named_schemas) for s in schema):
+            raise ValueError(f"{path} is not a record")
+        return [
+            (
+                _project_type(s, tree, named_schemas, expand, path)
+                if _record_schema(s, named_schemas)
+                else s
+            )
+            for s in schema
+        ]
+
+    record_schema = _record_schema(schema, named_schemas)
+    if record_schema is None:
+        raise ValueError(f"{path} is not a record")
+    projected = _project_record(record_schema, tree, named_schemas, expand, f"{path}.")
+    if isinstance(schema, str) and not expand:
+        # Schema resolution looks named types up by name so the whole record
+        # is read
+        return schema
+    return projected
+
+
+def projected_schema(writer_schema, named_schemas, paths, expand=False):
+    """Returns a reader schema of the fields of the writer schema selected by
+    the paths, like ``("user", "id")``, so that the other fields are skipped
+    instead of being decoded
+
+    Records that are referenced by the name of their type are read whole. If
+    expand is true they are projected as well, which does not give a schema
+    records can be read with but does give the schema of the output.
+    """
+    if _record_schema(writer_schema, named_schemas) is None:
+        raise ValueError("fields can only be selected from records")
+    schema = _project_record(
+        writer_schema, _field_tree(paths), named_schemas, expand, ""
+    )
+    # The named types are taken from the writer schema when reading
+    schema["__fastavro_parsed"] = True
+    schema["__named_schemas"] = {}
+    return schema
+
+
+def _select(value, tree):
+    if tree is None or not isinstance(value, dict):
+        return value
+    return {name: _select(value.get(name), subtree) for name, subtree in tree.items()}
+
+
+def _lookup(record, path):
+    value = record
+    for name in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
+
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+def _field_path(node):
+    if isinstance(node, ast.Name):
+        return (node.id,)
+    elif isinstance(node, ast.Attribute):
+        path = _field_path(node.value)
+        if path is not None:
+            return path + (node.attr,)
+    return None
+
+
+def _compile_expression(node, paths):
+    path = _field_path(node)
+    if path is not None:
+        paths.append(path)
+        return partial(_lookup, path=path)
+    elif isinstance(node, ast.BoolOp):
+        values = [_compile_expression(value, paths) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda record: all(value(record) for value in values)
+        return lambda record: any(value(record) for value in values)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_expression(node.operand, paths)
+        return lambda record: not operand(record)
+    elif isinstance(node, ast.Compare):
+        left = _compile_expression(node.left, paths)
+        comparisons = [
+            (_COMPARISONS[type(op)], _compile_expression(comparator, paths))
+            for op, comparator in zip(node.ops, node.comparators)
+        ]
+
+        def compare(record):
+            left_value = left(record)
+            for op, right in comparisons:
+                right_value = right(record)
+                try:
+                    if not op(left_value, right_value):
+                        return False
+                except TypeError:
+                    # Like a comparison with NULL in SQL, comparing a missing
+                    # value, like `age > 45` with a null age, does not match
+                    return False
+                left_value = right_value
+            return True
+
+        return compare
+
+    # Anything else has to be a literal, like a string, number or list
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"unsupported expression: {ast.dump(node)}")
+    return lambda record: value
+
+
+def compile_where(expression):
+    """Returns a function that evaluates a filter expression for a record and
+    the paths of the fields that the expression uses
+
+    The expression can compare fields, like ``user.name``, and literals with
+    comparison operators and combine comparisons with ``and``, ``or`` and
+    ``not``. Nothing else is evaluated.
+    """
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as ex:
+        raise ValueError(f"invalid expression: {ex}")
+    paths = []
+    predicate = _compile_expression(tree.body, paths)
+    return predicate, paths
+
+
+def _parse_fields(fields):
+    return [tuple(field.split(".")) for field in fields.split(",") if field]
+
+
+def dump_file(filename, args, out):
+    """Writes the records, schema or metadata of an avro file to out as
+    selected by the command line arguments"""
+    fo = _open_input(filename, seekable=bool(args.fields))
+
+    # Avro JSON is written from the values of the underlying Avro types
+    logical_types = args.output != "avro-json"
+    reader = avro.reader(fo, logical_types=logical_types)
+
+    if args.schema:
+        json.dump(reader.schema, out, indent=4)
+        out.write("\n")
+        return
+
+    elif args.metadata:
+        del reader.metadata["avro.schema"]
+        json.dump(reader.metadata, out, indent=4)
+        out.write("\n")
+        return
+
+    writer_schema = reader.writer_schema
+    named_schemas = reader._named_schemas
+    records = reader
+
+    if args.where:
+        predicate, where_paths = compile_where(args.where)
+    if args.fields:
+        paths = _parse_fields(args.fields)
+        read_paths = paths + where_paths if args.where else paths
+        try:
+            reader_schema = projected_schema(writer_schema, named_schemas, read_paths)
+            writer_schema = projected_schema(
+                writer_schema, named_schemas, paths, expand=True
+            )
+        except ValueError as ex:
+            sys.exit(f"fastavro: error: {filename}: {ex}")
+        # Read the file again with only the selected fields
+        fo.seek(0)
+        records = avro.reader(fo, reader_schema, logical_types=logical_types)
+    if args.where:
+        records = filter(predicate, records)
+    if args.fields:
+        tree = _field_tree(paths)
+        records = (_select(record, tree) for record in records)
 
+    dumps = _json_dumps(args.pretty, args.orjson)
+    if args.output == "avro-json":
+        schema, named_schemas = strip_logical_types(writer_schema, named_schemas, False)
+        convert = _json_write.compile_writer(schema, named_schemas)
+        json_dumps = dumps
+
+        def dumps(record):
+            return json_dumps(convert(record))
+
+    _dump_records(records, dumps, out, args.batch_size, args.flush_interval)
+
+
+def _dump_file_to_temp(filename, args):
+    # The output of a file dumped in a worker process is written to a
+    # temporary file so that it can be copied to the output in order without
+    # being held in memory
+    with NamedTemporaryFile(
+        "w", encoding=encoding, suffix=".json", delete=False
+    ) as out:
+        try:
+            dump_file(filename, args, out)
+        except BaseException:
+            out.close()
+            os.remove(out.name)
+            raise
+    return out.name
+
+
+def _remove_temp_files(futures):
+    """Removes the temporary files of the futures of _dump_file_to_temp,
+    including the ones that are still running"""
+    for future in futures:
+        future.cancel()
+    for future in futures:
+        if future.cancelled() or future.exception() is not None:
+            continue
+        try:
+            os.remove(future.result())
+        except FileNotFoundError:
+            pass
+
+
+def _map_files(fn, files, jobs):
+    """Yields fn(filename) for each of the files in order, calling it for up
+    to jobs files at a time in a pool of processes"""
+    if jobs <= 1 or len(files) <= 1:
+        for filename in files:
+            yield fn(filename)
+    else:
+        with ProcessPoolExecutor(jobs) as executor:
+            yield from executor.map(fn, files)
+
+
+def _add_jobs_argument(parser):
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="number of files processed at a time (default: %(default)s)",
+        type=int,
+        default=1,
+    )
+
+
+def _input_files(parser, args):
+    files = args.file or ["-"]
+    if args.jobs > 1 and "-" in files:
+        parser.error("stdin can not be read with more than one job")
+    return files
+
+
+def count_main(argv):
+    parser = ArgumentParser(
+        prog="fastavro count",
+        description="print the number of records in avro file(s)",
+    )
+    parser.add_argument("file", help="file(s) to count, use `-' for stdin", nargs="*")
+    _add_jobs_argument(parser)
+    args = parser.parse_args(argv)
+
+    files = _input_files(parser, args)
+    print(sum(_map_files(_count_file, files, args.jobs)))
+
+
+def stats_main(argv):
+    parser = ArgumentParser(
+        prog="fastavro stats",
+        description="print statistics of the blocks and fields of avro file(s)",
+    )
+    parser.add_argument("file", help="file(s) to examine, use `-' for stdin", nargs="*")
+    _add_jobs_argument(parser)
+    args = parser.parse_args(argv)
+
+    files = _input_files(parser, args)
+    for stats in _map_files(_file_stats, files, args.jobs):
+        json.dump(stats, sys.stdout, indent=4, cls=CleanJSONEncoder)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+def recodec_main(argv):
+    parser = ArgumentParser(
+        prog="fastavro recodec",
+        description="copy an avro file with a different codec without "
+        + "decoding the records",
+    )
+    parser.add_argument("input", help="avro file to copy, use `-' for stdin")
+    parser.add_argument("output", help="file to write, use `-' for stdout")
+    parser.add_argument(
+        "--codec", help="codec of the output (default: %(default)s)", default="null"
+    )
+    parser.add_argument("--level", help="compression level of the codec", type=int)
+    parser.add_argument(
+        "--sync-interval",
+        help="combine blocks into blocks of at least this many bytes",
+        type=int,
+    )
+    parser.add_argument(
+        "--threads",
+        help="number of blocks compressed at a time (default: %(default)s)",
+        type=int,
+        default=1,
+    )
+    args = parser.parse_args(argv)
+
+    if args.codec not in avro.write.BLOCK_WRITERS:
+        parser.error(f"unsupported codec: {args.codec}")
+
+    with _open_input(args.input, seekable=True) as fo:
+        if args.output == "-":
+            out = sys.stdout.buffer
+        else:
+            out = open(args.output, "wb")
+        with out:
+            recodec_file(
+                fo, out, args.codec, args.level, args.sync_interval, args.threads
+            )
+
+
+def _print_records(records, args):
+    _dump_records(
+        records,
+        _json_dumps(args.pretty),
+        sys.stdout,
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_FLUSH_INTERVAL,
+    )
+
+
+def _records_parser(prog, description):
+    parser = ArgumentParser(prog=prog, description=description)
+    parser.add_argument("file", help="file(s) to read, use `-' for stdin", nargs="*")
+    parser.add_argument(
+        "-p", "--pretty", help="pretty print json", action="store_true", default=False
+    )
+    return parser
+
+
+def head_main(argv):
+    parser = _records_parser("fastavro head", "print the first records of avro file(s)")
+    parser.add_argument(
+        "-n", help="number of records (default: %(default)s)", type=int, default=10
+    )
+    args = parser.parse_args(argv)
+
+    for filename in args.file or ["-"]:
+        with _open_input(filename) as fo:
+            _print_records(head_records(fo, args.n), args)
+
+
+def tail_main(argv):
+    parser = _records_parser("fastavro tail", "print the last records of avro file(s)")
+    parser.add_argument(
+        "-n", help="number of records (default: %(default)s)", type=int, default=10
+    )
+    args = parser.parse_args(argv)
+
+    for filename in args.file or ["-"]:
+        with _open_input(filename, seekable=True) as fo:
+            _print_records(tail_records(fo, args.n), args)
+
+
+def sample_main(argv):
+    parser = _records_parser(
+        "fastavro sample", "print the records of random blocks of avro file(s)"
+    )
+    parser.add_argument(
+        "--fraction",
+        help="fraction of the blocks to print (default: %(default)s)",
+        type=float,
+        default=0.01,
+    )
+    parser.add_argument("--seed", help="seed of the random choice of blocks", type=int)
+    args = parser.parse_args(argv)
+
+    for filename in args.file or ["-"]:
+        with _open_input(filename, seekable=True) as fo:
+            _print_records(sample_records(fo, args.fraction, args.seed), args)
+
+
+SUBCOMMANDS = {
+    "count": count_main,
+    "stats": stats_main,
+    "recodec": recodec_main,
+    "head": head_main,
+    "tail": tail_main,
+    "sample": sample_main,
+}
+
+
+def _subcommand_index(parser, args):
+    """Returns the index of the subcommand in args, or None if the first
+    argument that is neither an option of parser nor the value of one is not
+    a subcommand. Arguments after `--' are never subcommands."""
+    takes_value = {
+        option
+        for action in parser._actions
+        if action.nargs != 0
+        for option in action.option_strings
+    }
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg == "--":
+            return None
+        elif arg.startswith("-") and arg != "-":
+            if arg in takes_value:
+                index += 1
+        else:
+            return index if arg in SUBCOMMANDS else None
+        index += 1
+    return None
+
+
+def main(argv=None):
     argv = argv or sys.argv
 
-    parser = ArgumentParser(description="iter over avro file, emit records as JSON")
+    parser = ArgumentParser(
+        description="iter over avro file, emit records as JSON",
+        epilog="subcommands: `fastavro count FILE...' prints the number of "
+        + "records, `fastavro stats FILE...' prints block and field statistics "
+        + "and `fastavro recodec IN OUT' copies a file with a different codec. "
+        + "`fastavro head|tail|sample FILE...' print some of the records. "
+        + "Options given before the subcommand are passed to it. Use "
+        + "`fastavro -- FILE...' to dump files named like a subcommand",
+    )
     parser.add_argument("file", help="file(s) to parse, use `-' for stdin", nargs="*")
     parser.add_argument(
         "--schema",
@@ -50,37 +897,93 @@ def main(argv=None):
     parser.add_argument(
         "-p", "--pretty", help="pretty print json", action="store_true", default=False
     )
-    args = parser.parse_args(argv[1:])
+    parser.add_argument(
+        "--orjson",
+        help="serialize the records with orjson, which is faster but does not "
+        + "put spaces after the separators",
+        action="store_true",
+        default=False,
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--ndjson",
+        help="emit a plain JSON object per line (the default)",
+        action="store_const",
+        dest="output",
+        const="ndjson",
+        default="ndjson",
+    )
+    output.add_argument(
+        "--avro-json",
+        help="emit records in the Avro JSON encoding",
+        action="store_const",
+        dest="output",
+        const="avro-json",
+    )
+    parser.add_argument(
+        "--batch-size",
+        help="number of records written at a time (default: %(default)s)",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+    )
+    parser.add_argument(
+        "--flush-interval",
+        help="minimum seconds between flushes of the output "
+        + "(default: %(default)s)",
+        type=float,
+        default=DEFAULT_FLUSH_INTERVAL,
+    )
+    parser.add_argument(
+        "--fields",
+        help="comma separated fields to output, like `id,user.name'. The other "
+        + "fields are skipped while reading",
+    )
+    parser.add_argument(
+        "--where",
+        help="only output the records that match an expression, like "
+        + '`status == "error" and user.age > 18\'',
+    )
+    _add_jobs_argument(parser)
 
-    if args.codecs:
-        print("\n".join(sorted(avro.read.BLOCK_READERS)))
-        exit(0)
+    index = _subcommand_index(parser, argv[1:])
+    if index is not None:
+        args = argv[1:]
+        return SUBCOMMANDS[args[index]](args[:index] + args[index + 1 :])
 
-    files = args.file or ["-"]
-    for filename in files:
-        if filename == "-":
-            fo = sys.stdin.buffer
-        else:
-            fo = open(filename, "rb")
+    args = parser.parse_args(argv[1:])
 
-        reader = avro.reader(fo)
+    if args.where:
+        try:
+            compile_where(args.where)
+        except ValueError as ex:
+            parser.error(str(ex))
 
-        if args.schema:
-            json.dump(reader.schema, sys.stdout, indent=4)
-            sys.stdout.write("\n")
-            continue
+    if args.orjson and orjson is None:
+        parser.error("--orjson requires orjson to be installed")
 
-        elif args.metadata:
-            del reader.metadata["avro.schema"]
-            json.dump(reader.metadata, sys.stdout, indent=4)
-            sys.stdout.write("\n")
-            continue
+    if args.codecs:
+        print("\n".join(sorted(avro.read.BLOCK_READERS)))
+        exit(0)
 
-        indent = 4 if args.pretty else None
-        for record in reader:
-            json.dump(record, sys.stdout, indent=indent, cls=CleanJSONEncoder)
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+    files = _input_files(parser, args)
+    if args.jobs <= 1 or len(files) <= 1:
+        for filename in files:
+            dump_file(filename, args, sys.stdout)
+    else:
+        with ProcessPoolExecutor(args.jobs) as executor:
+            futures = [
+                executor.submit(_dump_file_to_temp, filename, args)
+                for filename in files
+            ]
+            try:
+                for future in futures:
+                    name = future.result()
+                    with open(name, encoding=encoding) as fo:
+                        shutil.copyfileobj(fo, sys.stdout)
+                    os.remove(name)
+                    sys.stdout.flush()
+            finally:
+                _remove_temp_files(futures)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,12 @@
+from typing import Any, Callable, Dict, Iterator, IO, Optional
+from .types import AvroMessage
+
+def compile_reader(schema: Dict, named_schemas: Dict) -> Callable[[Any], Any]: ...
+
+class reader:
+    reader_schema: Optional[Dict]
+    writer_schema: Dict
+    def __init__(self, fo: IO, schema: Dict): ...
+    def __iter__(self) -> Iterator[AvroMessage]: ...
+    def next(self) -> AvroMessage: ...
+    def __next__(self) -> AvroMessage: ...
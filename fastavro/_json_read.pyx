@@ -0,0 +1,270 @@
+# cython: language_level=3
+
+"""Python code for reading Avro JSON files
+
+Each line of the input is loaded with ``json.loads`` and converted to the
+Avro-typed value by a converter that is compiled once for the schema, so the
+schema does not need to be walked again for every value that is read.
+"""
+
+import json
+
+from ._read import LOGICAL_READERS
+from ._schema import extract_record_type, extract_logical_type, parse_schema
+from ._schema_common import UnknownType
+
+CYTHON_MODULE = 1  # Tests check this to confirm whether using the Cython code.
+
+cdef object _NO_DEFAULT = object()
+
+
+cdef class _Converter:
+    cdef convert(self, datum):
+        raise NotImplementedError
+
+
+cdef class _Identity(_Converter):
+    cdef convert(self, datum):
+        return datum
+
+
+cdef class _Latin1(_Converter):
+    cdef convert(self, datum):
+        return datum.encode("iso-8859-1")
+
+
+cdef class _EnumConverter(_Converter):
+    cdef list symbols
+    cdef frozenset symbol_set
+
+    def __init__(self, schema):
+        self.symbols = list(schema["symbols"])
+        self.symbol_set = frozenset(self.symbols)
+
+    cdef convert(self, datum):
+        if datum not in self.symbol_set:
+            raise ValueError(
+                f"{datum} is not one of the enum symbols {self.symbols}"
+            )
+        return datum
+
+
+cdef class _ArrayConverter(_Converter):
+    cdef _Converter items
+
+    def __init__(self, _Converter items):
+        self.items = items
+
+    cdef convert(self, datum):
+        if isinstance(self.items, _Identity):
+            return list(datum)
+        return [self.items.convert(item) for item in datum]
+
+
+cdef class _MapConverter(_Converter):
+    cdef _Converter values
+
+    def __init__(self, _Converter values):
+        self.values = values
+
+    cdef convert(self, datum):
+        if isinstance(self.values, _Identity):
+            return dict(datum)
+        return {key: self.values.convert(value) for key, value in datum.items()}
+
+
+cdef class _RecordConverter(_Converter):
+    cdef list names
+    cdef list converters
+    cdef list defaults
+    cdef list default_converters
+
+    def __init__(
+        self, list names, list converters, list defaults, list default_converters
+    ):
+        self.names = names
+        self.converters = converters
+        self.defaults = defaults
+        self.default_converters = default_converters
+
+    cdef convert(self, datum):
+        cdef Py_ssize_t i
+        cdef dict record = {}
+        for i in range(len(self.names)):
+            name = self.names[i]
+            value = datum.get(name, _NO_DEFAULT)
+            if value is not _NO_DEFAULT:
+                record[name] = (<_Converter>self.converters[i]).convert(value)
+            else:
+                default = self.defaults[i]
+                if default is _NO_DEFAULT:
+                    raise ValueError("no value and no default")
+                record[name] = (
+                    <_Converter>self.default_converters[i]
+                ).convert(default)
+        return record
+
+
+cdef class _UnionConverter(_Converter):
+    cdef dict branches
+
+    def __init__(self, dict branches):
+        self.branches = branches
+
+    cdef convert(self, datum):
+        # A union value is encoded as {"<type name>": value} unless it is null
+        if datum is None:
+            label = "null"
+        else:
+            label, datum = next(iter(datum.items()))
+        branch = self.branches.get(label)
+        if branch is None:
+            raise ValueError(
+                f"{label} is not one of the union types {list(self.branches)}"
+            )
+        return (<_Converter>branch).convert(datum)
+
+
+cdef class _NamedConverter(_Converter):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    cdef _Converter target
+
+    cdef convert(self, datum):
+        return self.target.convert(datum)
+
+
+cdef class _LogicalConverter(_Converter):
+    cdef object logical_reader
+    cdef object schema
+    cdef _Converter inner
+
+    def __init__(self, logical_reader, schema, _Converter inner):
+        self.logical_reader = logical_reader
+        self.schema = schema
+        self.inner = inner
+
+    cdef convert(self, datum):
+        return self.logical_reader(self.inner.convert(datum), self.schema, None)
+
+
+cdef _Converter _compile(schema, dict named_schemas, dict compiled):
+    cdef _Converter converter
+    cdef _NamedConverter named_converter
+
+    record_type = extract_record_type(schema)
+
+    if record_type in (
+        "null",
+        "boolean",
+        "string",
+        "int",
+        "long",
+        "float",
+        "double",
+    ):
+        converter = _Identity()
+    elif record_type in ("bytes", "fixed"):
+        converter = _Latin1()
+    elif record_type == "enum":
+        converter = _EnumConverter(schema)
+    elif record_type == "array":
+        converter = _ArrayConverter(
+            _compile(schema["items"], named_schemas, compiled)
+        )
+    elif record_type == "map":
+        converter = _MapConverter(
+            _compile(schema["values"], named_schemas, compiled)
+        )
+    elif record_type in ("union", "error_union"):
+        branches = {}
+        for candidate in schema:
+            if isinstance(candidate, dict):
+                label = candidate.get("name", candidate.get("type"))
+            else:
+                label = candidate
+            branches[label] = _compile(candidate, named_schemas, compiled)
+        converter = _UnionConverter(branches)
+    elif record_type in ("record", "error", "request"):
+        names = []
+        converters = []
+        defaults = []
+        default_converters = []
+        for field in schema["fields"]:
+            field_type = field["type"]
+            field_converter = _compile(field_type, named_schemas, compiled)
+            names.append(field["name"])
+            converters.append(field_converter)
+            defaults.append(field.get("default", _NO_DEFAULT))
+            if extract_record_type(field_type) == "union":
+                # The default value of a union is for the first type in the
+                # union and is not wrapped like the other union values
+                default_converters.append(
+                    _compile(field_type[0], named_schemas, compiled)
+                )
+            else:
+                default_converters.append(field_converter)
+        converter = _RecordConverter(
+            names, converters, defaults, default_converters
+        )
+    elif record_type in compiled:
+        converter = compiled[record_type]
+    elif record_type in named_schemas:
+        named_converter = _NamedConverter()
+        compiled[record_type] = named_converter
+        named_converter.target = _compile(
+            named_schemas[record_type], named_schemas, compiled
+        )
+        converter = named_converter
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        logical_reader = LOGICAL_READERS.get(logical_type)
+        if logical_reader:
+            converter = _LogicalConverter(logical_reader, schema, converter)
+
+    return converter
+
+
+cdef class CompiledReader:
+    cdef _Converter root
+
+    def __init__(self, schema, named_schemas):
+        self.root = _compile(schema, named_schemas, {})
+
+    def __call__(self, datum):
+        return self.root.convert(datum)
+
+
+cpdef compile_reader(schema, named_schemas):
+    return CompiledReader(schema, named_schemas)
+
+
+def _iter_json(fo, CompiledReader converter):
+    cdef _Converter root = converter.root
+    loads = json.loads
+    for line in fo:
+        if not line.isspace():
+            yield root.convert(loads(line))
+
+
+class reader:
+    def __init__(self, fo, schema):
+        self._named_schemas = {}
+        self.writer_schema = parse_schema(
+            schema, _write_hint=False, _named_schemas=self._named_schemas
+        )
+        self.reader_schema = None
+        self._elems = _iter_json(
+            fo, compile_reader(self.writer_schema, self._named_schemas)
+        )
+
+    def __iter__(self):
+        return self._elems
+
+    def next(self):
+        return next(self._elems)
+
+    __next__ = next
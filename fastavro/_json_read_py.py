@@ -0,0 +1,218 @@
+"""Python code for reading Avro JSON files
+
+Each line of the input is loaded with ``json.loads`` and converted to the
+Avro-typed value by a converter that is compiled once for the schema, so the
+schema does not need to be walked again for every value that is read.
+"""
+
+import json
+
+from ._read_py import LOGICAL_READERS
+from ._schema_common import UnknownType
+from .schema import extract_record_type, extract_logical_type, parse_schema
+
+_NO_DEFAULT = object()
+
+
+def _identity(datum):
+    return datum
+
+
+def _encode_latin1(datum):
+    return datum.encode("iso-8859-1")
+
+
+def _compile_array(schema, named_schemas, compiled):
+    items = _compile(schema["items"], named_schemas, compiled)
+    if items is _identity:
+        return list
+
+    def convert(datum):
+        return [items(item) for item in datum]
+
+    return convert
+
+
+def _compile_map(schema, named_schemas, compiled):
+    values = _compile(schema["values"], named_schemas, compiled)
+    if values is _identity:
+        return dict
+
+    def convert(datum):
+        return {key: values(value) for key, value in datum.items()}
+
+    return convert
+
+
+def _compile_record(schema, named_schemas, compiled):
+    fields = []
+    for field in schema["fields"]:
+        field_type = field["type"]
+        field_convert = _compile(field_type, named_schemas, compiled)
+        if extract_record_type(field_type) == "union":
+            # The default value of a union is for the first type in the union
+            # and is not wrapped like the other union values
+            default_convert = _compile(field_type[0], named_schemas, compiled)
+        else:
+            default_convert = field_convert
+        fields.append(
+            (
+                field["name"],
+                field_convert,
+                field.get("default", _NO_DEFAULT),
+                default_convert,
+            )
+        )
+
+    def convert(datum):
+        record = {}
+        for name, field_convert, default, default_convert in fields:
+            value = datum.get(name, _NO_DEFAULT)
+            if value is not _NO_DEFAULT:
+                record[name] = field_convert(value)
+            elif default is _NO_DEFAULT:
+                raise ValueError("no value and no default")
+            else:
+                record[name] = default_convert(default)
+        return record
+
+    return convert
+
+
+def _compile_union(schema, named_schemas, compiled):
+    branches = {}
+    for candidate in schema:
+        if isinstance(candidate, dict):
+            label = candidate.get("name", candidate.get("type"))
+        else:
+            label = candidate
+        branches[label] = _compile(candidate, named_schemas, compiled)
+
+    def convert(datum):
+        # A union value is encoded as {"<type name>": value} unless it is null
+        if datum is None:
+            label = "null"
+        else:
+            label, datum = next(iter(datum.items()))
+        try:
+            branch_convert = branches[label]
+        except KeyError:
+            raise ValueError(f"{label} is not one of the union types {list(branches)}")
+        return branch_convert(datum)
+
+    return convert
+
+
+def _compile_enum(schema):
+    symbols = schema["symbols"]
+    symbol_set = frozenset(symbols)
+
+    def convert(datum):
+        if datum not in symbol_set:
+            raise ValueError(f"{datum} is not one of the enum symbols {symbols}")
+        return datum
+
+    return convert
+
+
+def _compile_named(name, named_schemas, compiled):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    target = []
+
+    def convert(datum):
+        return target[0](datum)
+
+    compiled[name] = convert
+    target.append(_compile(named_schemas[name], named_schemas, compiled))
+    return convert
+
+
+def _compile(schema, named_schemas, compiled):
+    record_type = extract_record_type(schema)
+
+    if record_type in (
+        "null",
+        "boolean",
+        "string",
+        "int",
+        "long",
+        "float",
+        "double",
+    ):
+        convert = _identity
+    elif record_type in ("bytes", "fixed"):
+        convert = _encode_latin1
+    elif record_type == "enum":
+        convert = _compile_enum(schema)
+    elif record_type == "array":
+        convert = _compile_array(schema, named_schemas, compiled)
+    elif record_type == "map":
+        convert = _compile_map(schema, named_schemas, compiled)
+    elif record_type in ("union", "error_union"):
+        convert = _compile_union(schema, named_schemas, compiled)
+    elif record_type in ("record", "error", "request"):
+        convert = _compile_record(schema, named_schemas, compiled)
+    elif record_type in compiled:
+        convert = compiled[record_type]
+    elif record_type in named_schemas:
+        convert = _compile_named(record_type, named_schemas, compiled)
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        logical_reader = LOGICAL_READERS.get(logical_type)
+        if logical_reader:
+            inner = convert
+
+            def convert(datum):
+                return logical_reader(inner(datum), schema, None)
+
+    return convert
+
+
+def compile_reader(schema, named_schemas):
+    """Returns a function that converts an object loaded from Avro JSON to the
+    Python value for the parsed ``schema``"""
+    return _compile(schema, named_schemas, {})
+
+
+def _iter_json(fo):
+    loads = json.loads
+    for line in fo:
+        if not line.isspace():
+            yield loads(line)
+
+
+class reader:
+    """Iterator over records in an avro json file.
+
+    Parameters
+    ----------
+    fo: file-like
+        Input stream
+    schema: dict
+        Reader schema
+
+    .. attribute:: writer_schema
+
+        The schema the records are read with
+    """
+
+    def __init__(self, fo, schema):
+        self._named_schemas = {}
+        self.writer_schema = parse_schema(
+            schema, _write_hint=False, _named_schemas=self._named_schemas
+        )
+        self.reader_schema = None
+        convert = compile_reader(self.writer_schema, self._named_schemas)
+        self._elems = (convert(datum) for datum in _iter_json(fo))
+
+    def __iter__(self):
+        return self._elems
+
+    def next(self):
+        return next(self._elems)
+
+    __next__ = next
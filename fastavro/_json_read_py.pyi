@@ -0,0 +1 @@
+_json_read.pyi
\ No newline at end of file
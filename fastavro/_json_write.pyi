@@ -0,0 +1,12 @@
+from typing import Any, Callable, Dict, IO, Iterable
+
+DEFAULT_CHUNKSIZE: int
+
+def compile_writer(schema: Dict, named_schemas: Dict) -> Callable[[Any], Any]: ...
+def writer(
+    fo: IO,
+    schema: Dict,
+    records: Iterable,
+    chunksize: int = ...,
+    use_orjson: bool = ...,
+) -> None: ...
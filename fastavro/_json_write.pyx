@@ -0,0 +1,335 @@
+# cython: language_level=3
+
+"""Python code for writing Avro JSON files
+
+Records are converted to the objects that ``json.dumps`` serializes to Avro
+JSON by a converter that is compiled once for the schema, and written out a
+chunk of records at a time.
+"""
+
+from itertools import islice
+import json
+
+from ._logical_writers import LOGICAL_WRITERS
+from ._schema import extract_record_type, extract_logical_type, parse_schema
+from ._validation import compile_validator
+from ._schema_common import UnknownType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CYTHON_MODULE = 1  # Tests check this to confirm whether using the Cython code.
+
+# Number of records serialized and written to the output at a time
+DEFAULT_CHUNKSIZE = 1000
+
+
+cdef class _Converter:
+    cdef convert(self, datum):
+        raise NotImplementedError
+
+
+cdef class _Identity(_Converter):
+    cdef convert(self, datum):
+        return datum
+
+
+cdef class _Null(_Converter):
+    cdef convert(self, datum):
+        return None
+
+
+cdef class _Latin1(_Converter):
+    cdef convert(self, datum):
+        return datum.decode("iso-8859-1")
+
+
+cdef class _EnumConverter(_Converter):
+    cdef list symbols
+
+    def __init__(self, schema):
+        self.symbols = list(schema["symbols"])
+
+    cdef convert(self, datum):
+        return self.symbols[self.symbols.index(datum)]
+
+
+cdef class _ArrayConverter(_Converter):
+    cdef _Converter items
+
+    def __init__(self, _Converter items):
+        self.items = items
+
+    cdef convert(self, datum):
+        if isinstance(self.items, _Identity):
+            return list(datum)
+        return [self.items.convert(item) for item in datum]
+
+
+cdef class _MapConverter(_Converter):
+    cdef _Converter values
+
+    def __init__(self, _Converter values):
+        self.values = values
+
+    cdef convert(self, datum):
+        if isinstance(self.values, _Identity):
+            return dict(datum)
+        return {key: self.values.convert(value) for key, value in datum.items()}
+
+
+cdef class _RecordConverter(_Converter):
+    cdef list names
+    cdef list converters
+    cdef list optional
+    cdef list defaults
+
+    def __init__(self, list names, list converters, list optional, list defaults):
+        self.names = names
+        self.converters = converters
+        self.optional = optional
+        self.defaults = defaults
+
+    cdef convert(self, datum):
+        cdef Py_ssize_t i
+        cdef dict record = {}
+        for i in range(len(self.names)):
+            name = self.names[i]
+            if name in datum:
+                value = datum[name]
+            elif self.optional[i]:
+                value = self.defaults[i]
+            else:
+                raise ValueError(f"no value and no default for {name}")
+            try:
+                record[name] = (<_Converter>self.converters[i]).convert(value)
+            except TypeError as ex:
+                raise TypeError(f"{ex} on field {name}")
+        return record
+
+
+cdef class _UnionConverter(_Converter):
+    cdef object schema
+    cdef list names
+    cdef list labels
+    cdef list field_names
+    cdef list validators
+    cdef list converters
+
+    def __init__(
+        self,
+        schema,
+        list names,
+        list labels,
+        list field_names,
+        list validators,
+        list converters,
+    ):
+        self.schema = schema
+        self.names = names
+        self.labels = labels
+        self.field_names = field_names
+        self.validators = validators
+        self.converters = converters
+
+    cdef convert(self, datum):
+        cdef Py_ssize_t i
+        cdef Py_ssize_t index = -1
+        cdef Py_ssize_t fields
+        cdef Py_ssize_t most_fields = -1
+
+        if isinstance(datum, tuple):
+            (name, datum) = datum
+            for i in range(len(self.names)):
+                if self.names[i] == name:
+                    index = i
+                    break
+            if index == -1:
+                raise ValueError(
+                    f"provided union type name {name} not found in schema "
+                    + f"{self.schema}"
+                )
+        else:
+            for i in range(len(self.validators)):
+                if self.validators[i](datum, raise_errors=False):
+                    field_names = self.field_names[i]
+                    if field_names is None:
+                        index = i
+                        break
+                    fields = len((<frozenset>field_names).intersection(datum))
+                    if fields > most_fields:
+                        index = i
+                        most_fields = fields
+            if index == -1:
+                raise ValueError(
+                    f"{repr(datum)} (type {type(datum)}) do not match "
+                    + f"{self.schema}"
+                )
+
+        value = (<_Converter>self.converters[index]).convert(datum)
+        label = self.labels[index]
+        if label is None:
+            return value
+        return {label: value}
+
+
+cdef class _NamedConverter(_Converter):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    cdef _Converter target
+
+    cdef convert(self, datum):
+        return self.target.convert(datum)
+
+
+cdef class _LogicalConverter(_Converter):
+    cdef object prepare
+    cdef object schema
+    cdef _Converter inner
+
+    def __init__(self, prepare, schema, _Converter inner):
+        self.prepare = prepare
+        self.schema = schema
+        self.inner = inner
+
+    cdef convert(self, datum):
+        return self.inner.convert(self.prepare(datum, self.schema))
+
+
+cdef _Converter _compile(schema, dict named_schemas, dict compiled):
+    cdef _Converter converter
+    cdef _NamedConverter named_converter
+
+    record_type = extract_record_type(schema)
+
+    if record_type == "null":
+        converter = _Null()
+    elif record_type in ("boolean", "string", "int", "long", "float", "double"):
+        converter = _Identity()
+    elif record_type in ("bytes", "fixed"):
+        converter = _Latin1()
+    elif record_type == "enum":
+        converter = _EnumConverter(schema)
+    elif record_type == "array":
+        converter = _ArrayConverter(
+            _compile(schema["items"], named_schemas, compiled)
+        )
+    elif record_type == "map":
+        converter = _MapConverter(
+            _compile(schema["values"], named_schemas, compiled)
+        )
+    elif record_type in ("union", "error_union"):
+        names = []
+        labels = []
+        field_names = []
+        validators = []
+        converters = []
+        for candidate in schema:
+            candidate_type = extract_record_type(candidate)
+            if candidate_type == "record":
+                names.append(candidate["name"])
+                field_names.append(
+                    frozenset(f["name"] for f in candidate["fields"])
+                )
+            else:
+                names.append(candidate)
+                field_names.append(None)
+
+            if candidate_type == "null":
+                # A null value is not wrapped in an object
+                labels.append(None)
+            elif isinstance(candidate, dict):
+                labels.append(candidate.get("name", candidate.get("type")))
+            else:
+                labels.append(candidate)
+
+            validators.append(compile_validator(candidate, named_schemas))
+            converters.append(_compile(candidate, named_schemas, compiled))
+        converter = _UnionConverter(
+            schema, names, labels, field_names, validators, converters
+        )
+    elif record_type in ("record", "error"):
+        converter = _RecordConverter(
+            [f["name"] for f in schema["fields"]],
+            [_compile(f["type"], named_schemas, compiled) for f in schema["fields"]],
+            ["default" in f or "null" in f["type"] for f in schema["fields"]],
+            [f.get("default") for f in schema["fields"]],
+        )
+    elif record_type in compiled:
+        converter = compiled[record_type]
+    elif record_type in named_schemas:
+        named_converter = _NamedConverter()
+        compiled[record_type] = named_converter
+        named_converter.target = _compile(
+            named_schemas[record_type], named_schemas, compiled
+        )
+        converter = named_converter
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        prepare = LOGICAL_WRITERS.get(logical_type)
+        if prepare:
+            converter = _LogicalConverter(prepare, schema, converter)
+
+    return converter
+
+
+cdef class CompiledWriter:
+    cdef _Converter root
+
+    def __init__(self, schema, named_schemas):
+        self.root = _compile(schema, named_schemas, {})
+
+    def __call__(self, datum):
+        return self.root.convert(datum)
+
+
+cpdef compile_writer(schema, named_schemas):
+    return CompiledWriter(schema, named_schemas)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj).decode()
+
+
+cpdef writer(
+    fo, schema, records, chunksize=DEFAULT_CHUNKSIZE, bint use_orjson=False
+):
+    cdef CompiledWriter converter
+    cdef _Converter root
+    cdef list chunk
+
+    # Sanity check that records is not a single dictionary (as that is a common
+    # mistake and the exception that gets raised is not helpful)
+    if isinstance(records, dict):
+        raise ValueError('"records" argument should be an iterable, not dict')
+
+    if use_orjson:
+        if orjson is None:
+            raise ValueError(
+                "use_orjson is supported but you need to install orjson"
+            )
+        dumps = _orjson_dumps
+    else:
+        dumps = json.dumps
+
+    named_schemas = {}
+    parsed_schema = parse_schema(schema, _named_schemas=named_schemas)
+    converter = compile_writer(parsed_schema, named_schemas)
+    root = converter.root
+
+    records = iter(records)
+    separator = ""
+    while True:
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            break
+        fo.write(
+            separator
+            + "\n".join([dumps(root.convert(record)) for record in chunk])
+        )
+        separator = "\n"
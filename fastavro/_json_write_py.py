@@ -0,0 +1,262 @@
+"""Python code for writing Avro JSON files
+
+Records are converted to the objects that ``json.dumps`` serializes to Avro
+JSON by a converter that is compiled once for the schema, and written out a
+chunk of records at a time.
+"""
+
+from itertools import islice
+import json
+
+from .logical_writers import LOGICAL_WRITERS
+from .schema import extract_record_type, extract_logical_type, parse_schema
+from .validation import compile_validator
+from ._schema_common import UnknownType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of records serialized and written to the output at a time
+DEFAULT_CHUNKSIZE = 1000
+
+
+def _identity(datum):
+    return datum
+
+
+def _null(datum):
+    return None
+
+
+def _decode_latin1(datum):
+    return datum.decode("iso-8859-1")
+
+
+def _compile_enum(schema):
+    symbols = schema["symbols"]
+
+    def convert(datum):
+        return symbols[symbols.index(datum)]
+
+    return convert
+
+
+def _compile_array(schema, named_schemas, compiled):
+    items = _compile(schema["items"], named_schemas, compiled)
+    if items is _identity:
+        return list
+
+    def convert(datum):
+        return [items(item) for item in datum]
+
+    return convert
+
+
+def _compile_map(schema, named_schemas, compiled):
+    values = _compile(schema["values"], named_schemas, compiled)
+    if values is _identity:
+        return dict
+
+    def convert(datum):
+        return {key: values(value) for key, value in datum.items()}
+
+    return convert
+
+
+def _compile_record(schema, named_schemas, compiled):
+    fields = [
+        (
+            field["name"],
+            _compile(field["type"], named_schemas, compiled),
+            "default" in field or "null" in field["type"],
+            field.get("default"),
+        )
+        for field in schema["fields"]
+    ]
+
+    def convert(datum):
+        record = {}
+        for name, field_convert, optional, default in fields:
+            if name in datum:
+                value = datum[name]
+            elif optional:
+                value = default
+            else:
+                raise ValueError(f"no value and no default for {name}")
+            try:
+                record[name] = field_convert(value)
+            except TypeError as ex:
+                raise TypeError(f"{ex} on field {name}")
+        return record
+
+    return convert
+
+
+def _compile_union(schema, named_schemas, compiled):
+    branches = []
+    for candidate in schema:
+        record_type = extract_record_type(candidate)
+        if record_type == "record":
+            name = candidate["name"]
+            field_names = {f["name"] for f in candidate["fields"]}
+        else:
+            name = candidate
+            field_names = None
+
+        if record_type == "null":
+            # A null value is not wrapped in an object
+            label = None
+        elif isinstance(candidate, dict):
+            label = candidate.get("name", candidate.get("type"))
+        else:
+            label = candidate
+
+        branches.append(
+            (
+                name,
+                label,
+                field_names,
+                compile_validator(candidate, named_schemas),
+                _compile(candidate, named_schemas, compiled),
+            )
+        )
+
+    def convert(datum):
+        if isinstance(datum, tuple):
+            name, datum = datum
+            for branch in branches:
+                if branch[0] == name:
+                    break
+            else:
+                raise ValueError(
+                    f"provided union type name {name} not found in schema {schema}"
+                )
+        else:
+            branch = None
+            most_fields = -1
+            for candidate in branches:
+                if candidate[3](datum, raise_errors=False):
+                    field_names = candidate[2]
+                    if field_names is None:
+                        branch = candidate
+                        break
+                    fields = len(field_names.intersection(datum))
+                    if fields > most_fields:
+                        branch = candidate
+                        most_fields = fields
+            if branch is None:
+                raise ValueError(
+                    f"{repr(datum)} (type {type(datum)}) do not match {schema}"
+                )
+
+        label = branch[1]
+        if label is None:
+            return branch[4](datum)
+        return {label: branch[4](datum)}
+
+    return convert
+
+
+def _compile_named(name, named_schemas, compiled):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    target = []
+
+    def convert(datum):
+        return target[0](datum)
+
+    compiled[name] = convert
+    target.append(_compile(named_schemas[name], named_schemas, compiled))
+    return convert
+
+
+def _compile(schema, named_schemas, compiled):
+    record_type = extract_record_type(schema)
+
+    if record_type == "null":
+        convert = _null
+    elif record_type in ("boolean", "string", "int", "long", "float", "double"):
+        convert = _identity
+    elif record_type in ("bytes", "fixed"):
+        convert = _decode_latin1
+    elif record_type == "enum":
+        convert = _compile_enum(schema)
+    elif record_type == "array":
+        convert = _compile_array(schema, named_schemas, compiled)
+    elif record_type == "map":
+        convert = _compile_map(schema, named_schemas, compiled)
+    elif record_type in ("union", "error_union"):
+        convert = _compile_union(schema, named_schemas, compiled)
+    elif record_type in ("record", "error"):
+        convert = _compile_record(schema, named_schemas, compiled)
+    elif record_type in compiled:
+        convert = compiled[record_type]
+    elif record_type in named_schemas:
+        convert = _compile_named(record_type, named_schemas, compiled)
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        prepare = LOGICAL_WRITERS.get(logical_type)
+        if prepare:
+            inner = convert
+
+            def convert(datum):
+                return inner(prepare(datum, schema))
+
+    return convert
+
+
+def compile_writer(schema, named_schemas):
+    """Returns a function that converts a Python value for the parsed
+    ``schema`` to the object that is serialized as Avro JSON"""
+    return _compile(schema, named_schemas, {})
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj).decode()
+
+
+def writer(fo, schema, records, chunksize=DEFAULT_CHUNKSIZE, use_orjson=False):
+    """Write records to fo (stream) as newline separated Avro JSON
+
+    Parameters
+    ----------
+    fo: file-like
+        Output stream
+    schema: dict
+        Writer schema
+    records: iterable
+        Records to write
+    chunksize: int, optional
+        Number of records serialized and written to `fo` at a time
+    use_orjson: bool, optional
+        If true, records are serialized with `orjson` which must be installed
+    """
+    # Sanity check that records is not a single dictionary (as that is a common
+    # mistake and the exception that gets raised is not helpful)
+    if isinstance(records, dict):
+        raise ValueError('"records" argument should be an iterable, not dict')
+
+    if use_orjson:
+        if orjson is None:
+            raise ValueError("use_orjson is supported but you need to install orjson")
+        dumps = _orjson_dumps
+    else:
+        dumps = json.dumps
+
+    named_schemas = {}
+    parsed_schema = parse_schema(schema, _named_schemas=named_schemas)
+    convert = compile_writer(parsed_schema, named_schemas)
+
+    records = iter(records)
+    separator = ""
+    while True:
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            break
+        fo.write(separator + "\n".join([dumps(convert(record)) for record in chunk]))
+        separator = "\n"
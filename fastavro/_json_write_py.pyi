@@ -0,0 +1 @@
+_json_write.pyi
\ No newline at end of file
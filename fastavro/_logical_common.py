@@ -0,0 +1,125 @@
+from decimal import Context
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def decimal_context(precision):
+    """Returns a decimal context for the precision of a decimal schema
+
+    The contexts are cached and never modified so that decimals can be read
+    and written without changing a shared context for every value.
+    """
+    return Context(prec=precision)
+
+
+# Key of the function that converts the values of a logical type on the schema
+# nodes returned by resolve_logical_types
+LOGICAL_CONVERTER = "__fastavro_logical"
+
+
+def _strip(schema, logical_types, converters, memo):
+    """Returns the schema without the logical types that should not be
+    converted and with their converters, sharing the parts of the schema that
+    have nothing to strip or attach instead of copying them
+
+    ``memo`` maps the id() of the schemas already stripped to the result, as
+    the named schemas are also part of the schemas that define them"""
+    if isinstance(schema, list):
+        stripped = [_strip(s, logical_types, converters, memo) for s in schema]
+        if all(new is old for new, old in zip(stripped, schema)):
+            return schema
+        return stripped
+    elif not isinstance(schema, dict):
+        return schema
+    elif id(schema) in memo:
+        return memo[id(schema)]
+
+    stripped = {}
+    changed = False
+    for key, value in schema.items():
+        if key == "logicalType":
+            if logical_types is False or (
+                logical_types is not True and not logical_types.get(value, True)
+            ):
+                changed = True
+                continue
+        elif key == "fields":
+            fields = []
+            for field in value:
+                field_type = _strip(field["type"], logical_types, converters, memo)
+                if field_type is not field["type"]:
+                    field = dict(field, type=field_type)
+                    changed = True
+                fields.append(field)
+            value = fields
+        elif key in ("type", "items", "values"):
+            new_value = _strip(value, logical_types, converters, memo)
+            if new_value is not value:
+                value = new_value
+                changed = True
+        stripped[key] = value
+
+    if converters is not None and "logicalType" in stripped:
+        converter = None
+        if logical_types is not True:
+            converter = logical_types.get(stripped["logicalType"])
+        if not callable(converter):
+            converter = converters.get(f"{stripped['type']}-{stripped['logicalType']}")
+        stripped[LOGICAL_CONVERTER] = converter
+        changed = True
+    if not changed:
+        stripped = schema
+    memo[id(schema)] = stripped
+    return stripped
+
+
+def _strip_named(named_schemas, logical_types, converters, memo):
+    stripped = {
+        name: _strip(s, logical_types, converters, memo)
+        for name, s in named_schemas.items()
+    }
+    if all(stripped[name] is s for name, s in named_schemas.items()):
+        return named_schemas
+    return stripped
+
+
+def strip_logical_types(schema, named_schemas, logical_types):
+    """Returns a parsed schema and its named schemas without the logical types
+    that should not be converted
+
+    The parts of the schemas that do not change are shared with the input and
+    it is returned itself if nothing changes.
+
+    ``logical_types`` is True to convert every logical type, False to convert
+    none of them or a dictionary of logical type names (like
+    ``"timestamp-micros"``) to whether that logical type is converted. Logical
+    types that are not in the dictionary are converted.
+    """
+    if logical_types is True or schema is None:
+        return schema, named_schemas
+    memo = {}
+    return (
+        _strip(schema, logical_types, None, memo),
+        _strip_named(named_schemas, logical_types, None, memo),
+    )
+
+
+def resolve_logical_types(schema, named_schemas, logical_types, converters):
+    """Returns a parsed schema and its named schemas like
+    `strip_logical_types` where each schema with a logical type also has the
+    function from ``converters`` (like ``LOGICAL_READERS``) that converts its
+    values, or None, under the ``LOGICAL_CONVERTER`` key. A function given for
+    the logical type in ``logical_types`` is used instead of the one in
+    ``converters``.
+
+    The functions are looked up once here instead of for every value. The
+    returned schemas are for the readers and writers to encode and decode with
+    and should not be serialized or modified.
+    """
+    if schema is None:
+        return schema, named_schemas
+    memo = {}
+    return (
+        _strip(schema, logical_types, converters, memo),
+        _strip_named(named_schemas, logical_types, converters, memo),
+    )
@@ -2,10 +2,10 @@
 
 import datetime
 import decimal
-from io import BytesIO
 import os
 import time
 import uuid
+from ._logical_common import decimal_context
 from .const import (
     MCS_PER_HOUR,
     MCS_PER_MINUTE,
@@ -98,17 +98,8 @@ def prepare_bytes_decimal(data, schema):
     if delta < 0:
         raise ValueError("Scale provided in schema does not match the decimal")
 
-    unscaled_datum = 0
-    for digit in digits:
-        unscaled_datum = (unscaled_datum * 10) + digit
-
-    unscaled_datum = 10 ** delta * unscaled_datum
-
-    bytes_req = (unscaled_datum.bit_length() + 8) // 8
-
-    if sign:
-        unscaled_datum = -unscaled_datum
-
+    unscaled_datum = int(data.scaleb(scale, decimal_context(precision)))
+    bytes_req = (abs(unscaled_datum).bit_length() + 8) // 8
     return unscaled_datum.to_bytes(bytes_req, byteorder="big", signed=True)
 
 
@@ -120,8 +111,6 @@ def prepare_fixed_decimal(data, schema):
     size = schema["size"]
     precision = schema["precision"]
 
-    # based on https://github.com/apache/avro/pull/82/
-
     sign, digits, exp = data.as_tuple()
 
     if len(digits) > precision:
@@ -130,48 +119,11 @@ def prepare_fixed_decimal(data, schema):
     if -exp > scale:
         raise ValueError("Scale provided in schema does not match the decimal")
 
-    delta = exp + scale
-    if delta > 0:
-        digits = digits + (0,) * delta
-
-    unscaled_datum = 0
-    for digit in digits:
-        unscaled_datum = (unscaled_datum * 10) + digit
-
-    bits_req = unscaled_datum.bit_length() + 1
-
-    size_in_bits = size * 8
-    offset_bits = size_in_bits - bits_req
-
-    mask = 2 ** size_in_bits - 1
-    bit = 1
-    for i in range(bits_req):
-        mask ^= bit
-        bit <<= 1
-
-    if bits_req < 8:
-        bytes_req = 1
-    else:
-        bytes_req = bits_req // 8
-        if bits_req % 8 != 0:
-            bytes_req += 1
-
-    tmp = BytesIO()
-
-    if sign:
-        unscaled_datum = (1 << bits_req) - unscaled_datum
-        unscaled_datum = mask | unscaled_datum
-        for index in range(size - 1, -1, -1):
-            bits_to_write = unscaled_datum >> (8 * index)
-            tmp.write(bytes([bits_to_write & 0xFF]))
-    else:
-        for i in range(offset_bits // 8):
-            tmp.write(bytes([0]))
-        for index in range(bytes_req - 1, -1, -1):
-            bits_to_write = unscaled_datum >> (8 * index)
-            tmp.write(bytes([bits_to_write & 0xFF]))
-
-    return tmp.getvalue()
+    unscaled_datum = int(data.scaleb(scale, decimal_context(precision)))
+    try:
+        return unscaled_datum.to_bytes(size, byteorder="big", signed=True)
+    except OverflowError:
+        raise ValueError(f"The decimal does not fit in a fixed of size {size}")
 
 
 def prepare_uuid(data, schema):
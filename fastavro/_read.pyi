@@ -10,7 +10,11 @@ class reader:
     reader_schema: Optional[Dict]
     writer_schema: Optional[Dict]
     def __init__(
-        self, fo: IO, reader_schema: Optional[Dict], return_record_name: bool
+        self,
+        fo: IO,
+        reader_schema: Optional[Dict],
+        return_record_name: bool,
+        logical_types: Union[bool, Dict[str, Union[bool, Callable]]] = ...,
     ): ...
     def __iter__(self) -> Iterator[AvroMessage]: ...
     def next(self) -> AvroMessage: ...
@@ -24,7 +28,11 @@ class block_reader:
     reader_schema: Optional[Dict]
     writer_schema: Optional[Dict]
     def __init__(
-        self, fo: IO, reader_schema: Optional[Dict], return_record_name: bool
+        self,
+        fo: IO,
+        reader_schema: Optional[Dict],
+        return_record_name: bool,
+        logical_types: Union[bool, Dict[str, Union[bool, Callable]]] = ...,
     ): ...
     def __iter__(self) -> Iterator[Block]: ...
     def next(self) -> Block: ...
@@ -52,13 +60,23 @@ class Block:
 
 def json_reader(fo: IO, schema: Dict) -> reader: ...
 def schemaless_reader(
-    fo: IO, writer_schema: Dict, reader_schema: Optional[Dict], return_record_name: bool
+    fo: IO,
+    writer_schema: Dict,
+    reader_schema: Optional[Dict],
+    return_record_name: bool,
+    logical_types: Union[bool, Dict[str, Union[bool, Callable]]] = ...,
 ) -> AvroMessage: ...
 def is_avro(path_or_buffer: Union[str, IO]) -> bool: ...
 
 logical_reader = Callable[[Any, Optional[Dict], Optional[Dict]], Any]
 LOGICAL_READERS: Dict[str, logical_reader]
 
+def read_unscaled_decimal(
+    data: bytes,
+    writer_schema: Optional[Dict] = ...,
+    reader_schema: Optional[Dict] = ...,
+) -> int: ...
+
 class SchemaResolutionError(Exception): ...
 
 BLOCK_READERS: Dict[str, Callable]
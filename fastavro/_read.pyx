@@ -7,19 +7,28 @@
 # http://svn.apache.org/viewvc/avro/trunk/lang/py/src/avro/ which is under
 # Apache 2.0 license (http://www.apache.org/licenses/LICENSE-2.0)
 
+from cpython.datetime cimport date_new, datetime_new, import_datetime
 import bz2
 import lzma
 import zlib
 from datetime import datetime, time, date, timezone, timedelta
-from decimal import Context
 from io import BytesIO
 from uuid import UUID
 
-import json
-
+from ._logical_common import (
+    LOGICAL_CONVERTER,
+    decimal_context,
+    resolve_logical_types,
+)
 from ._schema import extract_record_type, extract_logical_type, parse_schema
 from ._read_common import (
-    SchemaResolutionError, MAGIC, SYNC_SIZE, HEADER_SCHEMA, missing_codec_lib
+    SchemaResolutionError,
+    MAGIC,
+    SYNC_SIZE,
+    HEADER_SCHEMA,
+    missing_codec_lib,
+    parse_writer_schema,
+    resolve_writer_schema,
 )
 from .const import (
     MCS_PER_HOUR,
@@ -54,7 +63,6 @@ AVRO_TYPES = {
     "error_union"
 }
 
-decimal_context = Context()
 epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 ctypedef int int32
@@ -62,6 +70,21 @@ ctypedef unsigned int uint32
 ctypedef unsigned long long ulong64
 ctypedef long long long64
 
+import_datetime()
+
+cdef long64 CMCS_PER_SECOND = MCS_PER_SECOND
+cdef long64 CMCS_PER_MINUTE = MCS_PER_MINUTE
+cdef long64 CMCS_PER_HOUR = MCS_PER_HOUR
+cdef long64 CMCS_PER_DAY = MCS_PER_HOUR * 24
+cdef long64 CDAYS_SHIFT = DAYS_SHIFT
+
+# Days from the epoch that datetime and date can represent (0001-01-01 to
+# 9999-12-31)
+cdef long64 MIN_EPOCH_DAYS = 1 - DAYS_SHIFT
+cdef long64 MAX_EPOCH_DAYS = date(9999, 12, 31).toordinal() - DAYS_SHIFT
+cdef long64 MIN_TIMESTAMP_MICROS = MIN_EPOCH_DAYS * MCS_PER_HOUR * 24
+cdef long64 MAX_TIMESTAMP_MICROS = (MAX_EPOCH_DAYS + 1) * MCS_PER_HOUR * 24 - 1
+
 
 class ReadError(Exception):
     pass
@@ -92,7 +115,6 @@ cpdef match_types(writer_type, reader_type):
 
 
 cpdef match_schemas(w_schema, r_schema):
-    error_msg = f"Schema mismatch: {w_schema} is not {r_schema}"
     if isinstance(w_schema, list):
         # If the writer is a union, checks will happen in read_union after the
         # correct schema is known
@@ -104,7 +126,9 @@ cpdef match_schemas(w_schema, r_schema):
             if match_types(w_schema, schema):
                 return schema
         else:
-            raise SchemaResolutionError(error_msg)
+            raise SchemaResolutionError(
+                f"Schema mismatch: {w_schema} is not {r_schema}"
+            )
     else:
         # Check for dicts as primitive types are just strings
         if isinstance(w_schema, dict):
@@ -124,7 +148,9 @@ cpdef match_schemas(w_schema, r_schema):
                 return r_schema
         elif match_types(w_type, r_type):
             return r_schema
-        raise SchemaResolutionError(error_msg)
+        raise SchemaResolutionError(
+            f"Schema mismatch: {w_schema} is not {r_schema}"
+        )
 
 
 cpdef inline read_null(fo):
@@ -159,17 +185,59 @@ cpdef inline skip_boolean(fo):
     fo.read(1)
 
 
+cdef inline void civil_from_days(
+    long64 days, int32* year, int32* month, int32* day
+):
+    # Converts days since the epoch to a proleptic Gregorian date without
+    # going through Python objects. See
+    # http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    cdef long64 z = days + 719468
+    cdef long64 era = z // 146097
+    cdef long64 doe = z - era * 146097
+    cdef long64 yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    cdef long64 doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    cdef long64 mp = (5 * doy + 2) // 153
+    day[0] = <int32>(doy - (153 * mp + 2) // 5 + 1)
+    month[0] = <int32>(mp + 3 if mp < 10 else mp - 9)
+    year[0] = <int32>(yoe + era * 400 + (1 if month[0] <= 2 else 0))
+
+
+cdef inline timestamp_from_micros(long64 micros):
+    cdef int32 year, month, day
+    cdef long64 days = micros // CMCS_PER_DAY
+    cdef long64 mcs = micros - days * CMCS_PER_DAY
+    civil_from_days(days, &year, &month, &day)
+    return datetime_new(
+        year,
+        month,
+        day,
+        <int32>(mcs // CMCS_PER_HOUR),
+        <int32>(mcs // CMCS_PER_MINUTE % 60),
+        <int32>(mcs // CMCS_PER_SECOND % 60),
+        <int32>(mcs % CMCS_PER_SECOND),
+        timezone.utc,
+    )
+
+
 cpdef read_timestamp_millis(data, writer_schema=None, reader_schema=None):
+    if MIN_TIMESTAMP_MICROS // 1000 <= data <= MAX_TIMESTAMP_MICROS // 1000:
+        return timestamp_from_micros(<long64>data * 1000)
     # Cannot use datetime.fromtimestamp: https://bugs.python.org/issue36439
     return epoch + timedelta(microseconds=data * 1000)
 
 
 cpdef read_timestamp_micros(data, writer_schema=None, reader_schema=None):
+    if MIN_TIMESTAMP_MICROS <= data <= MAX_TIMESTAMP_MICROS:
+        return timestamp_from_micros(data)
     # Cannot use datetime.fromtimestamp: https://bugs.python.org/issue36439
     return epoch + timedelta(microseconds=data)
 
 
 cpdef read_date(data, writer_schema=None, reader_schema=None):
+    cdef int32 year, month, day
+    if MIN_EPOCH_DAYS <= data <= MAX_EPOCH_DAYS:
+        civil_from_days(data, &year, &month, &day)
+        return date_new(year, month, day)
     return date.fromordinal(data + DAYS_SHIFT)
 
 
@@ -195,13 +263,19 @@ cpdef read_time_micros(data, writer_schema=None, reader_schema=None):
 
 cpdef read_decimal(data, writer_schema=None, reader_schema=None):
     scale = writer_schema.get("scale", 0)
-    precision = writer_schema["precision"]
+    context = decimal_context(writer_schema["precision"])
 
     unscaled_datum = int.from_bytes(data, byteorder="big", signed=True)
+    return context.create_decimal(unscaled_datum).scaleb(-scale, context)
 
-    decimal_context.prec = precision
-    return decimal_context.create_decimal(unscaled_datum).\
-        scaleb(-scale, decimal_context)
+
+cpdef read_unscaled_decimal(data, writer_schema=None, reader_schema=None):
+    """Reads a decimal as its unscaled integer value, the value multiplied by
+    10 ** scale, which is much faster than creating a decimal.Decimal
+
+    Use it for a reader with ``logical_types={"decimal": read_unscaled_decimal}``
+    """
+    return int.from_bytes(data, byteorder="big", signed=True)
 
 
 cpdef long64 read_long(fo) except? -1:
@@ -809,8 +883,10 @@ cpdef _read_data(
         raise EOFError(f"cannot read {record_type} from {fo}")
 
     if "logicalType" in writer_schema:
-        logical_type = extract_logical_type(writer_schema)
-        fn = LOGICAL_READERS.get(logical_type)
+        if LOGICAL_CONVERTER in writer_schema:
+            fn = writer_schema[LOGICAL_CONVERTER]
+        else:
+            fn = LOGICAL_READERS.get(extract_logical_type(writer_schema))
         if fn:
             return fn(data, writer_schema, reader_schema)
 
@@ -1050,13 +1126,44 @@ class Block:
         )
 
 
+cpdef dict read_file_header(fo):
+    """Reads the header of an avro file
+
+    This is equivalent to reading HEADER_SCHEMA with _read_data but avoids the
+    generic schema dispatch.
+    """
+    cdef dict meta = {}
+    cdef long64 block_count
+    cdef long64 i
+    cdef unicode key
+
+    magic = fo.read(len(MAGIC))
+
+    block_count = read_long(fo)
+    while block_count != 0:
+        if block_count < 0:
+            block_count = -block_count
+            # Read block size, unused
+            read_long(fo)
+
+        for i in range(block_count):
+            key = read_utf8(fo)
+            meta[key] = read_bytes(fo)
+
+        block_count = read_long(fo)
+
+    sync = fo.read(SYNC_SIZE)
+    return {"magic": magic, "meta": meta, "sync": sync}
+
+
 class file_reader:
-    def __init__(self, fo, reader_schema=None, return_record_name=False):
+    def __init__(self, fo, reader_schema=None, return_record_name=False,
+                 logical_types=True):
         self.fo = fo
         self.return_record_name = return_record_name
+        self._logical_types = logical_types
         try:
-            self._header = _read_data(self.fo, HEADER_SCHEMA, {}, None,
-                                      return_record_name)
+            self._header = read_file_header(self.fo)
         except StopIteration:
             raise ValueError("cannot read header - is it an avro file?")
 
@@ -1064,8 +1171,6 @@ class file_reader:
         self.metadata = {
             k: v.decode() for k, v in self._header["meta"].items()
         }
-
-        self._schema = json.loads(self.metadata["avro.schema"])
         self.codec = self.metadata.get("avro.codec", "null")
 
         self._named_schemas = {}
@@ -1078,12 +1183,10 @@ class file_reader:
         else:
             self.reader_schema = None
 
-        self.writer_schema = parse_schema(
-            self._schema,
-            _write_hint=False,
-            _force=True,
-            _named_schemas=self._named_schemas,
+        self._schema, self.writer_schema, named_schemas = parse_writer_schema(
+            self._header["meta"]["avro.schema"]
         )
+        self._named_schemas.update(named_schemas)
 
         self._elems = None
 
@@ -1096,6 +1199,29 @@ class file_reader:
         )
         return self._schema
 
+    def _decode_schemas(self):
+        # The schemas the records are decoded with, without the logical types
+        # that should not be converted and with the functions that convert the
+        # others. The writer schema is resolved once for all the files with the
+        # same schema
+        writer_schema, named_schemas = resolve_writer_schema(
+            self._header["meta"]["avro.schema"],
+            self._logical_types,
+            LOGICAL_READERS,
+        )
+        if self.reader_schema is None:
+            return writer_schema, named_schemas, None
+
+        # The reader schema gets the same functions so that the parts of it
+        # that are the same as the writer schema still compare equal
+        reader_schema, named_schemas = resolve_logical_types(
+            self.reader_schema,
+            self._named_schemas,
+            self._logical_types,
+            LOGICAL_READERS,
+        )
+        return writer_schema, named_schemas, reader_schema
+
     def __iter__(self):
         if not self._elems:
             raise NotImplementedError
@@ -1108,33 +1234,41 @@ class file_reader:
 
 
 class reader(file_reader):
-    def __init__(self, fo, reader_schema=None, return_record_name=False):
-        file_reader.__init__(self, fo, reader_schema, return_record_name)
+    def __init__(self, fo, reader_schema=None, return_record_name=False,
+                 logical_types=True):
+        file_reader.__init__(
+            self, fo, reader_schema, return_record_name, logical_types
+        )
+        writer_schema, named_schemas, reader_schema = self._decode_schemas()
 
         self._elems = _iter_avro_records(self.fo,
                                          self._header,
                                          self.codec,
-                                         self.writer_schema,
-                                         self._named_schemas,
-                                         self.reader_schema,
+                                         writer_schema,
+                                         named_schemas,
+                                         reader_schema,
                                          self.return_record_name)
 
 
 class block_reader(file_reader):
-    def __init__(self, fo, reader_schema=None, return_record_name=False):
-        file_reader.__init__(self, fo, reader_schema, return_record_name)
+    def __init__(self, fo, reader_schema=None, return_record_name=False,
+                 logical_types=True):
+        file_reader.__init__(
+            self, fo, reader_schema, return_record_name, logical_types
+        )
+        writer_schema, named_schemas, reader_schema = self._decode_schemas()
 
         self._elems = _iter_avro_blocks(self.fo,
                                         self._header,
                                         self.codec,
-                                        self.writer_schema,
-                                        self._named_schemas,
-                                        self.reader_schema,
+                                        writer_schema,
+                                        named_schemas,
+                                        reader_schema,
                                         self.return_record_name)
 
 
 cpdef schemaless_reader(fo, writer_schema, reader_schema=None,
-                        return_record_name=False):
+                        return_record_name=False, logical_types=True):
     if writer_schema == reader_schema:
         # No need for the reader schema if they are the same
         reader_schema = None
@@ -1145,6 +1279,14 @@ cpdef schemaless_reader(fo, writer_schema, reader_schema=None,
     if reader_schema:
         reader_schema = parse_schema(reader_schema)
 
+    if logical_types is not True:
+        writer_schema, named_schemas = resolve_logical_types(
+            writer_schema, named_schemas, logical_types, LOGICAL_READERS
+        )
+        reader_schema, _ = resolve_logical_types(
+            reader_schema, {}, logical_types, LOGICAL_READERS
+        )
+
     return _read_data(
         fo,
         writer_schema,
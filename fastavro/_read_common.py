@@ -1,3 +1,9 @@
+import json
+
+from ._logical_common import resolve_logical_types
+from ._schema_common import LRUCache
+from .schema import parse_schema
+
 VERSION = 1
 MAGIC = b"Obj" + chr(VERSION).encode()
 SYNC_SIZE = 16
@@ -26,3 +32,56 @@ def missing_codec_lib(codec, library):
         )
 
     return missing
+
+
+# Writer schemas of previously opened files keyed by the raw avro.schema
+# metadata value. Files written by the same producer share the exact same
+# schema bytes, so only the first of them needs to decode and parse it. Each
+# entry also holds the schemas resolved by resolve_writer_schema.
+_writer_schemas = LRUCache(maxsize=256)
+
+
+def parse_writer_schema(raw_schema):
+    """Returns a tuple of the decoded writer schema, the parsed writer schema
+    and its named schemas for the raw avro.schema metadata value
+
+    Like the results of ``parse_schema(..., _force=True)``, they are shared
+    with the other readers of the same schema and must not be modified."""
+    return _writer_schema_entry(raw_schema)[:3]
+
+
+def _writer_schema_entry(raw_schema):
+    cached = _writer_schemas.get(raw_schema)
+    if cached is None:
+        schema = json.loads(raw_schema)
+        named_schemas = {}
+        parsed_schema = parse_schema(
+            schema, _write_hint=False, _force=True, _named_schemas=named_schemas
+        )
+        cached = (schema, parsed_schema, named_schemas, {})
+        _writer_schemas.set(raw_schema, cached)
+    return cached
+
+
+def resolve_writer_schema(raw_schema, logical_types, converters):
+    """Returns the parsed writer schema and its named schemas for the raw
+    avro.schema metadata value resolved with `resolve_logical_types`
+
+    The result is cached for each ``logical_types`` setting until the
+    ``converters`` change, and is shared like the result of
+    `parse_writer_schema`."""
+    _, parsed_schema, named_schemas, resolved = _writer_schema_entry(raw_schema)
+    if isinstance(logical_types, dict):
+        key = frozenset(logical_types.items())
+    else:
+        key = logical_types
+    cached = resolved.get(key)
+    if cached is None or cached[0] != converters:
+        schema, named_schemas = resolve_logical_types(
+            parsed_schema, named_schemas, logical_types, converters
+        )
+        # The converters are copied so that registering a logical type later
+        # resolves the schema again
+        cached = (dict(converters), schema, named_schemas)
+        resolved[key] = cached
+    return cached[1], cached[2]
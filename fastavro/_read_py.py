@@ -12,20 +12,23 @@ import bz2
 import lzma
 import zlib
 from datetime import datetime, time, date, timezone, timedelta
-from decimal import Context
 from uuid import UUID
 
-import json
-
 from .io.binary_decoder import BinaryDecoder
 from .io.json_decoder import AvroJSONDecoder
 from .schema import extract_record_type, extract_logical_type, parse_schema
+from ._logical_common import (
+    LOGICAL_CONVERTER,
+    decimal_context,
+    resolve_logical_types,
+)
 from ._read_common import (
     SchemaResolutionError,
     MAGIC,
     SYNC_SIZE,
-    HEADER_SCHEMA,
     missing_codec_lib,
+    parse_writer_schema,
+    resolve_writer_schema,
 )
 from .const import (
     MCS_PER_HOUR,
@@ -58,7 +61,6 @@ AVRO_TYPES = {
     "error_union",
 }
 
-decimal_context = Context()
 epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
@@ -87,7 +89,6 @@ def match_types(writer_type, reader_type):
 
 
 def match_schemas(w_schema, r_schema):
-    error_msg = f"Schema mismatch: {w_schema} is not {r_schema}"
     if isinstance(w_schema, list):
         # If the writer is a union, checks will happen in read_union after the
         # correct schema is known
@@ -99,7 +100,9 @@ def match_schemas(w_schema, r_schema):
             if match_types(w_schema, schema):
                 return schema
         else:
-            raise SchemaResolutionError(error_msg)
+            raise SchemaResolutionError(
+                f"Schema mismatch: {w_schema} is not {r_schema}"
+            )
     else:
         # Check for dicts as primitive types are just strings
         if isinstance(w_schema, dict):
@@ -119,7 +122,7 @@ def match_schemas(w_schema, r_schema):
                 return r_schema
         elif match_types(w_type, r_type):
             return r_schema
-        raise SchemaResolutionError(error_msg)
+        raise SchemaResolutionError(f"Schema mismatch: {w_schema} is not {r_schema}")
 
 
 def read_null(
@@ -186,14 +189,19 @@ def read_time_micros(data, writer_schema=None, reader_schema=None):
 
 def read_decimal(data, writer_schema=None, reader_schema=None):
     scale = writer_schema.get("scale", 0)
-    precision = writer_schema["precision"]
+    context = decimal_context(writer_schema["precision"])
 
     unscaled_datum = int.from_bytes(data, byteorder="big", signed=True)
+    return context.create_decimal(unscaled_datum).scaleb(-scale, context)
 
-    decimal_context.prec = precision
-    return decimal_context.create_decimal(unscaled_datum).scaleb(
-        -scale, decimal_context
-    )
+
+def read_unscaled_decimal(data, writer_schema=None, reader_schema=None):
+    """Reads a decimal as its unscaled integer value, the value multiplied by
+    10 ** scale, which is much faster than creating a decimal.Decimal
+
+    Use it for a reader with ``logical_types={"decimal": read_unscaled_decimal}``
+    """
+    return int.from_bytes(data, byteorder="big", signed=True)
 
 
 def read_int(
@@ -655,8 +663,10 @@ def read_data(
             raise EOFError(f"cannot read {record_type} from {decoder.fo}")
 
         if "logicalType" in writer_schema:
-            logical_type = extract_logical_type(writer_schema)
-            fn = LOGICAL_READERS.get(logical_type)
+            if LOGICAL_CONVERTER in writer_schema:
+                fn = writer_schema[LOGICAL_CONVERTER]
+            else:
+                fn = LOGICAL_READERS.get(extract_logical_type(writer_schema))
             if fn:
                 return fn(data, writer_schema, reader_schema)
 
@@ -909,8 +919,33 @@ class Block:
         )
 
 
+def read_file_header(decoder):
+    """Reads the header of an avro file
+
+    This is equivalent to reading HEADER_SCHEMA with read_data but avoids the
+    generic schema dispatch.
+    """
+    magic = decoder.read_fixed(len(MAGIC))
+
+    meta = {}
+    decoder.read_map_start()
+    for item in decoder.iter_map():
+        key = decoder.read_utf8()
+        meta[key] = decoder.read_bytes()
+    decoder.read_map_end()
+
+    sync = decoder.read_fixed(SYNC_SIZE)
+    return {"magic": magic, "meta": meta, "sync": sync}
+
+
 class file_reader:
-    def __init__(self, fo_or_decoder, reader_schema=None, return_record_name=False):
+    def __init__(
+        self,
+        fo_or_decoder,
+        reader_schema=None,
+        return_record_name=False,
+        logical_types=True,
+    ):
         if isinstance(fo_or_decoder, AvroJSONDecoder):
             self.decoder = fo_or_decoder
         else:
@@ -927,34 +962,27 @@ class file_reader:
         else:
             self.reader_schema = None
         self.return_record_name = return_record_name
+        self._logical_types = logical_types
+        self._raw_writer_schema = None
         self._elems = None
 
     def _read_header(self):
         try:
-            self._header = read_data(
-                self.decoder,
-                HEADER_SCHEMA,
-                self._named_schemas,
-                None,
-                self.return_record_name,
-            )
+            self._header = read_file_header(self.decoder)
         except StopIteration:
             raise ValueError("cannot read header - is it an avro file?")
 
         # `meta` values are bytes. So, the actual decoding has to be external.
         self.metadata = {k: v.decode() for k, v in self._header["meta"].items()}
-
-        self._schema = json.loads(self.metadata["avro.schema"])
         self.codec = self.metadata.get("avro.codec", "null")
 
         # Always parse the writer schema since it might have named types that
         # need to be stored in self._named_types
-        self.writer_schema = parse_schema(
-            self._schema,
-            _write_hint=False,
-            _force=True,
-            _named_schemas=self._named_schemas,
+        self._raw_writer_schema = self._header["meta"]["avro.schema"]
+        self._schema, self.writer_schema, named_schemas = parse_writer_schema(
+            self._raw_writer_schema
         )
+        self._named_schemas.update(named_schemas)
 
     @property
     def schema(self):
@@ -966,6 +994,35 @@ class file_reader:
         )
         return self._schema
 
+    def _decode_schemas(self):
+        # The schemas the records are decoded with, without the logical types
+        # that should not be converted and with the functions that convert the
+        # others. The writer schema is resolved once for all the files with the
+        # same schema
+        if self._raw_writer_schema is None:
+            writer_schema, named_schemas = resolve_logical_types(
+                self.writer_schema,
+                self._named_schemas,
+                self._logical_types,
+                LOGICAL_READERS,
+            )
+        else:
+            writer_schema, named_schemas = resolve_writer_schema(
+                self._raw_writer_schema, self._logical_types, LOGICAL_READERS
+            )
+        if self.reader_schema is None:
+            return writer_schema, named_schemas, None
+
+        # The reader schema gets the same functions so that the parts of it
+        # that are the same as the writer schema still compare equal
+        reader_schema, named_schemas = resolve_logical_types(
+            self.reader_schema,
+            self._named_schemas,
+            self._logical_types,
+            LOGICAL_READERS,
+        )
+        return writer_schema, named_schemas, reader_schema
+
     def __iter__(self):
         if not self._elems:
             raise NotImplementedError
@@ -990,6 +1047,14 @@ class reader(file_reader):
         If true, when reading a union of records, the result will be a tuple
         where the first value is the name of the record and the second value is
         the record itself
+    logical_types: bool or dict, optional
+        If false, values of logical types are returned as their underlying
+        Avro type (for example a timestamp-micros as an int) instead of being
+        converted. A dictionary of logical type names to bools, like
+        ``{"timestamp-micros": False}``, turns off the conversion of
+        individual logical types. A function instead of a bool converts the
+        values of that logical type instead of the default reader, for
+        example ``{"decimal": fastavro.read.read_unscaled_decimal}``
 
 
     Example::
@@ -1022,29 +1087,33 @@ class reader(file_reader):
 
     .. attribute:: writer_schema
 
-        The schema used when writing
+        The schema used when writing. It is shared with the other readers
+        of files with the same schema and must not be modified
 
     .. attribute:: reader_schema
 
         The schema used when reading (if provided)
     """
 
-    def __init__(self, fo, reader_schema=None, return_record_name=False):
-        file_reader.__init__(self, fo, reader_schema, return_record_name)
+    def __init__(
+        self, fo, reader_schema=None, return_record_name=False, logical_types=True
+    ):
+        file_reader.__init__(self, fo, reader_schema, return_record_name, logical_types)
 
         if isinstance(self.decoder, AvroJSONDecoder):
             self.decoder.configure(self.reader_schema, self._named_schemas)
 
             self.writer_schema = self.reader_schema
             self.reader_schema = None
+            writer_schema, named_schemas, _ = self._decode_schemas()
 
             def _elems():
                 while not self.decoder.done:
                     yield read_data(
                         self.decoder,
-                        self.writer_schema,
-                        self._named_schemas,
-                        self.reader_schema,
+                        writer_schema,
+                        named_schemas,
+                        None,
                         self.return_record_name,
                     )
                     self.decoder.drain()
@@ -1053,14 +1122,15 @@ class reader(file_reader):
 
         else:
             self._read_header()
+            writer_schema, named_schemas, reader_schema = self._decode_schemas()
 
             self._elems = _iter_avro_records(
                 self.decoder,
                 self._header,
                 self.codec,
-                self.writer_schema,
-                self._named_schemas,
-                self.reader_schema,
+                writer_schema,
+                named_schemas,
+                reader_schema,
                 self.return_record_name,
             )
 
@@ -1078,6 +1148,14 @@ class block_reader(file_reader):
         If true, when reading a union of records, the result will be a tuple
         where the first value is the name of the record and the second value is
         the record itself
+    logical_types: bool or dict, optional
+        If false, values of logical types are returned as their underlying
+        Avro type (for example a timestamp-micros as an int) instead of being
+        converted. A dictionary of logical type names to bools, like
+        ``{"timestamp-micros": False}``, turns off the conversion of
+        individual logical types. A function instead of a bool converts the
+        values of that logical type instead of the default reader, for
+        example ``{"decimal": fastavro.read.read_unscaled_decimal}``
 
 
     Example::
@@ -1098,30 +1176,36 @@ class block_reader(file_reader):
 
     .. attribute:: writer_schema
 
-        The schema used when writing
+        The schema used when writing. It is shared with the other readers
+        of files with the same schema and must not be modified
 
     .. attribute:: reader_schema
 
         The schema used when reading (if provided)
     """
 
-    def __init__(self, fo, reader_schema=None, return_record_name=False):
-        file_reader.__init__(self, fo, reader_schema, return_record_name)
+    def __init__(
+        self, fo, reader_schema=None, return_record_name=False, logical_types=True
+    ):
+        file_reader.__init__(self, fo, reader_schema, return_record_name, logical_types)
 
         self._read_header()
+        writer_schema, named_schemas, reader_schema = self._decode_schemas()
 
         self._elems = _iter_avro_blocks(
             self.decoder,
             self._header,
             self.codec,
-            self.writer_schema,
-            self._named_schemas,
-            self.reader_schema,
+            writer_schema,
+            named_schemas,
+            reader_schema,
             self.return_record_name,
         )
 
 
-def schemaless_reader(fo, writer_schema, reader_schema=None, return_record_name=False):
+def schemaless_reader(
+    fo, writer_schema, reader_schema=None, return_record_name=False, logical_types=True
+):
     """Reads a single record writen using the
     :meth:`~fastavro._write_py.schemaless_writer`
 
@@ -1138,6 +1222,14 @@ def schemaless_reader(fo, writer_schema, reader_schema=None, return_record_name=
         If true, when reading a union of records, the result will be a tuple
         where the first value is the name of the record and the second value is
         the record itself
+    logical_types: bool or dict, optional
+        If false, values of logical types are returned as their underlying
+        Avro type (for example a timestamp-micros as an int) instead of being
+        converted. A dictionary of logical type names to bools, like
+        ``{"timestamp-micros": False}``, turns off the conversion of
+        individual logical types. A function instead of a bool converts the
+        values of that logical type instead of the default reader, for
+        example ``{"decimal": fastavro.read.read_unscaled_decimal}``
 
 
     Example::
@@ -1158,6 +1250,14 @@ def schemaless_reader(fo, writer_schema, reader_schema=None, return_record_name=
     if reader_schema:
         reader_schema = parse_schema(reader_schema)
 
+    if logical_types is not True:
+        writer_schema, named_schemas = resolve_logical_types(
+            writer_schema, named_schemas, logical_types, LOGICAL_READERS
+        )
+        reader_schema, _ = resolve_logical_types(
+            reader_schema, {}, logical_types, LOGICAL_READERS
+        )
+
     decoder = BinaryDecoder(fo)
 
     return read_data(
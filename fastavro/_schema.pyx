@@ -1,9 +1,10 @@
 # cython: language_level=3
 # cython: auto_cpdef=True
 
+from functools import lru_cache
 import hashlib
 from io import StringIO
-from os import path
+from os import path, stat
 from copy import deepcopy
 import json
 from libc.math cimport floor, log10
@@ -18,9 +19,39 @@ from ._schema_common import (
     JAVA_FINGERPRINT_MAPPING,
     FINGERPRINT_ALGORITHMS,
     RABIN_64,
-    rabin_fingerprint,
+    RABIN_64_EMPTY,
+    RABIN_64_TABLE,
+    LRUCache,
 )
 
+ctypedef unsigned long long ulong64
+
+cdef ulong64 RABIN_TABLE[256]
+
+# Canonical forms of the shared results of _parsed_schemas and _loaded_schemas.
+# Those schemas must not be modified, so their canonical form only needs to be
+# computed once; any other schema could be changed by its owner, so its
+# canonical form is never cached. Entries are keyed by id() and keep a
+# reference to the schema so that the id cannot be reused while the entry is
+# cached. The canonical form is None until it is first asked for.
+_canonical_forms = LRUCache(maxsize=256)
+
+# Results of parse_schema(..., _force=True) keyed by the JSON of the input
+# schema, and results of load_schema keyed by the path of the schema file. The
+# entries are returned to every caller as they are, so they must not be
+# modified
+_parsed_schemas = LRUCache(maxsize=256)
+_loaded_schemas = LRUCache(maxsize=256)
+
+
+cdef _init_rabin_table():
+    cdef int i
+    for i in range(256):
+        RABIN_TABLE[i] = RABIN_64_TABLE[i]
+
+
+_init_rabin_table()
+
 
 cpdef inline extract_record_type(schema):
     if isinstance(schema, dict):
@@ -38,7 +69,6 @@ cpdef inline str extract_logical_type(schema):
     rt = schema["type"]
     lt = schema.get("logicalType")
     if lt:
-        # TODO: Building this string every time is going to be relatively slow.
         return f"{rt}-{lt}"
     return None
 
@@ -74,6 +104,8 @@ def parse_schema(
     if _named_schemas is None:
         _named_schemas = {}
 
+    if _force and not expand and not _named_schemas:
+        return _parse_schema_cached(schema, _write_hint, _named_schemas)
     if _force or expand:
         return _parse_schema(
             schema, "", expand, _write_hint, set(), _named_schemas
@@ -95,6 +127,28 @@ def parse_schema(
         )
 
 
+cdef _parse_schema_cached(schema, write_hint, named_schemas):
+    try:
+        key = (json.dumps(schema, sort_keys=True), write_hint)
+    except (TypeError, ValueError):
+        # Not JSON serializable (or self referencing), so it cannot be cached
+        return _parse_schema(schema, "", False, write_hint, set(), named_schemas)
+
+    cached = _parsed_schemas.get(key)
+    if cached is None:
+        cached_named_schemas = {}
+        parsed_schema = _parse_schema(
+            schema, "", False, write_hint, set(), cached_named_schemas
+        )
+        cached = (parsed_schema, cached_named_schemas)
+        _parsed_schemas.set(key, cached)
+        _canonical_forms.set(id(parsed_schema), (parsed_schema, None))
+
+    parsed_schema, cached_named_schemas = cached
+    named_schemas.update(cached_named_schemas)
+    return parsed_schema
+
+
 cdef _parse_schema(schema, namespace, expand, _write_hint, names, named_schemas):
     # union schemas
     if isinstance(schema, list):
@@ -282,6 +336,9 @@ cdef parse_field(field, namespace, expand, names, named_schemas):
 def load_schema(
     schema_path, *, _named_schemas=None, _write_hint=True, _injected_schemas=None
 ):
+    if _named_schemas is None and _injected_schemas is None:
+        return _load_schema_cached(schema_path, _write_hint)
+
     if _named_schemas is None:
         _named_schemas = {}
 
@@ -296,6 +353,45 @@ def load_schema(
     )
 
 
+cdef _file_stamp(file_path):
+    try:
+        file_stat = stat(file_path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+cdef _load_schema_cached(schema_path, write_hint):
+    schema_path = path.abspath(schema_path)
+    key = (schema_path, write_hint)
+
+    # The cached schema is only valid while neither the schema file nor any of
+    # the files it pulled in have changed
+    cached = _loaded_schemas.get(key)
+    if cached is not None:
+        stamps, schema = cached
+        if all(_file_stamp(file_path) == stamp for file_path, stamp in stamps):
+            return schema
+
+    stamp = _file_stamp(schema_path)
+    injected_schemas = set()
+    schema = load_schema(
+        schema_path,
+        _named_schemas={},
+        _write_hint=write_hint,
+        _injected_schemas=injected_schemas,
+    )
+
+    schema_dir = path.dirname(schema_path)
+    stamps = [(schema_path, stamp)]
+    for name in injected_schemas:
+        file_path = path.join(schema_dir, f"{name}.avsc")
+        stamps.append((file_path, _file_stamp(file_path)))
+    _loaded_schemas.set(key, (tuple(stamps), schema))
+    _canonical_forms.set(id(schema), (schema, None))
+    return schema
+
+
 cdef _load_schema(schema, schema_dir, named_schemas, write_hint, injected_schemas):
     try:
         schema_copy = deepcopy(named_schemas)
@@ -434,9 +530,17 @@ def load_schema_ordered(ordered_schemas, *, _write_hint=True):
 
 
 def to_parsing_canonical_form(schema):
+    cached = _canonical_forms.get(id(schema))
+    if cached is not None and cached[0] is schema and cached[1] is not None:
+        return cached[1]
+
     fo = StringIO()
     _to_parsing_canonical_form(parse_schema(schema), fo)
-    return fo.getvalue()
+    canonical_form = fo.getvalue()
+
+    if cached is not None and cached[0] is schema:
+        _canonical_forms.set(id(schema), (schema, canonical_form))
+    return canonical_form
 
 
 cdef _to_parsing_canonical_form(schema, fo):
@@ -499,7 +603,27 @@ cdef _to_parsing_canonical_form(schema, fo):
             fo.write(f'"{schema_type}"')
 
 
+cpdef str rabin_fingerprint(const unsigned char[:] data):
+    cdef ulong64 result = RABIN_64_EMPTY
+    cdef unsigned char fp_bytes[8]
+    cdef Py_ssize_t i
+
+    for i in range(data.shape[0]):
+        result = (result >> 8) ^ RABIN_TABLE[(result ^ data[i]) & 0xFF]
+
+    # Although not mentioned in the Avro specification, the Java
+    # implementation gives fingerprint bytes in little-endian order
+    for i in range(8):
+        fp_bytes[i] = (result >> (8 * i)) & 0xFF
+    return fp_bytes[:8].hex()
+
+
 def fingerprint(parsing_canonical_form, algorithm):
+    return _fingerprint(parsing_canonical_form, algorithm)
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(parsing_canonical_form, algorithm):
     if algorithm not in FINGERPRINT_ALGORITHMS:
         raise ValueError(
             f"Unknown schema fingerprint algorithm {algorithm}. "
@@ -1,4 +1,6 @@
+from collections import OrderedDict
 import hashlib
+import threading
 
 
 PRIMITIVES = {
@@ -49,20 +51,69 @@ class SchemaParseException(Exception):
     pass
 
 
-def rabin_fingerprint(data):
-    empty_64 = 0xC15D213AA4D7A795
+class LRUCache:
+    """A thread-safe mapping that holds at most `maxsize` entries, evicting the
+    least recently used entry when a new one is added to a full cache.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
 
-    fp_table = []
+
+RABIN_64_EMPTY = 0xC15D213AA4D7A795
+
+
+def _rabin_64_table():
+    table = []
     for i in range(256):
         fp = i
         for j in range(8):
             mask = -(fp & 1)
-            fp = (fp >> 1) ^ (empty_64 & mask)
-        fp_table.append(fp)
+            fp = (fp >> 1) ^ (RABIN_64_EMPTY & mask)
+        table.append(fp)
+    return tuple(table)
+
 
-    result = empty_64
+RABIN_64_TABLE = _rabin_64_table()
+
+
+def rabin_fingerprint(data):
+    table = RABIN_64_TABLE
+    result = RABIN_64_EMPTY
     for byte in data:
-        result = (result >> 8) ^ fp_table[(result ^ byte) & 0xFF]
+        result = (result >> 8) ^ table[(result ^ byte) & 0xFF]
 
     # Although not mentioned in the Avro specification, the Java
     # implementation gives fingerprint bytes in little-endian order
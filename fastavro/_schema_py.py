@@ -1,8 +1,9 @@
 # cython: auto_cpdef=True
+from functools import lru_cache
 import hashlib
 from io import StringIO
 import math
-from os import path
+from os import path, stat
 from copy import deepcopy
 import json
 
@@ -16,9 +17,25 @@ from ._schema_common import (
     JAVA_FINGERPRINT_MAPPING,
     FINGERPRINT_ALGORITHMS,
     RABIN_64,
+    LRUCache,
     rabin_fingerprint,
 )
 
+# Canonical forms of the shared results of _parsed_schemas and _loaded_schemas.
+# Those schemas must not be modified, so their canonical form only needs to be
+# computed once; any other schema could be changed by its owner, so its
+# canonical form is never cached. Entries are keyed by id() and keep a
+# reference to the schema so that the id cannot be reused while the entry is
+# cached. The canonical form is None until it is first asked for.
+_canonical_forms = LRUCache(maxsize=256)
+
+# Results of parse_schema(..., _force=True) keyed by the JSON of the input
+# schema, and results of load_schema keyed by the path of the schema file. The
+# entries are returned to every caller as they are, so they must not be
+# modified
+_parsed_schemas = LRUCache(maxsize=256)
+_loaded_schemas = LRUCache(maxsize=256)
+
 
 def extract_record_type(schema):
     if isinstance(schema, dict):
@@ -37,7 +54,6 @@ def extract_logical_type(schema):
     rt = d_schema["type"]
     lt = d_schema.get("logicalType")
     if lt:
-        # TODO: Building this string every time is going to be relatively slow.
         return f"{rt}-{lt}"
     return None
 
@@ -189,7 +205,9 @@ def parse_schema(
         marker should be added to the schema
     _force: bool
         Internal API argument. If True, the schema will always be parsed even
-        if it has been parsed and has the __fastavro_parsed marker
+        if it has been parsed and has the __fastavro_parsed marker. The result
+        (and the named schemas) may be a cached result that is shared with
+        other callers and must not be modified
     _named_schemas: dict
         Internal API argument. Dictionary of named schemas to their schema
         definition
@@ -207,6 +225,8 @@ def parse_schema(
     if _named_schemas is None:
         _named_schemas = {}
 
+    if _force and not expand and not _named_schemas:
+        return _parse_schema_cached(schema, _write_hint, _named_schemas)
     if _force or expand:
         return _parse_schema(schema, "", expand, _write_hint, set(), _named_schemas)
     elif isinstance(schema, dict) and "__fastavro_parsed" in schema:
@@ -223,6 +243,28 @@ def parse_schema(
         return _parse_schema(schema, "", expand, _write_hint, set(), _named_schemas)
 
 
+def _parse_schema_cached(schema, write_hint, named_schemas):
+    try:
+        key = (json.dumps(schema, sort_keys=True), write_hint)
+    except (TypeError, ValueError):
+        # Not JSON serializable (or self referencing), so it cannot be cached
+        return _parse_schema(schema, "", False, write_hint, set(), named_schemas)
+
+    cached = _parsed_schemas.get(key)
+    if cached is None:
+        cached_named_schemas = {}
+        parsed_schema = _parse_schema(
+            schema, "", False, write_hint, set(), cached_named_schemas
+        )
+        cached = (parsed_schema, cached_named_schemas)
+        _parsed_schemas.set(key, cached)
+        _canonical_forms.set(id(parsed_schema), (parsed_schema, None))
+
+    parsed_schema, cached_named_schemas = cached
+    named_schemas.update(cached_named_schemas)
+    return parsed_schema
+
+
 def _parse_schema(schema, namespace, expand, _write_hint, names, named_schemas):
     # union schemas
     if isinstance(schema, list):
@@ -412,6 +454,11 @@ def load_schema(
     files in the same directory and named with the convention
     `<full_name>.avsc`.
 
+    The loaded schema is cached and the same object is returned again by later
+    calls until the schema file or one of the files it references changes. It
+    is shared with the other callers and must not be modified; use
+    `copy.deepcopy` to get a schema that can be changed.
+
     Parameters
     ----------
     schema: str
@@ -460,6 +507,9 @@ def load_schema(
 
         parsed_schema = load_schema("Parent.avsc")
     """
+    if _named_schemas is None and _injected_schemas is None:
+        return _load_schema_cached(schema_path, _write_hint)
+
     if _named_schemas is None:
         _named_schemas = {}
 
@@ -474,6 +524,45 @@ def load_schema(
     )
 
 
+def _file_stamp(file_path):
+    try:
+        file_stat = stat(file_path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _load_schema_cached(schema_path, write_hint):
+    schema_path = path.abspath(schema_path)
+    key = (schema_path, write_hint)
+
+    # The cached schema is only valid while neither the schema file nor any of
+    # the files it pulled in have changed
+    cached = _loaded_schemas.get(key)
+    if cached is not None:
+        stamps, schema = cached
+        if all(_file_stamp(file_path) == stamp for file_path, stamp in stamps):
+            return schema
+
+    stamp = _file_stamp(schema_path)
+    injected_schemas = set()
+    schema = load_schema(
+        schema_path,
+        _named_schemas={},
+        _write_hint=write_hint,
+        _injected_schemas=injected_schemas,
+    )
+
+    schema_dir = path.dirname(schema_path)
+    stamps = [(schema_path, stamp)]
+    for name in injected_schemas:
+        file_path = path.join(schema_dir, f"{name}.avsc")
+        stamps.append((file_path, _file_stamp(file_path)))
+    _loaded_schemas.set(key, (tuple(stamps), schema))
+    _canonical_forms.set(id(schema), (schema, None))
+    return schema
+
+
 def _load_schema(schema, schema_dir, named_schemas, write_hint, injected_schemas):
     try:
         schema_copy = deepcopy(named_schemas)
@@ -669,9 +758,17 @@ def to_parsing_canonical_form(schema):
     For more details on the parsing canonical form, see here:
     https://avro.apache.org/docs/current/spec.html#Parsing+Canonical+Form+for+Schemas
     """
+    cached = _canonical_forms.get(id(schema))
+    if cached is not None and cached[0] is schema and cached[1] is not None:
+        return cached[1]
+
     fo = StringIO()
     _to_parsing_canonical_form(parse_schema(schema), fo)
-    return fo.getvalue()
+    canonical_form = fo.getvalue()
+
+    if cached is not None and cached[0] is schema:
+        _canonical_forms.set(id(schema), (schema, canonical_form))
+    return canonical_form
 
 
 def _to_parsing_canonical_form(schema, fo):
@@ -741,6 +838,11 @@ def fingerprint(parsing_canonical_form, algorithm):
     For more details on the fingerprint, see here:
     https://avro.apache.org/docs/current/spec.html#schema_fingerprints
     """
+    return _fingerprint(parsing_canonical_form, algorithm)
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(parsing_canonical_form, algorithm):
     if algorithm not in FINGERPRINT_ALGORITHMS:
         raise ValueError(
             f"Unknown schema fingerprint algorithm {algorithm}. "
@@ -1,6 +1,12 @@
-from collections import namedtuple
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import json
 
+from .schema import parse_schema
+
+DEFAULT_CHUNKSIZE = 1000
+
 
 class ValidationErrorData(
     namedtuple("ValidationErrorData", ["datum", "schema", "field"])
@@ -21,7 +27,78 @@ class ValidationErrorData(
 
 
 class ValidationError(Exception):
-    def __init__(self, *errors):
+    def __init__(self, *errors, indices=None):
         message = json.dumps([str(e) for e in errors], indent=2, ensure_ascii=False)
         super(ValidationError, self).__init__(message)
         self.errors = errors
+        # When raised by validate_many, the index of the record each error
+        # belongs to
+        self.indices = indices
+
+
+# The validator of a worker process used by _iter_invalid
+_worker_validator = None
+
+
+def _init_worker(compile_validator, schema, named_schemas):
+    global _worker_validator
+    _worker_validator = compile_validator(schema, named_schemas)
+
+
+def _validate_chunk(start, records, raise_errors):
+    invalid = []
+    for offset, record in enumerate(records):
+        try:
+            if not _worker_validator(record, raise_errors):
+                invalid.append((start + offset, ()))
+        except ValidationError as e:
+            invalid.append((start + offset, e.errors))
+    return invalid
+
+
+def _iter_invalid(compile_validator, records, schema, raise_errors, workers, chunksize):
+    """Yields a tuple of the index, the record and the validation errors of
+    every invalid record, in the order of `records`.
+
+    If `workers` is greater than one, chunks of `chunksize` records are
+    validated in a pool of that many processes. At most two chunks per worker
+    are in flight at a time so that `records` can be an unbounded iterator.
+    """
+    if workers is None or workers <= 1:
+        validator = compile_validator(schema)
+        for index, record in enumerate(records):
+            try:
+                if validator(record, raise_errors):
+                    continue
+                errors = ()
+            except ValidationError as e:
+                errors = e.errors
+            yield index, record, errors
+        return
+
+    def chunk_results(start, chunk, future):
+        for index, errors in future.result():
+            yield index, chunk[index - start], errors
+
+    # The schema is parsed here so that an invalid schema raises the same
+    # exception as without workers instead of breaking the pool
+    named_schemas = {}
+    schema = parse_schema(schema, _force=True, _named_schemas=named_schemas)
+
+    records = iter(records)
+    pending = deque()
+    start = 0
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(compile_validator, schema, named_schemas),
+    ) as executor:
+        for chunk in iter(lambda: list(islice(records, chunksize)), []):
+            future = executor.submit(_validate_chunk, start, chunk, raise_errors)
+            pending.append((start, chunk, future))
+            start += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield from chunk_results(*pending.popleft())
+
+        while pending:
+            yield from chunk_results(*pending.popleft())
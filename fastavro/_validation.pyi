@@ -1,8 +1,20 @@
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ._validate_common import ValidationError
 
 def validate(
     datum: Any, schema: Dict, field: Optional[str], raise_errors: bool
 ) -> bool: ...
 def validate_many(
-    records: Iterable[Dict], schema: Dict, raise_errors: bool
+    records: Iterable[Dict],
+    schema: Dict,
+    raise_errors: bool,
+    workers: Optional[int],
+    chunksize: int,
 ) -> bool: ...
+def iter_invalid(
+    records: Iterable[Dict], schema: Dict, workers: Optional[int], chunksize: int
+) -> Iterator[Tuple[int, Any, ValidationError]]: ...
+def compile_validator(
+    schema: Dict, named_schemas: Optional[Dict]
+) -> Callable[..., bool]: ...
@@ -10,7 +10,12 @@ from ._schema import (
 )
 from ._logical_writers import LOGICAL_WRITERS
 from ._schema_common import UnknownType
-from ._validate_common import ValidationError, ValidationErrorData
+from ._validate_common import (
+    DEFAULT_CHUNKSIZE,
+    ValidationError,
+    ValidationErrorData,
+    _iter_invalid,
+)
 
 ctypedef int int32
 ctypedef unsigned int uint32
@@ -256,6 +261,270 @@ cpdef _validate(
     return bool(result)
 
 
+cdef class _Check:
+    cdef bint check(self, datum) except -1:
+        raise NotImplementedError
+
+
+cdef class _NullCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_null(datum)
+
+
+cdef class _BooleanCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_boolean(datum)
+
+
+cdef class _StringCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_string(datum)
+
+
+cdef class _IntCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_int(datum)
+
+
+cdef class _LongCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_long(datum)
+
+
+cdef class _FloatCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_float(datum)
+
+
+cdef class _BytesCheck(_Check):
+    cdef bint check(self, datum) except -1:
+        return validate_bytes(datum)
+
+
+cdef class _FixedCheck(_Check):
+    cdef Py_ssize_t size
+
+    def __init__(self, schema):
+        self.size = schema["size"]
+
+    cdef bint check(self, datum) except -1:
+        return (
+            (isinstance(datum, bytes) or isinstance(datum, bytearray))
+            and len(datum) == self.size
+        )
+
+
+cdef class _EnumCheck(_Check):
+    cdef list symbols
+    cdef frozenset symbol_set
+
+    def __init__(self, schema):
+        self.symbols = list(schema["symbols"])
+        self.symbol_set = frozenset(self.symbols)
+
+    cdef bint check(self, datum) except -1:
+        try:
+            return datum in self.symbol_set
+        except TypeError:
+            return datum in self.symbols
+
+
+cdef class _ArrayCheck(_Check):
+    cdef _Check items
+
+    def __init__(self, _Check items):
+        self.items = items
+
+    cdef bint check(self, datum) except -1:
+        if not isinstance(datum, (Sequence, array.array)) or isinstance(datum, str):
+            return False
+        for d in datum:
+            if not self.items.check(d):
+                return False
+        return True
+
+
+cdef class _MapCheck(_Check):
+    cdef _Check values
+
+    def __init__(self, _Check values):
+        self.values = values
+
+    cdef bint check(self, datum) except -1:
+        if not isinstance(datum, Mapping):
+            return False
+        for k in datum:
+            if not isinstance(k, str):
+                return False
+        for v in datum.values():
+            if not self.values.check(v):
+                return False
+        return True
+
+
+cdef class _RecordCheck(_Check):
+    cdef list names
+    cdef list defaults
+    cdef list checks
+
+    def __init__(self, list names, list defaults, list checks):
+        self.names = names
+        self.defaults = defaults
+        self.checks = checks
+
+    cdef bint check(self, datum) except -1:
+        cdef Py_ssize_t i
+        if not isinstance(datum, Mapping):
+            return False
+        for i in range(len(self.checks)):
+            if not (<_Check>self.checks[i]).check(
+                datum.get(self.names[i], self.defaults[i])
+            ):
+                return False
+        return True
+
+
+cdef class _UnionCheck(_Check):
+    cdef list names
+    cdef list checks
+
+    def __init__(self, list names, list checks):
+        self.names = names
+        self.checks = checks
+
+    cdef bint check(self, datum) except -1:
+        cdef Py_ssize_t i
+        if isinstance(datum, tuple):
+            (name, datum) = datum
+            for i in range(len(self.checks)):
+                if self.names[i] == name:
+                    return (<_Check>self.checks[i]).check(datum)
+            return False
+
+        for i in range(len(self.checks)):
+            if (<_Check>self.checks[i]).check(datum):
+                return True
+        return False
+
+
+cdef class _NamedCheck(_Check):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    cdef _Check target
+
+    cdef bint check(self, datum) except -1:
+        return self.target.check(datum)
+
+
+cdef class _LogicalCheck(_Check):
+    cdef object prepare
+    cdef object schema
+    cdef _Check inner
+
+    def __init__(self, prepare, schema, _Check inner):
+        self.prepare = prepare
+        self.schema = schema
+        self.inner = inner
+
+    cdef bint check(self, datum) except -1:
+        return self.inner.check(self.prepare(datum, self.schema))
+
+
+cdef _Check _compile(schema, dict named_schemas, dict compiled):
+    cdef _Check check
+    cdef _NamedCheck named_check
+
+    record_type = extract_record_type(schema)
+
+    if record_type == "null":
+        check = _NullCheck()
+    elif record_type == "boolean":
+        check = _BooleanCheck()
+    elif record_type == "string":
+        check = _StringCheck()
+    elif record_type == "int":
+        check = _IntCheck()
+    elif record_type == "long":
+        check = _LongCheck()
+    elif record_type in ("float", "double"):
+        check = _FloatCheck()
+    elif record_type == "bytes":
+        check = _BytesCheck()
+    elif record_type == "fixed":
+        check = _FixedCheck(schema)
+    elif record_type == "enum":
+        check = _EnumCheck(schema)
+    elif record_type == "array":
+        check = _ArrayCheck(_compile(schema["items"], named_schemas, compiled))
+    elif record_type == "map":
+        check = _MapCheck(_compile(schema["values"], named_schemas, compiled))
+    elif record_type in ("union", "error_union"):
+        names = []
+        checks = []
+        for candidate in schema:
+            if extract_record_type(candidate) == "record":
+                names.append(candidate["name"])
+            else:
+                names.append(candidate)
+            checks.append(_compile(candidate, named_schemas, compiled))
+        check = _UnionCheck(names, checks)
+    elif record_type in ("record", "error", "request"):
+        check = _RecordCheck(
+            [f["name"] for f in schema["fields"]],
+            [f.get("default") for f in schema["fields"]],
+            [_compile(f["type"], named_schemas, compiled) for f in schema["fields"]],
+        )
+    elif record_type in compiled:
+        check = compiled[record_type]
+    elif record_type in named_schemas:
+        named_check = _NamedCheck()
+        compiled[record_type] = named_check
+        named_check.target = _compile(
+            named_schemas[record_type], named_schemas, compiled
+        )
+        check = named_check
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        prepare = LOGICAL_WRITERS.get(logical_type)
+        if prepare:
+            check = _LogicalCheck(prepare, schema, check)
+
+    return check
+
+
+cdef class CompiledValidator:
+    cdef readonly object schema
+    cdef readonly dict named_schemas
+    cdef _Check root
+
+    def __init__(self, schema, named_schemas):
+        self.schema = schema
+        self.named_schemas = named_schemas
+        self.root = _compile(schema, named_schemas, {})
+
+    def __call__(self, datum, bint raise_errors=True):
+        if self.root.check(datum):
+            return True
+        if raise_errors:
+            # Run the full validation to report which values are invalid
+            return _validate(
+                datum, self.schema, self.named_schemas, raise_errors=True
+            )
+        return False
+
+
+cpdef compile_validator(schema, named_schemas=None):
+    if named_schemas is None:
+        named_schemas = {}
+        schema = parse_schema(
+            schema, _force=True, _named_schemas=named_schemas
+        )
+    return CompiledValidator(schema, named_schemas)
+
+
 cpdef validate(object datum, object schema, str field="",
                bint raise_errors=True):
     named_schemas = {}
@@ -265,22 +534,29 @@ cpdef validate(object datum, object schema, str field="",
     return _validate(datum, parsed_schema, named_schemas, field, raise_errors)
 
 
-cpdef validate_many(records, schema, bint raise_errors=True):
-    cdef bint result
+cpdef validate_many(
+    records,
+    schema,
+    bint raise_errors=True,
+    workers=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+):
+    cdef bint valid = True
     cdef list errors = []
-    cdef list results = []
-    named_schemas = {}
-    parsed_schema = parse_schema(
-        schema, _force=True, _named_schemas=named_schemas
-    )
-    for record in records:
-        try:
-            result = _validate(
-                record, parsed_schema, named_schemas, raise_errors=raise_errors
-            )
-            results.append(result)
-        except ValidationError as e:
-            errors.extend(e.errors)
+    cdef list indices = []
+    for index, _, record_errors in _iter_invalid(
+        compile_validator, records, schema, raise_errors, workers, chunksize
+    ):
+        valid = False
+        errors.extend(record_errors)
+        indices.extend([index] * len(record_errors))
     if raise_errors and errors:
-        raise ValidationError(*errors)
-    return all(results)
+        raise ValidationError(*errors, indices=indices)
+    return valid
+
+
+def iter_invalid(records, schema, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    for index, record, errors in _iter_invalid(
+        compile_validator, records, schema, True, workers, chunksize
+    ):
+        yield index, record, ValidationError(*errors)
@@ -3,7 +3,12 @@ import numbers
 from collections.abc import Mapping, Sequence
 
 from fastavro.const import INT_MAX_VALUE, INT_MIN_VALUE, LONG_MAX_VALUE, LONG_MIN_VALUE
-from ._validate_common import ValidationError, ValidationErrorData
+from ._validate_common import (
+    DEFAULT_CHUNKSIZE,
+    ValidationError,
+    ValidationErrorData,
+    _iter_invalid,
+)
 from .schema import extract_record_type, extract_logical_type, schema_name, parse_schema
 from .logical_writers import LOGICAL_WRITERS
 from ._schema_common import UnknownType
@@ -143,7 +148,7 @@ def validate_fixed(datum, schema, **kwargs):
     kwargs: Any
         Unused kwargs
     """
-    return isinstance(datum, bytes) and len(datum) == schema["size"]
+    return isinstance(datum, (bytes, bytearray)) and len(datum) == schema["size"]
 
 
 def validate_enum(datum, schema, **kwargs):
@@ -273,7 +278,7 @@ def validate_union(datum, schema, named_schemas, parent_ns=None, raise_errors=Tr
         If true, raises ValidationError on invalid data
     """
     if isinstance(datum, tuple):
-        (name, datum) = datum
+        name, datum = datum
         for candidate in schema:
             if extract_record_type(candidate) == "record":
                 schema_name = candidate["name"]
@@ -368,6 +373,142 @@ def _validate(datum, schema, named_schemas, field=None, raise_errors=True):
     return result
 
 
+def _compile_array(schema, named_schemas, compiled):
+    items = _compile(schema["items"], named_schemas, compiled)
+
+    def check(datum):
+        return (
+            isinstance(datum, (Sequence, array.array))
+            and not isinstance(datum, str)
+            and all(items(d) for d in datum)
+        )
+
+    return check
+
+
+def _compile_map(schema, named_schemas, compiled):
+    values = _compile(schema["values"], named_schemas, compiled)
+
+    def check(datum):
+        return (
+            isinstance(datum, Mapping)
+            and all(isinstance(k, str) for k in datum)
+            and all(values(v) for v in datum.values())
+        )
+
+    return check
+
+
+def _compile_record(schema, named_schemas, compiled):
+    fields = [
+        (f["name"], f.get("default"), _compile(f["type"], named_schemas, compiled))
+        for f in schema["fields"]
+    ]
+
+    def check(datum):
+        return isinstance(datum, Mapping) and all(
+            field_check(datum.get(name, default))
+            for name, default, field_check in fields
+        )
+
+    return check
+
+
+def _compile_union(schema, named_schemas, compiled):
+    branches = []
+    for candidate in schema:
+        if extract_record_type(candidate) == "record":
+            name = candidate["name"]
+        else:
+            name = candidate
+        branches.append((name, _compile(candidate, named_schemas, compiled)))
+    checks = [branch_check for _, branch_check in branches]
+
+    def check(datum):
+        if isinstance(datum, tuple):
+            name, datum = datum
+            for candidate_name, branch_check in branches:
+                if candidate_name == name:
+                    return branch_check(datum)
+            return False
+        return any(branch_check(datum) for branch_check in checks)
+
+    return check
+
+
+def _compile_named(name, named_schemas, compiled):
+    # A forward reference so that recursive schemas can refer to a named type
+    # while it is still being compiled
+    target = []
+
+    def check(datum):
+        return target[0](datum)
+
+    compiled[name] = check
+    target.append(_compile(named_schemas[name], named_schemas, compiled))
+    return check
+
+
+def _compile(schema, named_schemas, compiled):
+    record_type = extract_record_type(schema)
+
+    if record_type == "null":
+        check = validate_null
+    elif record_type == "boolean":
+        check = validate_boolean
+    elif record_type == "string":
+        check = validate_string
+    elif record_type == "int":
+        check = validate_int
+    elif record_type == "long":
+        check = validate_long
+    elif record_type in ("float", "double"):
+        check = validate_float
+    elif record_type == "bytes":
+        check = validate_bytes
+    elif record_type == "fixed":
+        size = schema["size"]
+
+        def check(datum):
+            return isinstance(datum, (bytes, bytearray)) and len(datum) == size
+
+    elif record_type == "enum":
+        symbols = schema["symbols"]
+        symbol_set = frozenset(symbols)
+
+        def check(datum):
+            try:
+                return datum in symbol_set
+            except TypeError:
+                return datum in symbols
+
+    elif record_type == "array":
+        check = _compile_array(schema, named_schemas, compiled)
+    elif record_type == "map":
+        check = _compile_map(schema, named_schemas, compiled)
+    elif record_type in ("union", "error_union"):
+        check = _compile_union(schema, named_schemas, compiled)
+    elif record_type in ("record", "error", "request"):
+        check = _compile_record(schema, named_schemas, compiled)
+    elif record_type in compiled:
+        check = compiled[record_type]
+    elif record_type in named_schemas:
+        check = _compile_named(record_type, named_schemas, compiled)
+    else:
+        raise UnknownType(record_type)
+
+    logical_type = extract_logical_type(schema)
+    if logical_type:
+        prepare = LOGICAL_WRITERS.get(logical_type)
+        if prepare:
+            inner = check
+
+            def check(datum):
+                return inner(prepare(datum, schema))
+
+    return check
+
+
 def validate(datum, schema, field=None, raise_errors=True):
     """
     Determine if a python datum is an instance of a schema.
@@ -397,7 +538,13 @@ def validate(datum, schema, field=None, raise_errors=True):
     return _validate(datum, parsed_schema, named_schemas, field, raise_errors)
 
 
-def validate_many(records, schema, raise_errors=True):
+def validate_many(
+    records,
+    schema,
+    raise_errors=True,
+    workers=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+):
     """
     Validate a list of data!
 
@@ -409,7 +556,14 @@ def validate_many(records, schema, raise_errors=True):
         Schema
     raise_errors: bool, optional
         If true, errors are raised for invalid data. If false, a simple
-        True (valid) or False (invalid) result is returned
+        True (valid) or False (invalid) result is returned. The raised
+        ValidationError has an `indices` attribute with the index of the
+        record each error belongs to
+    workers: int, optional
+        If greater than one, records are validated in a pool of this many
+        processes. Records and the schema must be picklable
+    chunksize: int, optional
+        Number of records sent to a worker process at a time
 
 
     Example::
@@ -417,21 +571,95 @@ def validate_many(records, schema, raise_errors=True):
         from fastavro.validation import validate_many
         schema = {...}
         records = [{...}, {...}, ...]
-        validate_many(records, schema)
+        validate_many(records, schema, workers=4)
     """
-    named_schemas = {}
-    parsed_schema = parse_schema(schema, _force=True, _named_schemas=named_schemas)
+    valid = True
     errors = []
-    results = []
-    for record in records:
-        try:
-            results.append(
-                _validate(
-                    record, parsed_schema, named_schemas, raise_errors=raise_errors
-                )
-            )
-        except ValidationError as e:
-            errors.extend(e.errors)
+    indices = []
+    for index, _, record_errors in _iter_invalid(
+        compile_validator, records, schema, raise_errors, workers, chunksize
+    ):
+        valid = False
+        errors.extend(record_errors)
+        indices.extend([index] * len(record_errors))
     if raise_errors and errors:
-        raise ValidationError(*errors)
-    return all(results)
+        raise ValidationError(*errors, indices=indices)
+    return valid
+
+
+def iter_invalid(records, schema, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Iterate over the records that are not valid
+
+    Yields a tuple of the index of the record, the record itself and a
+    ValidationError describing why it is invalid, in the order of `records`.
+    Records are consumed lazily so this can be used on unbounded streams.
+
+    Parameters
+    ----------
+    records: iterable
+        Records to validate
+    schema: dict
+        Schema
+    workers: int, optional
+        If greater than one, records are validated in a pool of this many
+        processes. Records and the schema must be picklable
+    chunksize: int, optional
+        Number of records sent to a worker process at a time
+
+
+    Example::
+
+        from fastavro.validation import iter_invalid
+        schema = {...}
+        records = [{...}, {...}, ...]
+        for index, record, error in iter_invalid(records, schema):
+            print(index, error)
+    """
+    for index, record, errors in _iter_invalid(
+        compile_validator, records, schema, True, workers, chunksize
+    ):
+        yield index, record, ValidationError(*errors)
+
+
+def compile_validator(schema, named_schemas=None):
+    """
+    Returns a function that validates data against a schema.
+
+    The schema is only inspected once, when the validator is compiled, so this
+    is much faster than calling `validate` for every datum. The returned
+    function has the signature ``validator(datum, raise_errors=True)`` and
+    gives the same results as ``validate(datum, schema, raise_errors=...)``.
+
+    Parameters
+    ----------
+    schema: dict
+        Schema
+    named_schemas: dict, optional
+        If given, `schema` is assumed to already be parsed and this should be
+        the dictionary of named schemas it was parsed with
+
+
+    Example::
+
+        from fastavro.validation import compile_validator
+        schema = {...}
+        records = [{...}, {...}, ...]
+        validator = compile_validator(schema)
+        for record in records:
+            validator(record)
+    """
+    if named_schemas is None:
+        named_schemas = {}
+        schema = parse_schema(schema, _force=True, _named_schemas=named_schemas)
+    check = _compile(schema, named_schemas, {})
+
+    def validator(datum, raise_errors=True):
+        if check(datum):
+            return True
+        if raise_errors:
+            # Run the full validation to report which values are invalid
+            return _validate(datum, schema, named_schemas, raise_errors=True)
+        return False
+
+    return validator
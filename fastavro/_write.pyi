@@ -12,6 +12,7 @@ def writer(
     validator: Union[Callable, bool, None],
     sync_marker: Optional[bytes],
     codec_compression_level: Optional[int],
+    logical_types: Union[bool, Dict[str, bool]],
 ) -> None: ...
 
 class GenericWriter:
@@ -36,10 +37,18 @@ class Writer(GenericWriter):
         validator: Union[Callable, bool, None],
         sync_marker: Optional[bytes],
         codec_compression_level: Optional[int],
+        logical_types: Union[bool, Dict[str, bool]],
     ): ...
     def dump(self) -> None: ...
     def write(self, record: AvroMessage) -> None: ...
     def write_block(self, block) -> None: ...
     def flush(self) -> None: ...
 
-def schemaless_writer(fo: IO, schema: Dict, record: Dict) -> None: ...
+def schemaless_writer(
+    fo: IO,
+    schema: Dict,
+    record: Dict,
+    logical_types: Union[bool, Dict[str, bool]] = ...,
+) -> None: ...
+
+BLOCK_WRITERS: Dict[str, Callable]
@@ -9,6 +9,8 @@
 from cpython cimport array
 import array
 import json
+import numbers
+from collections.abc import Mapping, Sequence
 from binascii import crc32
 from os import urandom
 import bz2
@@ -18,9 +20,15 @@ import sys
 
 from fastavro import const
 from ._logical_writers import LOGICAL_WRITERS
-from ._validation import _validate
+from ._validation import _validate, compile_validator
+from ._validate_common import ValidationError, ValidationErrorData
 from ._read import HEADER_SCHEMA, SYNC_SIZE, MAGIC, reader
 from ._schema import extract_record_type, extract_logical_type, parse_schema
+from ._logical_common import (
+    LOGICAL_CONVERTER,
+    resolve_logical_types,
+    strip_logical_types,
+)
 from ._write_common import _is_appendable
 
 CYTHON_MODULE = 1  # Tests check this to confirm whether using the Cython code.
@@ -38,6 +46,11 @@ cdef long64 MLS_PER_SECOND = const.MLS_PER_SECOND
 cdef long64 MLS_PER_MINUTE = const.MLS_PER_MINUTE
 cdef long64 MLS_PER_HOUR = const.MLS_PER_HOUR
 
+cdef int32 INT_MIN_VALUE = const.INT_MIN_VALUE
+cdef int32 INT_MAX_VALUE = const.INT_MAX_VALUE
+cdef long64 LONG_MIN_VALUE = const.LONG_MIN_VALUE
+cdef long64 LONG_MAX_VALUE = const.LONG_MAX_VALUE
+
 
 cdef inline write_null(object fo, datum):
     """null is written as zero bytes"""
@@ -323,6 +336,14 @@ cdef write_record(bytearray fo, object datum, dict schema, dict named_schemas):
             write_data(fo, d_datum_value, field["type"], named_schemas, name)
 
 
+cdef inline _logical_writer(dict schema):
+    # The function found by resolve_logical_types, which schemas that are not
+    # written by a Writer do not have
+    if LOGICAL_CONVERTER in schema:
+        return schema[LOGICAL_CONVERTER]
+    return LOGICAL_WRITERS.get(extract_logical_type(schema))
+
+
 cpdef write_data(bytearray fo, datum, schema, dict named_schemas, fname):
     """Write a datum of data to output stream.
 
@@ -335,13 +356,10 @@ cpdef write_data(bytearray fo, datum, schema, dict named_schemas, fname):
     schema: dict
         Schema to use
     """
-    cdef str logical_type = None
-    if isinstance(schema, dict):
-        logical_type = extract_logical_type(schema)
-        if logical_type:
-            prepare = LOGICAL_WRITERS.get(logical_type)
-            if prepare:
-                datum = prepare(datum, schema)
+    if isinstance(schema, dict) and "logicalType" in schema:
+        prepare = _logical_writer(schema)
+        if prepare:
+            datum = prepare(datum, schema)
 
     record_type = extract_record_type(schema)
     try:
@@ -389,6 +407,137 @@ cpdef write_data(bytearray fo, datum, schema, dict named_schemas, fname):
         raise
 
 
+cdef inline bint _is_int(datum, long64 min_value, long64 max_value) except -1:
+    return (
+        isinstance(datum, (int, numbers.Integral))
+        and min_value <= datum <= max_value
+        and not isinstance(datum, bool)
+    )
+
+
+cdef inline _invalid(datum, schema, fname):
+    return ValidationError(ValidationErrorData(datum, schema, fname))
+
+
+cpdef write_data_checked(bytearray fo, datum, schema, dict named_schemas, fname):
+    """Write a datum of data to output stream, checking that it matches the
+    schema while encoding it.
+
+    This makes the same checks as validation but only walks the datum once.
+    A ValidationError is raised for the first value that does not match, in
+    which case the caller should discard what was written for the datum.
+    """
+    cdef int32 index
+    if isinstance(schema, dict) and "logicalType" in schema:
+        prepare = _logical_writer(schema)
+        if prepare:
+            datum = prepare(datum, schema)
+
+    record_type = extract_record_type(schema)
+    if record_type == "null":
+        if datum is not None:
+            raise _invalid(datum, schema, fname)
+    elif record_type == "string":
+        if not isinstance(datum, str):
+            raise _invalid(datum, schema, fname)
+        write_utf8(fo, datum)
+    elif record_type == "int":
+        if not _is_int(datum, INT_MIN_VALUE, INT_MAX_VALUE):
+            raise _invalid(datum, schema, fname)
+        write_long(fo, datum)
+    elif record_type == "long":
+        if not _is_int(datum, LONG_MIN_VALUE, LONG_MAX_VALUE):
+            raise _invalid(datum, schema, fname)
+        write_long(fo, datum)
+    elif record_type == "float" or record_type == "double":
+        if (
+            not isinstance(datum, (int, float, numbers.Real))
+            or isinstance(datum, bool)
+        ):
+            raise _invalid(datum, schema, fname)
+        if record_type == "float":
+            write_float(fo, datum)
+        else:
+            write_double(fo, datum)
+    elif record_type == "boolean":
+        if not isinstance(datum, bool):
+            raise _invalid(datum, schema, fname)
+        write_boolean(fo, datum)
+    elif record_type == "bytes":
+        if not isinstance(datum, (bytes, bytearray)):
+            raise _invalid(datum, schema, fname)
+        write_bytes(fo, datum)
+    elif record_type == "fixed":
+        if (
+            not isinstance(datum, (bytes, bytearray))
+            or len(datum) != schema["size"]
+        ):
+            raise _invalid(datum, schema, fname)
+        write_fixed(fo, datum, named_schemas)
+    elif record_type == "enum":
+        if datum not in schema["symbols"]:
+            raise _invalid(datum, schema, fname)
+        write_enum(fo, datum, schema, named_schemas)
+    elif record_type == "array":
+        if (
+            not isinstance(datum, (Sequence, array.array))
+            or isinstance(datum, str)
+        ):
+            raise _invalid(datum, schema, fname)
+        if len(datum) > 0:
+            write_long(fo, len(datum))
+            dtype = schema["items"]
+            for item in datum:
+                write_data_checked(fo, item, dtype, named_schemas, fname)
+        write_long(fo, 0)
+    elif record_type == "map":
+        if not isinstance(datum, Mapping):
+            raise _invalid(datum, schema, fname)
+        if len(datum) > 0:
+            write_long(fo, len(datum))
+            vtype = schema["values"]
+            for key, val in datum.items():
+                if not isinstance(key, str):
+                    raise _invalid(datum, schema, fname)
+                write_utf8(fo, key)
+                write_data_checked(fo, val, vtype, named_schemas, fname)
+        write_long(fo, 0)
+    elif record_type == "union" or record_type == "error_union":
+        if not isinstance(datum, tuple):
+            # write_union validates the datum against the branches to pick the
+            # one to write, so the value does not need to be checked again
+            write_union(fo, datum, schema, named_schemas, fname)
+            return
+
+        (name, value) = datum
+        for index, candidate in enumerate(schema):
+            if extract_record_type(candidate) == "record":
+                schema_name = candidate["name"]
+            else:
+                schema_name = candidate
+            if name == schema_name:
+                write_long(fo, index)
+                write_data_checked(fo, value, candidate, named_schemas, fname)
+                return
+        raise _invalid(datum, schema, fname)
+    elif record_type == "record" or record_type == "error":
+        if not isinstance(datum, Mapping):
+            raise _invalid(datum, schema, fname)
+        for field in schema["fields"]:
+            name = field["name"]
+            write_data_checked(
+                fo,
+                datum.get(name, field.get("default")),
+                field["type"],
+                named_schemas,
+                name,
+            )
+    else:
+        write_data_checked(
+            fo, datum, named_schemas[record_type], named_schemas, fname
+        )
+
+
 cpdef write_header(bytearray fo, dict metadata, bytes sync_marker):
     header = {
         "magic": MAGIC,
@@ -544,6 +693,10 @@ cdef class Writer:
     cdef public object block_writer
     cdef public object compression_level
     cdef public dict _named_schemas
+    cdef object _write_schema
+    cdef object _encode_schema
+    cdef dict _encode_named_schemas
+    cdef bint _validate_inline
 
     def __init__(self,
                  fo,
@@ -553,13 +706,38 @@ cdef class Writer:
                  metadata=None,
                  validator=None,
                  sync_marker=None,
-                 compression_level=None):
+                 compression_level=None,
+                 logical_types=True):
         cdef bytearray tmp = bytearray()
 
         self.fo = fo
         self._named_schemas = {}
         self.schema = parse_schema(schema, _named_schemas=self._named_schemas)
-        self.validate_fn = _validate if validator is True else validator
+        # The schema the records are encoded with, without the logical types
+        # that should not be converted
+        self._write_schema, self._named_schemas = strip_logical_types(
+            self.schema, self._named_schemas, logical_types
+        )
+        # The copies of the schemas that the records are encoded with, with
+        # the functions that convert the logical types
+        self._encode_schema, self._encode_named_schemas = resolve_logical_types(
+            self.schema, self._named_schemas, logical_types, LOGICAL_WRITERS
+        )
+        if validator is True:
+            validate = compile_validator(
+                self._write_schema, self._named_schemas
+            )
+
+            def validate_fn(datum, schema, named_schemas):
+                return validate(datum)
+
+            self.validate_fn = validate_fn
+        else:
+            self.validate_fn = validator
+
+        # With the default validator, records are checked while they are
+        # encoded instead of walking them twice
+        self._validate_inline = validator is True
         self.io = MemoryIO()
         self.block_count = 0
         self.sync_interval = sync_interval
@@ -634,9 +812,33 @@ cdef class Writer:
         self.block_count = 0
 
     def write(self, record):
-        if self.validate_fn:
-            self.validate_fn(record, self.schema, self._named_schemas)
-        write_data(self.io.value, record, self.schema, self._named_schemas, "")
+        cdef Py_ssize_t pos
+        if self._validate_inline:
+            pos = len(self.io.value)
+            try:
+                write_data_checked(
+                    self.io.value,
+                    record,
+                    self._encode_schema,
+                    self._encode_named_schemas,
+                    "",
+                )
+            except Exception:
+                # Discard the partially written record and let the validator
+                # report the errors
+                del self.io.value[pos:]
+                _validate(record, self._write_schema, self._named_schemas)
+                raise
+        else:
+            if self.validate_fn:
+                self.validate_fn(record, self._write_schema, self._named_schemas)
+            write_data(
+                self.io.value,
+                record,
+                self._encode_schema,
+                self._encode_named_schemas,
+                "",
+            )
         self.block_count += 1
         if self.io.tell() >= self.sync_interval:
             self.dump()
@@ -665,7 +867,8 @@ def writer(fo,
            metadata=None,
            validator=None,
            sync_marker=None,
-           codec_compression_level=None):
+           codec_compression_level=None,
+           logical_types=True):
     # Sanity check that records is not a single dictionary (as that is a common
     # mistake and the exception that gets raised is not helpful)
     if isinstance(records, dict):
@@ -680,6 +883,7 @@ def writer(fo,
         validator,
         sync_marker,
         codec_compression_level,
+        logical_types,
     )
 
     for record in records:
@@ -687,9 +891,12 @@ def writer(fo,
     output.flush()
 
 
-def schemaless_writer(fo, schema, record):
+def schemaless_writer(fo, schema, record, logical_types=True):
     cdef bytearray tmp = bytearray()
     named_schemas = {}
     schema = parse_schema(schema, _named_schemas=named_schemas)
+    schema, named_schemas = strip_logical_types(
+        schema, named_schemas, logical_types
+    )
     write_data(tmp, record, schema, named_schemas, "")
     fo.write(tmp)
@@ -6,7 +6,10 @@
 # http://svn.apache.org/viewvc/avro/trunk/lang/py/src/avro/ which is under
 # Apache 2.0 license (http://www.apache.org/licenses/LICENSE-2.0)
 
+import array
 import json
+import numbers
+from collections.abc import Mapping, Sequence
 from io import BytesIO
 from os import urandom, SEEK_SET
 import bz2
@@ -15,10 +18,21 @@ import zlib
 
 from .io.binary_encoder import BinaryEncoder
 from .io.json_encoder import AvroJSONEncoder
-from .validation import _validate
+from .const import INT_MAX_VALUE, INT_MIN_VALUE, LONG_MAX_VALUE, LONG_MIN_VALUE
+from .validation import (
+    ValidationError,
+    ValidationErrorData,
+    _validate,
+    compile_validator,
+)
 from .read import HEADER_SCHEMA, SYNC_SIZE, MAGIC, reader
 from .logical_writers import LOGICAL_WRITERS
 from .schema import extract_record_type, extract_logical_type, parse_schema
+from ._logical_common import (
+    LOGICAL_CONVERTER,
+    resolve_logical_types,
+    strip_logical_types,
+)
 from ._write_common import _is_appendable
 
 
@@ -133,7 +147,7 @@ def write_union(encoder, datum, schema, named_schemas, fname):
 
     best_match_index = -1
     if isinstance(datum, tuple):
-        (name, datum) = datum
+        name, datum = datum
         for index, candidate in enumerate(schema):
             if extract_record_type(candidate) == "record":
                 schema_name = candidate["name"]
@@ -217,6 +231,14 @@ WRITERS = {
 }
 
 
+def _logical_writer(schema):
+    # The function found by resolve_logical_types, which schemas that are not
+    # written by a Writer do not have
+    if LOGICAL_CONVERTER in schema:
+        return schema[LOGICAL_CONVERTER]
+    return LOGICAL_WRITERS.get(extract_logical_type(schema))
+
+
 def write_data(encoder, datum, schema, named_schemas, fname):
     """Write a datum of data to output stream.
 
@@ -233,12 +255,11 @@ def write_data(encoder, datum, schema, named_schemas, fname):
     """
 
     record_type = extract_record_type(schema)
-    logical_type = extract_logical_type(schema)
 
     fn = WRITERS.get(record_type)
     if fn:
-        if logical_type:
-            prepare = LOGICAL_WRITERS.get(logical_type)
+        if isinstance(schema, dict) and "logicalType" in schema:
+            prepare = _logical_writer(schema)
             if prepare:
                 datum = prepare(datum, schema)
         try:
@@ -251,6 +272,112 @@ def write_data(encoder, datum, schema, named_schemas, fname):
         return write_data(encoder, datum, named_schemas[record_type], named_schemas, "")
 
 
+def _is_int(datum, min_value, max_value):
+    return (
+        isinstance(datum, (int, numbers.Integral))
+        and min_value <= datum <= max_value
+        and not isinstance(datum, bool)
+    )
+
+
+# The same checks as the validators for the types that are written directly
+CHECKS = {
+    "null": lambda datum, schema: datum is None,
+    "boolean": lambda datum, schema: isinstance(datum, bool),
+    "string": lambda datum, schema: isinstance(datum, str),
+    "int": lambda datum, schema: _is_int(datum, INT_MIN_VALUE, INT_MAX_VALUE),
+    "long": lambda datum, schema: _is_int(datum, LONG_MIN_VALUE, LONG_MAX_VALUE),
+    "float": lambda datum, schema: (
+        isinstance(datum, (int, float, numbers.Real)) and not isinstance(datum, bool)
+    ),
+    "bytes": lambda datum, schema: isinstance(datum, (bytes, bytearray)),
+    "fixed": lambda datum, schema: (
+        isinstance(datum, bytes) and len(datum) == schema["size"]
+    ),
+    "enum": lambda datum, schema: datum in schema["symbols"],
+}
+CHECKS["double"] = CHECKS["float"]
+
+
+def write_data_checked(encoder, datum, schema, named_schemas, fname):
+    """Write a datum of data to output stream, checking that it matches the
+    schema while encoding it.
+
+    This makes the same checks as validation but only walks the datum once.
+    A ValidationError is raised for the first value that does not match, in
+    which case the caller should discard what was written for the datum.
+    """
+    record_type = extract_record_type(schema)
+    if isinstance(schema, dict) and "logicalType" in schema:
+        prepare = _logical_writer(schema)
+        if prepare:
+            datum = prepare(datum, schema)
+
+    check = CHECKS.get(record_type)
+    if check:
+        if not check(datum, schema):
+            raise ValidationError(ValidationErrorData(datum, schema, fname))
+        WRITERS[record_type](encoder, datum, schema, named_schemas, fname)
+    elif record_type == "union" or record_type == "error_union":
+        if not isinstance(datum, tuple):
+            # write_union validates the datum against the branches to pick the
+            # one to write, so the value does not need to be checked again
+            write_union(encoder, datum, schema, named_schemas, fname)
+            return
+
+        name, value = datum
+        for index, candidate in enumerate(schema):
+            if extract_record_type(candidate) == "record":
+                schema_name = candidate["name"]
+            else:
+                schema_name = candidate
+            if name == schema_name:
+                encoder.write_index(index, candidate)
+                write_data_checked(encoder, value, candidate, named_schemas, fname)
+                return
+        raise ValidationError(ValidationErrorData(datum, schema, fname))
+    elif record_type == "record" or record_type == "error":
+        if not isinstance(datum, Mapping):
+            raise ValidationError(ValidationErrorData(datum, schema, fname))
+        for field in schema["fields"]:
+            name = field["name"]
+            write_data_checked(
+                encoder,
+                datum.get(name, field.get("default")),
+                field["type"],
+                named_schemas,
+                name,
+            )
+    elif record_type == "array":
+        if not isinstance(datum, (Sequence, array.array)) or isinstance(datum, str):
+            raise ValidationError(ValidationErrorData(datum, schema, fname))
+        encoder.write_array_start()
+        if len(datum) > 0:
+            encoder.write_item_count(len(datum))
+            dtype = schema["items"]
+            for item in datum:
+                write_data_checked(encoder, item, dtype, named_schemas, fname)
+                encoder.end_item()
+        encoder.write_array_end()
+    elif record_type == "map":
+        if not isinstance(datum, Mapping):
+            raise ValidationError(ValidationErrorData(datum, schema, fname))
+        encoder.write_map_start()
+        if len(datum) > 0:
+            encoder.write_item_count(len(datum))
+            vtype = schema["values"]
+            for key, val in datum.items():
+                if not isinstance(key, str):
+                    raise ValidationError(ValidationErrorData(datum, schema, fname))
+                encoder.write_utf8(key)
+                write_data_checked(encoder, val, vtype, named_schemas, fname)
+        encoder.write_map_end()
+    else:
+        write_data_checked(
+            encoder, datum, named_schemas[record_type], named_schemas, fname
+        )
+
+
 def write_header(encoder, metadata, sync_marker):
     header = {
         "magic": MAGIC,
@@ -356,10 +483,23 @@ else:
 
 
 class GenericWriter:
-    def __init__(self, schema, metadata=None, validator=None):
+    def __init__(self, schema, metadata=None, validator=None, logical_types=True):
         self._named_schemas = {}
         self.schema = parse_schema(schema, _named_schemas=self._named_schemas)
-        self.validate_fn = _validate if validator is True else validator
+        # The schema the records are encoded with, without the logical types
+        # that should not be converted
+        self._write_schema, self._named_schemas = strip_logical_types(
+            self.schema, self._named_schemas, logical_types
+        )
+        if validator is True:
+            validate = compile_validator(self._write_schema, self._named_schemas)
+
+            def validate_fn(datum, schema, named_schemas):
+                return validate(datum)
+
+            self.validate_fn = validate_fn
+        else:
+            self.validate_fn = validator
         self.metadata = metadata or {}
 
         if isinstance(schema, dict):
@@ -401,8 +541,19 @@ class Writer(GenericWriter):
         validator=None,
         sync_marker=None,
         compression_level=None,
+        logical_types=True,
     ):
-        GenericWriter.__init__(self, schema, metadata, validator)
+        GenericWriter.__init__(self, schema, metadata, validator, logical_types)
+
+        # The copies of the schemas that the records are encoded with, with
+        # the functions that convert the logical types
+        self._encode_schema, self._encode_named_schemas = resolve_logical_types(
+            self.schema, self._named_schemas, logical_types, LOGICAL_WRITERS
+        )
+
+        # With the default validator, records are checked while they are
+        # encoded instead of walking them twice
+        self._validate_inline = validator is True
 
         self.metadata["avro.codec"] = codec
         if isinstance(fo, BinaryEncoder):
@@ -454,9 +605,33 @@ class Writer(GenericWriter):
         self.block_count = 0
 
     def write(self, record):
-        if self.validate_fn:
-            self.validate_fn(record, self.schema, self._named_schemas)
-        write_data(self.io, record, self.schema, self._named_schemas, "")
+        if self._validate_inline:
+            pos = self.io._fo.tell()
+            try:
+                write_data_checked(
+                    self.io,
+                    record,
+                    self._encode_schema,
+                    self._encode_named_schemas,
+                    "",
+                )
+            except Exception:
+                # Discard the partially written record and let the validator
+                # report the errors
+                self.io._fo.seek(pos)
+                self.io._fo.truncate()
+                _validate(record, self._write_schema, self._named_schemas)
+                raise
+        else:
+            if self.validate_fn:
+                self.validate_fn(record, self._write_schema, self._named_schemas)
+            write_data(
+                self.io,
+                record,
+                self._encode_schema,
+                self._encode_named_schemas,
+                "",
+            )
         self.block_count += 1
         if self.io._fo.tell() >= self.sync_interval:
             self.dump()
@@ -486,16 +661,17 @@ class JSONWriter(GenericWriter):
         validator=None,
         sync_marker=None,
         codec_compression_level=None,
+        logical_types=True,
     ):
-        GenericWriter.__init__(self, schema, metadata, validator)
+        GenericWriter.__init__(self, schema, metadata, validator, logical_types)
 
         self.encoder = fo
-        self.encoder.configure(self.schema, self._named_schemas)
+        self.encoder.configure(self._write_schema, self._named_schemas)
 
     def write(self, record):
         if self.validate_fn:
-            self.validate_fn(record, self.schema, self._named_schemas)
-        write_data(self.encoder, record, self.schema, self._named_schemas, "")
+            self.validate_fn(record, self._write_schema, self._named_schemas)
+        write_data(self.encoder, record, self._write_schema, self._named_schemas, "")
 
     def flush(self):
         self.encoder.flush()
@@ -511,6 +687,7 @@ def writer(
     validator=None,
     sync_marker=None,
     codec_compression_level=None,
+    logical_types=True,
 ):
     """Write records to fo (stream) according to schema
 
@@ -540,6 +717,12 @@ def writer(
     codec_compression_level: int, optional
         Compression level to use with the specified codec (if the codec
         supports it)
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type (for example a timestamp-micros from an int) instead of
+        being converted. A dictionary of logical type names to bools, like
+        ``{"timestamp-micros": False}``, turns off the conversion of
+        individual logical types
 
 
     Example::
@@ -612,6 +795,7 @@ def writer(
         validator,
         sync_marker,
         codec_compression_level,
+        logical_types,
     )
 
     for record in records:
@@ -619,7 +803,7 @@ def writer(
     output.flush()
 
 
-def schemaless_writer(fo, schema, record):
+def schemaless_writer(fo, schema, record, logical_types=True):
     """Write a single record without the schema or header information
 
     Parameters
@@ -630,6 +814,12 @@ def schemaless_writer(fo, schema, record):
         Schema
     record: dict
         Record to write
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type (for example a timestamp-micros from an int) instead of
+        being converted. A dictionary of logical type names to bools, like
+        ``{"timestamp-micros": False}``, turns off the conversion of
+        individual logical types
 
 
     Example::
@@ -642,6 +832,7 @@ def schemaless_writer(fo, schema, record):
     """
     named_schemas = {}
     schema = parse_schema(schema, _named_schemas=named_schemas)
+    schema, named_schemas = strip_logical_types(schema, named_schemas, logical_types)
 
     encoder = BinaryEncoder(fo)
     write_data(encoder, record, schema, named_schemas, "")
@@ -0,0 +1,348 @@
+"""Reading and writing avro files over asyncio streams.
+
+The bytes of each block are read from (or written to) the stream
+asynchronously and the records of the block are decoded (or encoded) with
+the same code as `fastavro.reader` and `fastavro.writer`, so a request body
+can be read as it arrives instead of being buffered into a ``BytesIO`` first.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+from io import BytesIO
+
+from .read import block_reader, SYNC_SIZE, MAGIC
+from .write import Writer
+
+# Number of bytes requested from the stream at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Blocks larger than this are decompressed and decoded in an executor so that
+# they do not block the event loop
+DEFAULT_OFFLOAD_SIZE = 1024 * 1024
+
+
+class _BlockInput:
+    """File-like object the synchronous block reader reads the bytes of the
+    header and of one block at a time from"""
+
+    def __init__(self):
+        self._fo = BytesIO()
+        self._offset = 0
+
+    def feed(self, data):
+        self._offset += self._fo.tell()
+        self._fo = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._fo.read(size)
+
+    def tell(self):
+        return self._offset + self._fo.tell()
+
+
+class _StreamInput:
+    """The bytes read from the stream that have not been passed on yet"""
+
+    def __init__(self, stream, chunk_size):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    async def fill(self, size):
+        """Reads from the stream until at least `size` bytes are buffered.
+        Returns False if the stream ends first"""
+        while len(self._buffer) < size:
+            data = await self._stream.read(
+                max(self._chunk_size, size - len(self._buffer))
+            )
+            if not data:
+                return False
+            self._buffer += data
+        return True
+
+    async def require(self, size):
+        if not await self.fill(size):
+            raise ValueError("unexpected end of avro stream")
+
+    async def read_long(self, pos):
+        """Returns the long at `pos` and the position after it"""
+        n = 0
+        shift = 0
+        while True:
+            await self.require(pos + 1)
+            b = self._buffer[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            shift += 7
+            if not b & 0x80:
+                return (n >> 1) ^ -(n & 1), pos
+
+    def take(self, size):
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+async def _read_header(stream_input):
+    try:
+        await stream_input.require(len(MAGIC))
+        pos = len(MAGIC)
+        block_count, pos = await stream_input.read_long(pos)
+        while block_count != 0:
+            if block_count < 0:
+                block_count = -block_count
+                # The size of the block, unused
+                _, pos = await stream_input.read_long(pos)
+            for _ in range(2 * block_count):
+                # The key and the value
+                size, pos = await stream_input.read_long(pos)
+                pos += size
+            block_count, pos = await stream_input.read_long(pos)
+        await stream_input.require(pos + SYNC_SIZE)
+    except ValueError:
+        raise ValueError("cannot read header - is it an avro file?")
+    return stream_input.take(pos + SYNC_SIZE)
+
+
+async def _read_block(stream_input):
+    """Returns the bytes of the next block, or None at the end of the stream"""
+    if not await stream_input.fill(1):
+        return None
+    _, pos = await stream_input.read_long(0)
+    size, pos = await stream_input.read_long(pos)
+    await stream_input.require(pos + size + SYNC_SIZE)
+    return stream_input.take(pos + size + SYNC_SIZE)
+
+
+def _decode_block(blocks):
+    return list(next(blocks))
+
+
+class reader:
+    """Asynchronous iterator over records in an avro file read from a stream.
+
+    Parameters
+    ----------
+    stream: asynchronous stream
+        Input stream with a coroutine ``read(n)`` method, like an
+        `asyncio.StreamReader` or the ``content`` of an aiohttp request
+    reader_schema: dict, optional
+        Reader schema
+    return_record_name: bool, optional
+        If true, when reading a union of records, the result will be a tuple
+        where the first value is the name of the record and the second value is
+        the record itself
+    logical_types: bool or dict, optional
+        If false, values of logical types are returned as their underlying
+        Avro type. See `fastavro.reader`
+    executor: concurrent.futures.ThreadPoolExecutor, optional
+        Executor that large blocks are decoded in. The default executor of the
+        event loop is used if not given. The blocks are decoded by the reader
+        state of this process, so it has to be a thread pool and not a process
+        pool
+    offload_size: int, optional
+        Blocks of more than this many bytes are decoded in the executor. If
+        None, all blocks are decoded in the event loop
+    chunk_size: int, optional
+        Number of bytes requested from the stream at a time
+
+
+    Example::
+
+        from fastavro import aio
+
+        async def handle(request):
+            async for record in aio.reader(request.content):
+                process_record(record)
+
+    .. attribute:: metadata
+
+        Key-value pairs in the header metadata
+
+    .. attribute:: codec
+
+        The codec used when writing
+
+    .. attribute:: writer_schema
+
+        The schema used when writing. It is shared with the other readers
+        of files with the same schema and must not be modified
+
+    .. attribute:: reader_schema
+
+        The schema used when reading (if provided)
+
+    The attributes are set once the header has been read, which happens when
+    the first record is read or when `read_header` is awaited.
+    """
+
+    def __init__(
+        self,
+        stream,
+        reader_schema=None,
+        return_record_name=False,
+        logical_types=True,
+        executor=None,
+        offload_size=DEFAULT_OFFLOAD_SIZE,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise ValueError("executor must be a ThreadPoolExecutor")
+        self._input = _StreamInput(stream, chunk_size)
+        self._block_input = _BlockInput()
+        self._reader_schema = reader_schema
+        self._return_record_name = return_record_name
+        self._logical_types = logical_types
+        self._executor = executor
+        self._offload_size = offload_size
+        self._blocks = None
+        self._records = iter(())
+
+    async def read_header(self):
+        """Reads the header of the file if it has not been read yet"""
+        if self._blocks is not None:
+            return
+        self._block_input.feed(await _read_header(self._input))
+        blocks = block_reader(
+            self._block_input,
+            self._reader_schema,
+            self._return_record_name,
+            self._logical_types,
+        )
+        self.metadata = blocks.metadata
+        self.codec = blocks.codec
+        self.writer_schema = blocks.writer_schema
+        self.reader_schema = blocks.reader_schema
+        self._blocks = iter(blocks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        for record in self._records:
+            return record
+
+        await self.read_header()
+        while True:
+            data = await _read_block(self._input)
+            if data is None:
+                raise StopAsyncIteration
+            self._block_input.feed(data)
+            if self._offload_size is not None and len(data) > self._offload_size:
+                loop = asyncio.get_running_loop()
+                records = await loop.run_in_executor(
+                    self._executor, _decode_block, self._blocks
+                )
+            else:
+                records = _decode_block(self._blocks)
+            self._records = iter(records)
+            for record in self._records:
+                return record
+
+
+async def _send(stream, data):
+    result = stream.write(data)
+    if inspect.isawaitable(result):
+        await result
+    drain = getattr(stream, "drain", None)
+    if drain is not None:
+        # Wait until the stream has sent enough of what was written
+        await drain()
+
+
+async def writer(
+    stream,
+    schema,
+    records,
+    codec="null",
+    sync_interval=1000 * SYNC_SIZE,
+    metadata=None,
+    validator=None,
+    sync_marker=None,
+    codec_compression_level=None,
+    logical_types=True,
+):
+    """Write records to an asynchronous stream according to schema
+
+    Each block is written to the stream once it is complete and the next
+    records are not encoded until the stream has accepted it, so a slow
+    reader on the other end holds back the writer instead of the encoded
+    blocks piling up in memory.
+
+    Parameters
+    ----------
+    stream: asynchronous stream
+        Output stream with a ``write(data)`` method that is either a coroutine,
+        like the one of an aiohttp ``StreamResponse``, or that is followed by
+        a coroutine ``drain()`` method, like an `asyncio.StreamWriter`
+    schema: dict
+        Writer schema
+    records: iterable or asynchronous iterable
+        Records to write
+    codec: string, optional
+        Compression codec, can be 'null', 'deflate' or 'snappy' (if installed)
+    sync_interval: int, optional
+        Size of sync interval
+    metadata: dict, optional
+        Header metadata
+    validator: None, True or a function
+        Validator function. See `fastavro.writer`
+    sync_marker: bytes, optional
+        A byte string used as the avro sync marker. If not provided, a random
+        byte string will be used.
+    codec_compression_level: int, optional
+        Compression level to use with the specified codec (if the codec
+        supports it)
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type. See `fastavro.writer`
+
+
+    Example::
+
+        from aiohttp import web
+        from fastavro import aio
+
+        async def handle(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await aio.writer(response, schema, fetch_records())
+            return response
+    """
+    # Sanity check that records is not a single dictionary (as that is a common
+    # mistake and the exception that gets raised is not helpful)
+    if isinstance(records, dict):
+        raise ValueError('"records" argument should be an iterable, not dict')
+
+    buffer = BytesIO()
+    output = Writer(
+        buffer,
+        schema,
+        codec,
+        sync_interval,
+        metadata,
+        validator,
+        sync_marker,
+        codec_compression_level,
+        logical_types,
+    )
+
+    async def send_buffer():
+        if buffer.tell():
+            data = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            await _send(stream, data)
+
+    await send_buffer()
+    if hasattr(records, "__aiter__"):
+        async for record in records:
+            output.write(record)
+            await send_buffer()
+    else:
+        for record in records:
+            output.write(record)
+            await send_buffer()
+    output.flush()
+    await send_buffer()
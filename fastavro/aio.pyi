@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, Optional, Union
+from .types import AvroMessage
+
+DEFAULT_CHUNK_SIZE: int
+DEFAULT_OFFLOAD_SIZE: int
+
+class reader:
+    metadata: Dict[str, str]
+    codec: str
+    reader_schema: Optional[Dict]
+    writer_schema: Optional[Dict]
+    def __init__(
+        self,
+        stream: Any,
+        reader_schema: Optional[Dict] = ...,
+        return_record_name: bool = ...,
+        logical_types: Union[bool, Dict[str, Union[bool, Callable]]] = ...,
+        executor: Optional[ThreadPoolExecutor] = ...,
+        offload_size: Optional[int] = ...,
+        chunk_size: int = ...,
+    ): ...
+    async def read_header(self) -> None: ...
+    def __aiter__(self) -> "reader": ...
+    async def __anext__(self) -> AvroMessage: ...
+
+async def writer(
+    stream: Any,
+    schema: Dict,
+    records: Union[Iterable, AsyncIterable],
+    codec: str = ...,
+    sync_interval: int = ...,
+    metadata: Optional[Dict] = ...,
+    validator: Union[Callable, bool, None] = ...,
+    sync_marker: Optional[bytes] = ...,
+    codec_compression_level: Optional[int] = ...,
+    logical_types: Union[bool, Dict[str, bool]] = ...,
+) -> None: ...
@@ -0,0 +1,144 @@
+"""Conversion of whole columns of logical type values to numpy arrays.
+
+A whole column of timestamp, date or time values is converted to a
+``numpy.datetime64`` (or ``numpy.timedelta64``) array in a single step. The
+values can be the ``datetime``, ``date`` or ``time`` objects that records are
+read with, or the raw integers the values are stored as, for example the
+number of milliseconds since the epoch for ``timestamp-millis``.
+
+numpy needs to be installed to use this module.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from .schema import extract_logical_type, extract_record_type, parse_schema
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The numpy type of each logical type that is stored as an offset from the
+# unix epoch or from midnight
+NUMPY_DTYPES = {
+    "long-timestamp-millis": "datetime64[ms]",
+    "long-timestamp-micros": "datetime64[us]",
+    "int-date": "datetime64[D]",
+    "int-time-millis": "timedelta64[ms]",
+    "long-time-micros": "timedelta64[us]",
+}
+
+# The unit of the raw values of each numpy type
+_UNITS = {
+    "datetime64[ms]": timedelta(milliseconds=1),
+    "datetime64[us]": timedelta(microseconds=1),
+    "datetime64[D]": timedelta(days=1),
+    "timedelta64[ms]": timedelta(milliseconds=1),
+    "timedelta64[us]": timedelta(microseconds=1),
+}
+
+# The int64 value numpy uses to represent NaT
+_NAT = -(1 << 63)
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for fastavro.columnar")
+
+
+def _to_raw(value, unit):
+    """Returns the raw value of a logical type value that may have been
+    converted, or NaT for None"""
+    if value is None:
+        return _NAT
+    elif isinstance(value, datetime):
+        epoch = _EPOCH if value.tzinfo is None else _EPOCH_UTC
+        return (value - epoch) // unit
+    elif isinstance(value, date):
+        return (value - _EPOCH_DATE) // unit
+    elif isinstance(value, time):
+        return (
+            timedelta(
+                hours=value.hour,
+                minutes=value.minute,
+                seconds=value.second,
+                microseconds=value.microsecond,
+            )
+            // unit
+        )
+    return value
+
+
+def to_numpy(values, logical_type):
+    """Returns a numpy array of the values of a logical type
+
+    Parameters
+    ----------
+    values: iterable
+        The ``datetime``, ``date`` or ``time`` objects of the logical type,
+        or its raw values, for example the number of milliseconds since the
+        epoch for ``timestamp-millis``. None values become ``NaT``
+    logical_type: str
+        The logical type as ``"<type>-<logicalType>"``, for example
+        ``"long-timestamp-millis"``
+
+
+    Example::
+
+        from fastavro.columnar import to_numpy
+        to_numpy([0, 86400000], "long-timestamp-millis")
+    """
+    _require_numpy()
+    dtype = NUMPY_DTYPES.get(logical_type)
+    if dtype is None:
+        raise ValueError(f"{logical_type} cannot be converted to a numpy array")
+    unit = _UNITS[dtype]
+    raw = np.fromiter((_to_raw(value, unit) for value in values), dtype=np.int64)
+    return raw.view(dtype)
+
+
+def _column_logical_type(schema):
+    logical_type = extract_logical_type(schema)
+    if logical_type is None and extract_record_type(schema) == "union":
+        # An optional value, like ["null", {"type": "long", ...}]
+        types = [s for s in schema if s != "null"]
+        if len(types) == 1:
+            logical_type = extract_logical_type(types[0])
+    if logical_type in NUMPY_DTYPES:
+        return logical_type
+    return None
+
+
+def to_columns(records, schema):
+    """Returns a dictionary of the values of each field of the records
+
+    The values of timestamp, date and time fields are numpy arrays created
+    with `to_numpy`, which accepts both the ``datetime``, ``date`` and
+    ``time`` objects and the raw integer values. The values of other fields
+    are lists.
+
+    Parameters
+    ----------
+    records: iterable
+        Records to convert
+    schema: dict
+        Record schema the records were read with
+    """
+    _require_numpy()
+    parsed_schema = parse_schema(schema)
+    names = [field["name"] for field in parsed_schema["fields"]]
+    columns = {name: [] for name in names}
+    for record in records:
+        for name in names:
+            columns[name].append(record.get(name))
+
+    for field in parsed_schema["fields"]:
+        logical_type = _column_logical_type(field["type"])
+        if logical_type:
+            name = field["name"]
+            columns[name] = to_numpy(columns[name], logical_type)
+    return columns
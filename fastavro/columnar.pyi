@@ -0,0 +1,8 @@
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+NUMPY_DTYPES: Dict[str, str]
+
+def to_numpy(values: Iterable[Optional[int]], logical_type: str) -> Any: ...
+def to_columns(
+    records: Iterable[Dict[str, Any]], schema: Dict
+) -> Dict[str, Union[List[Any], Any]]: ...
@@ -1,3 +1,5 @@
+from collections import deque
+from itertools import islice
 import json
 
 from .parser import Parser
@@ -40,16 +42,31 @@ class AvroJSONDecoder:
 
     """
 
+    # Number of lines read from the input at a time
+    _chunk_size = 1000
+
     def __init__(self, fo):
         self._fo = fo
         self._stack = []
-        self._json_data = [json.loads(line.strip()) for line in fo]
-        if self._json_data:
-            self._current = self._json_data.pop(0)
+        self._json_data = deque()
+        self._key = None
+        if self._next_record():
             self.done = False
         else:
             self.done = True
-        self._key = None
+
+    def _next_record(self):
+        # Records are read lazily, a chunk of lines at a time, so that the
+        # input never needs to be held in memory
+        while not self._json_data:
+            lines = list(islice(self._fo, self._chunk_size))
+            if not lines:
+                return False
+            self._json_data.extend(
+                json.loads(line) for line in lines if not line.isspace()
+            )
+        self._current = self._json_data.popleft()
+        return True
 
     def read_value(self, symbol):
         if isinstance(self._current, dict):
@@ -92,8 +109,7 @@ class AvroJSONDecoder:
 
     def drain(self):
         self._parser.drain_actions()
-        if self._json_data:
-            self._current = self._json_data.pop(0)
+        if self._next_record():
             self._key = None
         else:
             self.done = True
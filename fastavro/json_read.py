@@ -1,5 +1,7 @@
-from ._read_py import reader
-from .io.json_decoder import AvroJSONDecoder
+try:
+    from . import _json_read
+except ImportError:
+    from . import _json_read_py as _json_read  # type: ignore
 
 
 def json_reader(fo, schema):
@@ -9,7 +11,7 @@ def json_reader(fo, schema):
     ----------
     fo: file-like
         Input stream
-    reader_schema: dict
+    schema: dict
         Reader schema
 
 
@@ -34,4 +36,4 @@ def json_reader(fo, schema):
             for record in avro_reader:
                 print(record)
     """
-    return reader(AvroJSONDecoder(fo), schema)
+    return _json_read.reader(fo, schema)
@@ -1,4 +1,4 @@
 from typing import IO, Dict
-from ._read import reader
+from ._json_read import reader
 
 def json_reader(fo: IO, schema: Dict) -> reader: ...
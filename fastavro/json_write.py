@@ -1,8 +1,12 @@
-from ._write_py import writer
-from .io.json_encoder import AvroJSONEncoder
+try:
+    from . import _json_write
+except ImportError:
+    from . import _json_write_py as _json_write  # type: ignore
 
 
-def json_writer(fo, schema, records):
+def json_writer(
+    fo, schema, records, chunksize=_json_write.DEFAULT_CHUNKSIZE, use_orjson=False
+):
     """Write records to fo (stream) according to schema
 
     Parameters
@@ -14,6 +18,12 @@ def json_writer(fo, schema, records):
     records: iterable
         Records to write. This is commonly a list of the dictionary
         representation of the records, but it can be any iterable
+    chunksize: int, optional
+        Number of records serialized and written to `fo` at a time
+    use_orjson: bool, optional
+        If true, records are serialized with `orjson` (which must be
+        installed) instead of the standard library `json` module. The output
+        is equivalent JSON but is not formatted with spaces after separators
 
 
     Example::
@@ -43,4 +53,4 @@ def json_writer(fo, schema, records):
         with open('some-file', 'w') as out:
             json_writer(out, parsed_schema, records)
     """
-    return writer(AvroJSONEncoder(fo), schema, records)
+    return _json_write.writer(fo, schema, records, chunksize, use_orjson)
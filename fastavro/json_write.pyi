@@ -1,3 +1,9 @@
 from typing import IO, Dict, Iterable
 
-def json_writer(fo: IO, schema: Dict, records: Iterable) -> None: ...
+def json_writer(
+    fo: IO,
+    schema: Dict,
+    records: Iterable,
+    chunksize: int = ...,
+    use_orjson: bool = ...,
+) -> None: ...
@@ -0,0 +1,83 @@
+"""Registration of custom logical types.
+
+The functions that convert the values of a logical type are looked up by the
+Avro type and the ``logicalType`` of the schema, for example
+``"long-timestamp-millis"``. The readers and writers, the converters compiled
+by the JSON reader and writer and ``compile_validator`` look them up once when
+they are created so the values of a registered logical type cost no more to
+convert than the values of the built in logical types.
+
+Logical types should be registered before the schemas that use them are
+compiled.
+"""
+
+from .read import LOGICAL_READERS
+from .logical_writers import LOGICAL_WRITERS
+
+
+def _keys(logical_type, avro_types):
+    if isinstance(avro_types, str):
+        avro_types = [avro_types]
+    return [f"{avro_type}-{logical_type}" for avro_type in avro_types]
+
+
+def register_logical_type(logical_type, avro_types, reader=None, writer=None):
+    """Registers the functions that convert the values of a logical type
+
+    Parameters
+    ----------
+    logical_type: str
+        The ``logicalType`` of the schemas, for example ``"geo-point"``
+    avro_types: str or list
+        The Avro type, or list of types, that the logical type annotates, for
+        example ``"record"`` or ``["bytes", "fixed"]``
+    reader: callable, optional
+        Called as ``reader(data, writer_schema, reader_schema)`` with a value
+        of the Avro type that was read and returns the value of the logical
+        type
+    writer: callable, optional
+        Called as ``writer(datum, schema)`` with a value of the logical type and
+        returns the value of the Avro type that is written
+
+
+    Example::
+
+        from fastavro.logical_types import register_logical_type
+
+        def read_geo_point(data, writer_schema, reader_schema):
+            return (data["lat"], data["lon"])
+
+        def prepare_geo_point(datum, schema):
+            if isinstance(datum, tuple):
+                return {"lat": datum[0], "lon": datum[1]}
+            return datum
+
+        register_logical_type(
+            "geo-point", "record", read_geo_point, prepare_geo_point
+        )
+    """
+    for fn in (reader, writer):
+        if fn is not None and not callable(fn):
+            raise TypeError(f"{fn} is not callable")
+
+    for key in _keys(logical_type, avro_types):
+        if reader is not None:
+            LOGICAL_READERS[key] = reader
+        if writer is not None:
+            LOGICAL_WRITERS[key] = writer
+
+
+def unregister_logical_type(logical_type, avro_types):
+    """Removes the functions that convert the values of a logical type
+
+    Parameters
+    ----------
+    logical_type: str
+        The ``logicalType`` of the schemas
+    avro_types: str or list
+        The Avro type, or list of types, that the logical type was registered
+        for
+    """
+    for key in _keys(logical_type, avro_types):
+        LOGICAL_READERS.pop(key, None)
+        LOGICAL_WRITERS.pop(key, None)
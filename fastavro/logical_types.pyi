@@ -0,0 +1,11 @@
+from typing import Any, Callable, Dict, List, Optional, Union
+
+def register_logical_type(
+    logical_type: str,
+    avro_types: Union[str, List[str]],
+    reader: Optional[Callable[[Any, Optional[Dict], Optional[Dict]], Any]] = ...,
+    writer: Optional[Callable[[Any, Dict], Any]] = ...,
+) -> None: ...
+def unregister_logical_type(
+    logical_type: str, avro_types: Union[str, List[str]]
+) -> None: ...
@@ -19,6 +19,7 @@ schemaless_reader = _read.schemaless_reader
 json_reader = json_read.json_reader
 is_avro = _read.is_avro
 LOGICAL_READERS = _read.LOGICAL_READERS
+read_unscaled_decimal = _read.read_unscaled_decimal
 SchemaResolutionError = _read_common.SchemaResolutionError
 
 __all__ = [
@@ -28,4 +29,5 @@ __all__ = [
     "block_reader",
     "SchemaResolutionError",
     "LOGICAL_READERS",
+    "read_unscaled_decimal",
 ]
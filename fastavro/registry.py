@@ -0,0 +1,293 @@
+"""Client side cache of schemas keyed by a schema ID or fingerprint.
+
+Messages produced for a schema registry are prefixed with a small header that
+identifies the writer schema. Two framings are supported:
+
+* The Confluent wire format: a ``0x00`` byte followed by the schema ID as a
+  4 byte big-endian integer
+* The Avro single object encoding: the ``0xC3 0x01`` marker followed by the
+  8 byte little-endian CRC-64-AVRO fingerprint of the writer schema
+"""
+
+from collections import namedtuple
+import json
+from os import path
+import struct
+import threading
+import time
+
+from ._schema_common import LRUCache
+from .read import schemaless_reader
+from .schema import fingerprint, parse_schema, to_parsing_canonical_form
+from .write import schemaless_writer
+
+CONFLUENT_MAGIC = b"\x00"
+SINGLE_OBJECT_MAGIC = b"\xc3\x01"
+
+_confluent_id = struct.Struct(">I")
+
+SchemaPlan = namedtuple(
+    "SchemaPlan", ["schema_id", "schema", "named_schemas", "fingerprint"]
+)
+
+
+class SchemaNotFound(KeyError):
+    pass
+
+
+def directory_fetcher(directory):
+    """Returns a fetch callback that loads ``<schema_id>.avsc`` files from a
+    directory
+
+    Parameters
+    ----------
+    directory: str
+        Directory containing the schema files
+    """
+
+    def fetch(schema_id):
+        schema_path = path.join(directory, f"{schema_id}.avsc")
+        if not path.isfile(schema_path):
+            return None
+        with open(schema_path) as fd:
+            return json.load(fd)
+
+    return fetch
+
+
+class SchemaRegistry:
+    """Thread-safe cache mapping schema IDs and fingerprints to parsed schemas
+
+    Parameters
+    ----------
+    fetch: callable or mapping, optional
+        Used to look up schemas that are not already cached. If a callable, it
+        is called with the schema ID (an ``int`` for Confluent IDs or the hex
+        fingerprint ``str`` for single object encoded messages) and should
+        return the schema as a dict or a JSON string, or None if the schema is
+        unknown. If a mapping, the schema is looked up by its ID.
+    maxsize: int
+        Maximum number of fetched schemas to keep in the cache
+    ttl: float, optional
+        Number of seconds a fetched schema stays in the cache before it is
+        fetched again. Schemas added with ``register`` never expire.
+
+    The plan of a schema is a ``SchemaPlan`` holding the parsed schema, its
+    named schemas and its CRC-64-AVRO fingerprint; the plan does not include
+    compiled readers or writers, records are read and written from the parsed
+    schema by ``schemaless_reader`` and ``schemaless_writer``.
+
+    A schema that is not cached is only fetched once even if several threads
+    ask for it at the same time, while schemas with other IDs can be fetched
+    concurrently. Reader schemas passed to ``schemaless_reader`` are parsed
+    once per writer schema and kept by identity, so they should not be
+    modified after they were first used.
+
+
+    Example::
+
+        from io import BytesIO
+        from fastavro.registry import SchemaRegistry, directory_fetcher
+
+        registry = SchemaRegistry(directory_fetcher('schemas'), ttl=300)
+
+        with BytesIO() as buf:
+            registry.schemaless_writer(buf, 42, {'station': '011990-99999'})
+            buf.seek(0)
+            record = registry.schemaless_reader(buf)
+    """
+
+    def __init__(self, fetch=None, maxsize=1024, ttl=None):
+        if fetch is not None and not callable(fetch):
+            mapping = fetch
+
+            def fetch(schema_id):
+                return mapping.get(schema_id)
+
+        self._fetch = fetch
+        self._ttl = ttl
+        self._cache = LRUCache(maxsize)
+        self._registered = {}
+        # Locks of the schema IDs that are being fetched, guarded by _lock
+        self._lock = threading.Lock()
+        self._fetching = {}
+        # Parsed reader schemas keyed by the writer fingerprint and the id() of
+        # the reader schema, which the entry keeps a reference to so that the
+        # id cannot be reused while the entry is cached
+        self._reader_schemas = LRUCache(maxsize)
+
+    def __len__(self):
+        return len(self._registered) + len(self._cache)
+
+    def __contains__(self, schema_id):
+        return schema_id in self._registered or schema_id in self._cache
+
+    def register(self, schema, schema_id=None):
+        """Adds a schema to the registry and returns its plan
+
+        The schema is always registered under its CRC-64-AVRO fingerprint and,
+        if given, also under ``schema_id``.
+
+        Parameters
+        ----------
+        schema: dict
+            Schema to register
+        schema_id: int, optional
+            ID to register the schema under
+        """
+        plan = self._build_plan(schema_id, schema)
+        self._registered[plan.fingerprint] = plan
+        if schema_id is not None:
+            self._registered[schema_id] = plan
+        return plan
+
+    def get(self, schema_id):
+        """Returns the plan for a schema ID or fingerprint, fetching the schema
+        if it is not cached
+
+        Parameters
+        ----------
+        schema_id: int or str
+            Schema ID or hex CRC-64-AVRO fingerprint
+        """
+        plan = self._registered.get(schema_id)
+        if plan is not None:
+            return plan
+
+        plan = self._get_cached(schema_id)
+        if plan is not None:
+            return plan
+
+        # Fetches hold a lock for their schema ID only, so a slow fetch does not
+        # block the other IDs
+        with self._lock:
+            fetch_lock = self._fetching.get(schema_id)
+            if fetch_lock is None:
+                fetch_lock = self._fetching[schema_id] = threading.Lock()
+
+        with fetch_lock:
+            try:
+                # Another thread may have fetched the schema while this one was
+                # waiting for the lock
+                plan = self._get_cached(schema_id)
+                if plan is not None:
+                    return plan
+
+                schema = self._fetch(schema_id) if self._fetch is not None else None
+                if schema is None:
+                    raise SchemaNotFound(schema_id)
+                if isinstance(schema, (str, bytes)):
+                    schema = json.loads(schema)
+
+                plan = self._build_plan(schema_id, schema)
+                expires = None if self._ttl is None else time.monotonic() + self._ttl
+                self._cache.set(schema_id, (expires, plan))
+                return plan
+            finally:
+                with self._lock:
+                    if self._fetching.get(schema_id) is fetch_lock:
+                        del self._fetching[schema_id]
+
+    def _get_cached(self, schema_id):
+        cached = self._cache.get(schema_id)
+        if cached is not None:
+            expires, plan = cached
+            if expires is None or time.monotonic() < expires:
+                return plan
+            self._cache.pop(schema_id)
+        return None
+
+    def invalidate(self, schema_id=None):
+        """Removes a fetched schema from the cache, or all fetched schemas if
+        ``schema_id`` is not given
+        """
+        if schema_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(schema_id)
+
+    def read_header(self, fo):
+        """Reads the message header from ``fo`` and returns the writer plan"""
+        magic = fo.read(1)
+        if magic == CONFLUENT_MAGIC:
+            data = fo.read(_confluent_id.size)
+            if len(data) != _confluent_id.size:
+                raise ValueError("Truncated schema ID in message header")
+            return self.get(_confluent_id.unpack(data)[0])
+        elif magic + fo.read(1) == SINGLE_OBJECT_MAGIC:
+            data = fo.read(8)
+            if len(data) != 8:
+                raise ValueError("Truncated fingerprint in message header")
+            return self.get(data.hex())
+        else:
+            raise ValueError("Message does not start with a known schema header")
+
+    def write_header(self, fo, schema_id):
+        """Writes the message header for ``schema_id`` to ``fo`` and returns the
+        writer plan
+        """
+        plan = self.get(schema_id)
+        if isinstance(schema_id, int):
+            fo.write(CONFLUENT_MAGIC)
+            fo.write(_confluent_id.pack(schema_id))
+        else:
+            fo.write(SINGLE_OBJECT_MAGIC)
+            fo.write(bytes.fromhex(plan.fingerprint))
+        return plan
+
+    def schemaless_reader(self, fo, reader_schema=None, return_record_name=False):
+        """Reads a single record prefixed with a schema header
+
+        Parameters
+        ----------
+        fo: file-like
+            Input stream
+        reader_schema: dict, optional
+            If the schema has changed since being written then the new schema
+            can be given to allow for schema migration
+        return_record_name: bool, optional
+            If true, when reading a union of records, the result will be a
+            tuple where the first value is the name of the record and the
+            second value is the record itself
+        """
+        plan = self.read_header(fo)
+        if reader_schema is not None:
+            reader_schema = self._parse_reader_schema(plan, reader_schema)
+        return schemaless_reader(fo, plan.schema, reader_schema, return_record_name)
+
+    def schemaless_writer(self, fo, schema_id, record):
+        """Writes a single record prefixed with a schema header
+
+        Parameters
+        ----------
+        fo: file-like
+            Output file
+        schema_id: int or str
+            Schema ID to write a Confluent header or hex CRC-64-AVRO
+            fingerprint to write a single object encoding header
+        record: dict
+            Record to write
+        """
+        plan = self.write_header(fo, schema_id)
+        schemaless_writer(fo, plan.schema, record)
+
+    def _parse_reader_schema(self, plan, reader_schema):
+        """Returns the parsed reader schema to read records of `plan` with, or
+        None if it is the same as the writer schema"""
+        key = (plan.fingerprint, id(reader_schema))
+        cached = self._reader_schemas.get(key)
+        if cached is None:
+            parsed_schema = parse_schema(reader_schema)
+            if parsed_schema == plan.schema:
+                parsed_schema = None
+            cached = (reader_schema, parsed_schema)
+            self._reader_schemas.set(key, cached)
+        return cached[1]
+
+    def _build_plan(self, schema_id, schema):
+        named_schemas = {}
+        parsed_schema = parse_schema(schema, _named_schemas=named_schemas)
+        schema_fingerprint = fingerprint(
+            to_parsing_canonical_form(parsed_schema), "CRC-64-AVRO"
+        )
+        return SchemaPlan(schema_id, parsed_schema, named_schemas, schema_fingerprint)
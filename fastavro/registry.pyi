@@ -0,0 +1,42 @@
+from typing import IO, Any, Callable, Dict, Mapping, NamedTuple, Optional, Union
+
+from .types import AvroMessage
+from ._schema_py import SchemaType
+
+SchemaId = Union[int, str]
+
+class SchemaPlan(NamedTuple):
+    schema_id: Optional[SchemaId]
+    schema: SchemaType
+    named_schemas: Dict[str, Dict]
+    fingerprint: str
+
+class SchemaNotFound(KeyError): ...
+
+def directory_fetcher(directory: str) -> Callable[[SchemaId], Optional[Dict]]: ...
+
+class SchemaRegistry:
+    def __init__(
+        self,
+        fetch: Optional[Union[Callable[[SchemaId], Any], Mapping[SchemaId, Any]]] = ...,
+        maxsize: int = ...,
+        ttl: Optional[float] = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, schema_id: SchemaId) -> bool: ...
+    def register(
+        self, schema: SchemaType, schema_id: Optional[SchemaId] = ...
+    ) -> SchemaPlan: ...
+    def get(self, schema_id: SchemaId) -> SchemaPlan: ...
+    def invalidate(self, schema_id: Optional[SchemaId] = ...) -> None: ...
+    def read_header(self, fo: IO) -> SchemaPlan: ...
+    def write_header(self, fo: IO, schema_id: SchemaId) -> SchemaPlan: ...
+    def schemaless_reader(
+        self,
+        fo: IO,
+        reader_schema: Optional[SchemaType] = ...,
+        return_record_name: bool = ...,
+    ) -> AvroMessage: ...
+    def schemaless_writer(
+        self, fo: IO, schema_id: SchemaId, record: AvroMessage
+    ) -> None: ...
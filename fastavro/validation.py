@@ -10,5 +10,14 @@ _validate = _validation._validate  # type: ignore
 # Public API
 validate = _validation.validate
 validate_many = _validation.validate_many
+compile_validator = _validation.compile_validator
+iter_invalid = _validation.iter_invalid
 
-__all__ = ["ValidationError", "ValidationErrorData", "validate", "validate_many"]
+__all__ = [
+    "ValidationError",
+    "ValidationErrorData",
+    "validate",
+    "validate_many",
+    "compile_validator",
+    "iter_invalid",
+]
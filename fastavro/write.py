@@ -6,6 +6,7 @@ from . import json_write
 from . import logical_writers
 
 # Private API
+BLOCK_WRITERS = _write.BLOCK_WRITERS
 
 # Public API
 writer = _write.writer
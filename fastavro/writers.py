@@ -0,0 +1,529 @@
+"""Writers built on top of `fastavro.write.Writer`.
+
+* `ThreadedWriter` encodes, compresses and writes the records on a
+  background thread
+* `RollingWriter` writes the records to a series of files, starting a new
+  file when the current one is big enough or old enough
+* `PartitionedWriter` routes each record to the file of its partition while
+  keeping a bounded number of files open
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from io import BytesIO
+from queue import Queue
+import threading
+import time
+
+from .read import SYNC_SIZE
+from .write import Writer
+
+# Number of records that can be waiting to be written before `write` blocks
+DEFAULT_QUEUE_SIZE = 10000
+
+# Number of partition files a PartitionedWriter keeps open
+DEFAULT_MAX_OPEN = 100
+
+# Tells the thread of a ThreadedWriter to stop
+_STOP = object()
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class ThreadedWriter:
+    """Writer that encodes, compresses and writes the records on a
+    background thread
+
+    `write` only puts the record on a bounded queue so the threads that
+    produce the records do not pay for encoding them or for compressing and
+    writing out the blocks. When the queue is full, `write` waits for the
+    thread to catch up.
+
+    The records are queued by reference and encoded later on the background
+    thread, so a record (and anything it contains) must not be modified after
+    it was passed to `write`. A producer that reuses a record object has to
+    pass a copy of it instead.
+
+    If writing a record fails, the records written after it are discarded and
+    the exception is raised by the next call to `write`, `flush` or `close`.
+
+    Parameters
+    ----------
+    fo: file-like
+        Output stream
+    schema: dict
+        Writer schema
+    codec: string, optional
+        Compression codec, can be 'null', 'deflate' or 'snappy' (if installed)
+    sync_interval: int, optional
+        Size of sync interval
+    metadata: dict, optional
+        Header metadata
+    validator: None, True or a function
+        Validator function. See `fastavro.writer`
+    sync_marker: bytes, optional
+        A byte string used as the avro sync marker. If not provided, a random
+        byte string will be used.
+    compression_level: int, optional
+        Compression level to use with the specified codec (if the codec
+        supports it)
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type. See `fastavro.writer`
+    queue_size: int, optional
+        Number of records that can be waiting to be written
+
+
+    Example::
+
+        from fastavro.writers import ThreadedWriter
+
+        with open('events.avro', 'wb') as out:
+            with ThreadedWriter(out, schema, codec='deflate') as avro_writer:
+                # Called from any number of threads
+                avro_writer.write(event)
+    """
+
+    def __init__(
+        self,
+        fo,
+        schema,
+        codec="null",
+        sync_interval=1000 * SYNC_SIZE,
+        metadata=None,
+        validator=None,
+        sync_marker=None,
+        compression_level=None,
+        logical_types=True,
+        queue_size=DEFAULT_QUEUE_SIZE,
+    ):
+        # The header is written here so that an invalid schema or codec is
+        # reported to the caller
+        self._writer = Writer(
+            fo,
+            schema,
+            codec,
+            sync_interval,
+            metadata,
+            validator,
+            sync_marker,
+            compression_level,
+            logical_types,
+        )
+        self.schema = self._writer.schema
+        self._queue = Queue(queue_size)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="fastavro-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        writer = self._writer
+        get = self._queue.get
+        while True:
+            item = get()
+            if item is _STOP:
+                return
+            if type(item) is _Flush:
+                if self._error is None:
+                    try:
+                        writer.flush()
+                    except Exception as ex:
+                        self._error = ex
+                item.done.set()
+            elif self._error is None:
+                try:
+                    writer.write(item)
+                except Exception as ex:
+                    self._error = ex
+
+    def _check(self):
+        if self._closed:
+            raise ValueError("I/O operation on closed writer")
+        if self._error is not None:
+            raise self._error
+
+    def write(self, record):
+        """Queues a record to be written"""
+        self._check()
+        self._queue.put(record)
+
+    def flush(self):
+        """Waits until the records queued so far are written and flushes the
+        output"""
+        self._check()
+        flush = _Flush()
+        self._queue.put(flush)
+        flush.done.wait()
+        self._check()
+
+    def close(self):
+        """Writes the queued records and stops the thread. The output is not
+        closed"""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _Output:
+    """File-like object a Writer writes to that can be pointed at another
+    file"""
+
+    def __init__(self, fo):
+        self.fo = fo
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return self.fo.write(data)
+
+    def flush(self):
+        self.fo.flush()
+
+    def seekable(self):
+        # Never append to the file like a Writer given an existing file does
+        return False
+
+
+class RollingWriter:
+    """Writer that writes the records to a series of avro files
+
+    A new file is started when the current file has `max_records` records,
+    has `max_bytes` bytes or was opened `max_age` seconds ago. The files are
+    only finished at a block boundary, so a file can be bigger than
+    `max_bytes` by up to one block. The limits are checked when a record is
+    written so a file is not finished while no records are being written.
+
+    The schema is parsed and the header is encoded once and then written at
+    the start of every file. All the files use the same sync marker.
+
+    Parameters
+    ----------
+    path_template: str
+        Path of the files. It is formatted with ``index``, the number of the
+        file starting from 0, and ``time``, the UTC `datetime.datetime` the
+        file was started at, like ``"events-{time:%Y%m%d%H%M%S}-{index}.avro"``.
+        Existing files are never overwritten: the indexes of existing files
+        are skipped, so a writer restarted with the same template continues
+        after the files written before. If the path does not depend on the
+        index, FileExistsError is raised instead
+    schema: dict
+        Writer schema
+    max_bytes: int, optional
+        Size of the files
+    max_records: int, optional
+        Number of records in each file
+    max_age: float, optional
+        Number of seconds after which a file is finished
+    codec: string, optional
+        Compression codec, can be 'null', 'deflate' or 'snappy' (if installed)
+    sync_interval: int, optional
+        Size of sync interval
+    metadata: dict, optional
+        Header metadata
+    validator: None, True or a function
+        Validator function. See `fastavro.writer`
+    sync_marker: bytes, optional
+        A byte string used as the avro sync marker. If not provided, a random
+        byte string will be used.
+    compression_level: int, optional
+        Compression level to use with the specified codec (if the codec
+        supports it)
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type. See `fastavro.writer`
+
+
+    Example::
+
+        from fastavro.writers import RollingWriter
+
+        with RollingWriter(
+            "events-{index:05d}.avro", schema, max_bytes=64 * 1024 * 1024
+        ) as avro_writer:
+            for record in records:
+                avro_writer.write(record)
+
+    .. attribute:: path
+
+        The path of the current file, or None between files
+    """
+
+    def __init__(
+        self,
+        path_template,
+        schema,
+        max_bytes=None,
+        max_records=None,
+        max_age=None,
+        codec="null",
+        sync_interval=1000 * SYNC_SIZE,
+        metadata=None,
+        validator=None,
+        sync_marker=None,
+        compression_level=None,
+        logical_types=True,
+    ):
+        self.path_template = path_template
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.max_age = max_age
+        self.path = None
+        self._index = 0
+        self._records = 0
+        self._started = 0
+        self._output = _Output(BytesIO())
+        self._writer = Writer(
+            self._output,
+            schema,
+            codec,
+            sync_interval,
+            metadata,
+            validator,
+            sync_marker,
+            compression_level,
+            logical_types,
+        )
+        self.schema = self._writer.schema
+        self._header = self._output.fo.getvalue()
+
+    def _start_file(self):
+        started = datetime.now(timezone.utc)
+        while True:
+            path = self.path_template.format(index=self._index, time=started)
+            self._index += 1
+            try:
+                fo = open(path, "xb")
+                break
+            except FileExistsError:
+                # Skip the files written before, for example by a previous
+                # run, unless the path does not change with the index
+                next_path = self.path_template.format(index=self._index, time=started)
+                if next_path == path:
+                    raise
+        self.path = path
+        self._output.fo = fo
+        self._output.size = 0
+        self._output.write(self._header)
+        self._records = 0
+        self._started = time.monotonic()
+
+    def _finish_file(self):
+        try:
+            self._writer.flush()
+        finally:
+            self._output.fo.close()
+            self.path = None
+
+    def _is_full(self):
+        return (
+            (self.max_records is not None and self._records >= self.max_records)
+            or (self.max_bytes is not None and self._output.size >= self.max_bytes)
+            or (
+                self.max_age is not None
+                and time.monotonic() - self._started >= self.max_age
+            )
+        )
+
+    def write(self, record):
+        """Writes a record, starting a new file first if the current file is
+        full"""
+        if self.path is not None and self._is_full():
+            self._finish_file()
+        if self.path is None:
+            self._start_file()
+        self._writer.write(record)
+        self._records += 1
+
+    def flush(self):
+        """Writes the pending block to the current file and flushes it"""
+        if self.path is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Finishes the current file"""
+        if self.path is not None:
+            self._finish_file()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PartitionedWriter:
+    """Writer that writes each record to the file of its partition
+
+    The files of the most recently written partitions are kept open, up to
+    `max_open` of them. When another partition is written to, the least
+    recently written partition is flushed and its file is closed. If that
+    partition is written to again, its file is reopened and appended to.
+
+    All the files share the header and the sync marker, so a file is appended
+    to without reading its header back, and the Writer of a closed partition
+    is reused for the next partition that is opened.
+
+    Parameters
+    ----------
+    schema: dict
+        Writer schema
+    key_fn: callable
+        Called with each record and returns the partition of the record, like
+        a date or a customer ID. The partitions must be hashable
+    open_fn: callable
+        Called as ``open_fn(partition, mode)`` and returns the binary file of
+        the partition. `mode` is ``"wb"`` the first time the partition is
+        opened and ``"ab"`` when it is reopened
+    max_open: int, optional
+        Number of files that are kept open
+    codec: string, optional
+        Compression codec, can be 'null', 'deflate' or 'snappy' (if installed)
+    sync_interval: int, optional
+        Size of sync interval
+    metadata: dict, optional
+        Header metadata
+    validator: None, True or a function
+        Validator function. See `fastavro.writer`
+    sync_marker: bytes, optional
+        A byte string used as the avro sync marker. If not provided, a random
+        byte string will be used.
+    compression_level: int, optional
+        Compression level to use with the specified codec (if the codec
+        supports it)
+    logical_types: bool or dict, optional
+        If false, values of logical types are written from their underlying
+        Avro type. See `fastavro.writer`
+
+
+    Example::
+
+        from fastavro.writers import PartitionedWriter
+
+        def open_day(day, mode):
+            return open(f"events-{day}.avro", mode)
+
+        with PartitionedWriter(
+            schema, lambda record: record["day"], open_day, max_open=50
+        ) as avro_writer:
+            for record in records:
+                avro_writer.write(record)
+    """
+
+    def __init__(
+        self,
+        schema,
+        key_fn,
+        open_fn,
+        max_open=DEFAULT_MAX_OPEN,
+        codec="null",
+        sync_interval=1000 * SYNC_SIZE,
+        metadata=None,
+        validator=None,
+        sync_marker=None,
+        compression_level=None,
+        logical_types=True,
+    ):
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.key_fn = key_fn
+        self.open_fn = open_fn
+        self.max_open = max_open
+        self._writer_options = {
+            "codec": codec,
+            "sync_interval": sync_interval,
+            "metadata": metadata,
+            "validator": validator,
+            "sync_marker": sync_marker,
+            "compression_level": compression_level,
+            "logical_types": logical_types,
+        }
+        # The writers of the open partitions, from the least to the most
+        # recently written
+        self._open = OrderedDict()
+        # The writers of closed partitions that can be reused
+        self._idle = []
+        self._created = set()
+
+        output = _Output(BytesIO())
+        writer = Writer(output, schema, **self._writer_options)
+        self.schema = writer.schema
+        # Every file has the same header
+        self._header = output.fo.getvalue()
+        self._writer_options["sync_marker"] = writer.sync_marker
+        self._idle.append((writer, output))
+
+    def _open_partition(self, key):
+        if len(self._open) >= self.max_open:
+            self.close_partition(next(iter(self._open)))
+
+        if self._idle:
+            writer, output = self._idle.pop()
+        else:
+            output = _Output(BytesIO())
+            writer = Writer(output, self.schema, **self._writer_options)
+
+        if key in self._created:
+            output.fo = self.open_fn(key, "ab")
+        else:
+            output.fo = self.open_fn(key, "wb")
+            self._created.add(key)
+            output.write(self._header)
+        self._open[key] = (writer, output)
+        return writer
+
+    def write(self, record):
+        """Writes a record to the file of its partition"""
+        key = self.key_fn(record)
+        entry = self._open.get(key)
+        if entry is None:
+            writer = self._open_partition(key)
+        else:
+            self._open.move_to_end(key)
+            writer = entry[0]
+        writer.write(record)
+
+    def close_partition(self, partition):
+        """Flushes and closes the file of a partition if it is open"""
+        entry = self._open.pop(partition, None)
+        if entry is None:
+            return
+        writer, output = entry
+        try:
+            writer.flush()
+        finally:
+            output.fo.close()
+        output.fo = None
+        self._idle.append((writer, output))
+
+    def flush(self):
+        """Writes the pending blocks to the open files and flushes them"""
+        for writer, _ in self._open.values():
+            writer.flush()
+
+    def close(self):
+        """Flushes and closes the files of all the partitions"""
+        while self._open:
+            self.close_partition(next(iter(self._open)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
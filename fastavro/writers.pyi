@@ -0,0 +1,80 @@
+from typing import Any, Callable, Dict, Hashable, IO, Optional, Union
+from .types import AvroMessage
+
+DEFAULT_MAX_OPEN: int
+DEFAULT_QUEUE_SIZE: int
+
+class ThreadedWriter:
+    schema: Dict
+    def __init__(
+        self,
+        fo: IO,
+        schema: Dict,
+        codec: str = ...,
+        sync_interval: int = ...,
+        metadata: Optional[Dict] = ...,
+        validator: Union[Callable, bool, None] = ...,
+        sync_marker: Optional[bytes] = ...,
+        compression_level: Optional[int] = ...,
+        logical_types: Union[bool, Dict[str, bool]] = ...,
+        queue_size: int = ...,
+    ): ...
+    def write(self, record: AvroMessage) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> "ThreadedWriter": ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
+
+class RollingWriter:
+    schema: Dict
+    path_template: str
+    path: Optional[str]
+    max_bytes: Optional[int]
+    max_records: Optional[int]
+    max_age: Optional[float]
+    def __init__(
+        self,
+        path_template: str,
+        schema: Dict,
+        max_bytes: Optional[int] = ...,
+        max_records: Optional[int] = ...,
+        max_age: Optional[float] = ...,
+        codec: str = ...,
+        sync_interval: int = ...,
+        metadata: Optional[Dict] = ...,
+        validator: Union[Callable, bool, None] = ...,
+        sync_marker: Optional[bytes] = ...,
+        compression_level: Optional[int] = ...,
+        logical_types: Union[bool, Dict[str, bool]] = ...,
+    ): ...
+    def write(self, record: AvroMessage) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> "RollingWriter": ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
+
+class PartitionedWriter:
+    schema: Dict
+    key_fn: Callable[[AvroMessage], Hashable]
+    open_fn: Callable[[Any, str], IO]
+    max_open: int
+    def __init__(
+        self,
+        schema: Dict,
+        key_fn: Callable[[AvroMessage], Hashable],
+        open_fn: Callable[[Any, str], IO],
+        max_open: int = ...,
+        codec: str = ...,
+        sync_interval: int = ...,
+        metadata: Optional[Dict] = ...,
+        validator: Union[Callable, bool, None] = ...,
+        sync_marker: Optional[bytes] = ...,
+        compression_level: Optional[int] = ...,
+        logical_types: Union[bool, Dict[str, bool]] = ...,
+    ): ...
+    def write(self, record: AvroMessage) -> None: ...
+    def close_partition(self, partition: Hashable) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> "PartitionedWriter": ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
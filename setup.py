@@ -28,6 +28,8 @@ if not hasattr(sys, "pypy_version_info"):
         Extension("fastavro._write", ["fastavro/_write" + ext]),
         Extension("fastavro._validation", ["fastavro/_validation" + ext]),
         Extension("fastavro._logical_writers", ["fastavro/_logical_writers" + ext]),
+        Extension("fastavro._json_read", ["fastavro/_json_read" + ext]),
+        Extension("fastavro._json_write", ["fastavro/_json_write" + ext]),
     ]
 
 
@@ -101,6 +103,7 @@ setup(
         "snappy": ["python-snappy"],
         "zstandard": ["zstandard"],
         "lz4": ["lz4"],
+        "orjson": ["orjson"],
     },
     tests_require=tests_require,
     setup_requires=setup_requires,
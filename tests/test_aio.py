@@ -0,0 +1,163 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+import fastavro
+from fastavro import aio
+
+schema = {
+    "type": "record",
+    "name": "Test",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+        {"name": "time", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+    ],
+}
+
+records = [
+    {"id": i, "name": f"name{i}", "time": 1600000000000 + i} for i in range(1000)
+]
+
+
+def stream_of(data, chunk_size=1000):
+    """Returns an asyncio.StreamReader that data is fed to a chunk at a time"""
+    stream = asyncio.StreamReader()
+
+    async def feed():
+        for start in range(0, len(data), chunk_size):
+            stream.feed_data(data[start : start + chunk_size])
+            await asyncio.sleep(0)
+        stream.feed_eof()
+
+    return stream, feed()
+
+
+async def read_all(data, chunk_size=1000, **kwargs):
+    stream, feed = stream_of(data, chunk_size)
+    feeding = asyncio.ensure_future(feed)
+    result = [record async for record in aio.reader(stream, **kwargs)]
+    await feeding
+    return result
+
+
+class Output:
+    def __init__(self, coroutine_write):
+        self.chunks = []
+        self.drains = 0
+        if coroutine_write:
+            self.write = self._async_write
+        else:
+            self.write = self.chunks.append
+            self.drain = self._drain
+
+    async def _async_write(self, data):
+        self.chunks.append(data)
+
+    async def _drain(self):
+        self.drains += 1
+
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+@pytest.mark.parametrize("offload_size", [None, 0])
+def test_aio_reader(codec, offload_size):
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records, codec=codec, sync_interval=1000)
+
+    result = asyncio.run(read_all(fo.getvalue(), 77, offload_size=offload_size))
+
+    assert result == list(fastavro.reader(BytesIO(fo.getvalue())))
+
+
+def test_aio_reader_executor():
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records, sync_interval=1000)
+
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(read_all(fo.getvalue(), executor=executor, offload_size=0))
+    assert result == list(fastavro.reader(BytesIO(fo.getvalue())))
+
+    # The blocks are decoded by the reader of this process
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(ValueError, match="ThreadPoolExecutor"):
+            aio.reader(BytesIO(), executor=executor)
+
+
+def test_aio_reader_header_and_options():
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records[:10], metadata={"key": "value"})
+
+    async def read():
+        stream, feed = stream_of(fo.getvalue())
+        feeding = asyncio.ensure_future(feed)
+        avro_reader = aio.reader(
+            stream,
+            reader_schema={
+                "type": "record",
+                "name": "Test",
+                "fields": [{"name": "time", "type": "long"}],
+            },
+            logical_types=False,
+        )
+        await avro_reader.read_header()
+        assert avro_reader.metadata["key"] == "value"
+        assert avro_reader.codec == "null"
+        assert avro_reader.writer_schema["name"] == "Test"
+        result = [record async for record in avro_reader]
+        await feeding
+        return result
+
+    assert asyncio.run(read()) == [{"time": r["time"]} for r in records[:10]]
+
+
+def test_aio_reader_errors():
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records)
+    data = fo.getvalue()
+
+    with pytest.raises(ValueError, match="cannot read header"):
+        asyncio.run(read_all(b"not avro"))
+
+    with pytest.raises(ValueError, match="unexpected end"):
+        asyncio.run(read_all(data[:-1]))
+
+    with pytest.raises(ValueError, match="sync marker"):
+        asyncio.run(read_all(data[:-1] + b"\x00"))
+
+
+@pytest.mark.parametrize("coroutine_write", [False, True])
+def test_aio_writer(coroutine_write):
+    output = Output(coroutine_write)
+
+    asyncio.run(
+        aio.writer(output, schema, records, codec="deflate", sync_interval=1000)
+    )
+
+    read_records = list(fastavro.reader(BytesIO(output.getvalue())))
+    assert [r["id"] for r in read_records] == [r["id"] for r in records]
+    blocks = list(fastavro.block_reader(BytesIO(output.getvalue())))
+    # The header and each block are written separately
+    assert len(output.chunks) == len(blocks) + 1
+    if not coroutine_write:
+        assert output.drains == len(output.chunks)
+
+
+def test_aio_writer_async_records():
+    async def generate():
+        for record in records:
+            await asyncio.sleep(0)
+            yield record
+
+    async def round_trip():
+        output = Output(True)
+        await aio.writer(output, schema, generate(), sync_interval=1000)
+        return await read_all(output.getvalue())
+
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records)
+    assert asyncio.run(round_trip()) == list(fastavro.reader(BytesIO(fo.getvalue())))
@@ -0,0 +1,95 @@
+import datetime
+from io import BytesIO
+
+import pytest
+
+import fastavro
+from fastavro.columnar import to_columns, to_numpy
+
+np = pytest.importorskip("numpy")
+
+
+def test_to_numpy():
+    day = 24 * 60 * 60 * 1000
+    timestamps = to_numpy([0, day, None], "long-timestamp-millis")
+    assert timestamps.dtype == np.dtype("datetime64[ms]")
+    assert timestamps[1] == np.datetime64("1970-01-02T00:00:00.000")
+    assert np.isnat(timestamps[2])
+
+    dates = to_numpy([0, -1], "int-date")
+    assert list(dates.astype(object)) == [
+        datetime.date(1970, 1, 1),
+        datetime.date(1969, 12, 31),
+    ]
+
+    times = to_numpy([1500], "long-time-micros")
+    assert times[0] == np.timedelta64(1500, "us")
+
+
+def test_to_numpy_unsupported_logical_type():
+    with pytest.raises(ValueError, match="cannot be converted"):
+        to_numpy([], "string-uuid")
+
+
+def test_to_columns():
+    schema = {
+        "type": "record",
+        "name": "test_to_columns",
+        "fields": [
+            {"name": "name", "type": "string"},
+            {
+                "name": "created",
+                "type": {"type": "long", "logicalType": "timestamp-micros"},
+            },
+            {
+                "name": "deleted",
+                "type": ["null", {"type": "int", "logicalType": "date"}],
+            },
+        ],
+    }
+    records = [
+        {"name": "a", "created": 1, "deleted": None},
+        {"name": "b", "created": 2, "deleted": 3},
+    ]
+
+    columns = to_columns(records, schema)
+    assert columns["name"] == ["a", "b"]
+    assert columns["created"].dtype == np.dtype("datetime64[us]")
+    assert list(columns["created"].astype(np.int64)) == [1, 2]
+    assert np.isnat(columns["deleted"][0])
+    assert columns["deleted"][1] == np.datetime64("1970-01-04")
+
+
+def test_to_columns_of_converted_records():
+    schema = {
+        "type": "record",
+        "name": "test_to_columns_of_converted_records",
+        "fields": [
+            {
+                "name": "created",
+                "type": {"type": "long", "logicalType": "timestamp-millis"},
+            },
+            {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+            {
+                "name": "at",
+                "type": ["null", {"type": "long", "logicalType": "time-micros"}],
+            },
+        ],
+    }
+    records = [
+        {"created": -1, "day": -1, "at": None},
+        {"created": 1600000000123, "day": 18000, "at": 45296000007},
+    ]
+    fo = BytesIO()
+    fastavro.writer(fo, schema, records)
+
+    # The records read with the logical types converted give the same columns
+    fo.seek(0)
+    converted = to_columns(fastavro.reader(fo), schema)
+    raw = to_columns(records, schema)
+    for name in ["created", "day", "at"]:
+        assert converted[name].dtype == raw[name].dtype
+        assert list(converted[name].astype(np.int64)) == list(
+            raw[name].astype(np.int64)
+        )
+    assert converted["created"][0] == np.datetime64("1969-12-31T23:59:59.999")
@@ -694,6 +694,48 @@ def test_empty():
         fastavro.reader(io)
 
 
+def test_files_with_same_writer_schema_share_parsed_schema():
+    schema = {
+        "type": "record",
+        "name": "test_files_with_same_writer_schema_share_parsed_schema",
+        "fields": [{"name": "a", "type": {"type": "fixed", "name": "F", "size": 2}}],
+    }
+
+    files = []
+    for value in (b"ab", b"cd"):
+        io = BytesIO()
+        fastavro.writer(io, schema, [{"a": value}], metadata={"extra": "meta"})
+        io.seek(0)
+        files.append(io)
+
+    reader_1 = fastavro.reader(files[0])
+    reader_2 = fastavro.reader(files[1])
+    assert reader_1.writer_schema is reader_2.writer_schema
+    assert reader_1.metadata["extra"] == "meta"
+    assert list(reader_1) == [{"a": b"ab"}]
+    assert list(reader_2) == [{"a": b"cd"}]
+
+
+def test_read_file_header_matches_header_schema():
+    schema = {"type": "string"}
+    io = BytesIO()
+    fastavro.writer(io, schema, ["a"], metadata={"extra": "meta"})
+
+    if hasattr(_reader, "CYTHON_MODULE"):
+        io.seek(0)
+        generic = _reader._read_data(io, HEADER_SCHEMA, {})
+        io.seek(0)
+        header = _reader.read_file_header(io)
+    else:
+        io.seek(0)
+        generic = _reader.read_data(BinaryDecoder(io), HEADER_SCHEMA, {})
+        io.seek(0)
+        header = _reader.read_file_header(BinaryDecoder(io))
+
+    assert header == generic
+    assert header["meta"]["extra"] == b"meta"
+
+
 def test_no_default():
     io = BytesIO()
     schema = {
@@ -2,6 +2,7 @@ import pytest
 from fastavro.schema import (
     FINGERPRINT_ALGORITHMS,
     fingerprint,
+    parse_schema,
     to_parsing_canonical_form,
 )
 
@@ -1053,3 +1054,59 @@ def test_random_cases(original_schema, algorithm, expected_fingerprint):
     # https://github.com/apache/avro/blob/0552c674637dd15b8751ed5181387cdbd81480d5/lang/py3/avro/tests/test_normalization.py
     canonical_form = to_parsing_canonical_form(original_schema)
     assert fingerprint(canonical_form, algorithm) == expected_fingerprint
+
+
+def test_rabin_table_matches_bitwise_algorithm():
+    """The table driven CRC-64-AVRO must match the bitwise reference"""
+    empty = 0xC15D213AA4D7A795
+
+    def reference(data):
+        table = []
+        for i in range(256):
+            fp = i
+            for _ in range(8):
+                mask = -(fp & 1)
+                fp = (fp >> 1) ^ (empty & mask)
+            table.append(fp)
+        result = empty
+        for byte in data:
+            result = (result >> 8) ^ table[(result ^ byte) & 0xFF]
+        return result.to_bytes(length=8, byteorder="little", signed=False).hex()
+
+    for value in ['"int"', '{"type":"fixed","name":"F","size":4}', ""]:
+        assert fingerprint(value, "CRC-64-AVRO") == reference(value.encode())
+
+
+def test_shared_schema_canonical_form_is_cached():
+    schema = parse_schema(
+        {
+            "type": "record",
+            "name": "Test",
+            "fields": [{"name": "field", "type": "int"}],
+        },
+        _force=True,
+    )
+    first = to_parsing_canonical_form(schema)
+    assert to_parsing_canonical_form(schema) is first
+    assert (
+        first
+        == '{"name":"Test","type":"record","fields":[{"name":"field","type":"int"}]}'
+    )
+
+
+def test_canonical_form_follows_schema_changes():
+    schema = parse_schema(
+        {
+            "type": "record",
+            "name": "Changed",
+            "fields": [{"name": "field", "type": "int"}],
+        }
+    )
+    assert to_parsing_canonical_form(schema) == (
+        '{"name":"Changed","type":"record","fields":[{"name":"field","type":"int"}]}'
+    )
+
+    schema["fields"][0]["type"] = "long"
+    assert to_parsing_canonical_form(schema) == (
+        '{"name":"Changed","type":"record","fields":[{"name":"field","type":"long"}]}'
+    )
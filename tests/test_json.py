@@ -1,10 +1,15 @@
 from copy import deepcopy
+import datetime
+from decimal import Decimal
 from io import StringIO
 import json
 
 import pytest
 
 from fastavro import json_writer, json_reader
+from fastavro.json_read import _json_read
+from fastavro.json_write import _json_write
+from fastavro.read import _read
 from fastavro.schema import parse_schema
 
 
@@ -685,3 +690,185 @@ def test_default_value_missing():
     new_file = StringIO(json.dumps(record))
     with pytest.raises(ValueError, match="no value and no default"):
         next(json_reader(new_file, schema))
+
+
+def test_json_reader_reads_lazily():
+    schema = {
+        "type": "record",
+        "name": "test_json_reader_reads_lazily",
+        "fields": [{"name": "value", "type": "long"}],
+    }
+
+    lines_read = []
+
+    def lines():
+        for i in range(5000):
+            lines_read.append(i)
+            yield json.dumps({"value": i}) + "\n"
+            if i == 2500:
+                # Blank lines are ignored
+                yield "\n"
+
+    avro_reader = json_reader(lines(), schema)
+    assert next(avro_reader) == {"value": 0}
+    assert len(lines_read) < 5000
+
+    assert list(avro_reader) == [{"value": i} for i in range(1, 5000)]
+
+
+def test_logical_types_and_named_references():
+    schema = {
+        "type": "record",
+        "name": "test_logical_types_and_named_references",
+        "fields": [
+            {"name": "date", "type": {"type": "int", "logicalType": "date"}},
+            {
+                "name": "amount",
+                "type": [
+                    "null",
+                    {
+                        "type": "bytes",
+                        "logicalType": "decimal",
+                        "precision": 5,
+                        "scale": 2,
+                    },
+                ],
+            },
+            {
+                "name": "color",
+                "type": {"type": "enum", "name": "Color", "symbols": ["RED", "BLUE"]},
+            },
+            {"name": "colors", "type": {"type": "array", "items": "Color"}},
+            {
+                "name": "next",
+                "type": ["null", "test_logical_types_and_named_references"],
+                "default": None,
+            },
+        ],
+    }
+
+    record = {
+        "date": 1,
+        "amount": {"bytes": "\x01\x00"},
+        "color": "RED",
+        "colors": ["BLUE", "RED"],
+        "next": {
+            "test_logical_types_and_named_references": {
+                "date": 2,
+                "amount": None,
+                "color": "BLUE",
+                "colors": [],
+            }
+        },
+    }
+
+    new_file = StringIO(json.dumps(record))
+    assert next(json_reader(new_file, schema)) == {
+        "date": datetime.date(1970, 1, 2),
+        "amount": Decimal("2.56"),
+        "color": "RED",
+        "colors": ["BLUE", "RED"],
+        "next": {
+            "date": datetime.date(1970, 1, 3),
+            "amount": None,
+            "color": "BLUE",
+            "colors": [],
+            "next": None,
+        },
+    }
+
+
+def test_invalid_enum_and_union_values():
+    schema = {
+        "type": "record",
+        "name": "test_invalid_enum_and_union_values",
+        "fields": [
+            {
+                "name": "color",
+                "type": {"type": "enum", "name": "Color", "symbols": ["RED"]},
+            },
+            {"name": "union", "type": ["null", "int"], "default": None},
+        ],
+    }
+
+    new_file = StringIO(json.dumps({"color": "GREEN"}))
+    with pytest.raises(ValueError):
+        next(json_reader(new_file, schema))
+
+    new_file = StringIO(json.dumps({"color": "RED", "union": {"string": "a"}}))
+    with pytest.raises(ValueError):
+        next(json_reader(new_file, schema))
+
+
+def test_json_writer_writes_in_chunks():
+    schema = {
+        "type": "record",
+        "name": "test_json_writer_writes_in_chunks",
+        "fields": [{"name": "value", "type": ["null", "long"]}],
+    }
+    records = [{"value": i if i % 2 else None} for i in range(25)]
+
+    new_file = StringIO()
+    json_writer(new_file, schema, records)
+    expected = new_file.getvalue()
+    assert expected == "\n".join(
+        json.dumps({"value": {"long": i} if i % 2 else None}) for i in range(25)
+    )
+
+    writes = []
+
+    class Output(StringIO):
+        def write(self, data):
+            writes.append(data)
+            return super().write(data)
+
+    new_file = Output()
+    json_writer(new_file, schema, iter(records), chunksize=10)
+    assert len(writes) == 3
+    assert new_file.getvalue() == expected
+
+
+def test_json_writer_orjson():
+    pytest.importorskip("orjson")
+
+    schema = {
+        "type": "record",
+        "name": "test_json_writer_orjson",
+        "fields": [
+            {"name": "bytes", "type": "bytes"},
+            {"name": "union", "type": ["null", "string"]},
+        ],
+    }
+    records = [
+        {"bytes": b"\xe2\x99\xa5", "union": "foo"},
+        {"bytes": b"", "union": None},
+    ]
+
+    new_file = StringIO()
+    json_writer(new_file, schema, records, use_orjson=True)
+    assert [json.loads(line) for line in new_file.getvalue().split("\n")] == [
+        {"bytes": "â\u0099¥", "union": {"string": "foo"}},
+        {"bytes": "", "union": None},
+    ]
+
+    new_file.seek(0)
+    assert list(json_reader(new_file, schema)) == records
+
+
+def test_json_writer_missing_value():
+    schema = {
+        "type": "record",
+        "name": "test_json_writer_missing_value",
+        "fields": [{"name": "string", "type": "string"}],
+    }
+
+    with pytest.raises(ValueError, match="no value and no default for string"):
+        json_writer(StringIO(), schema, [{}])
+
+
+def test_json_codec_uses_same_implementation_as_binary():
+    # The JSON reader and writer should use the Cython code whenever the
+    # binary reader does
+    cython = hasattr(_read, "CYTHON_MODULE")
+    assert hasattr(_json_read, "CYTHON_MODULE") == cython
+    assert hasattr(_json_write, "CYTHON_MODULE") == cython
@@ -1,10 +1,11 @@
 import fastavro
 from fastavro.__main__ import CleanJSONEncoder
+from fastavro.logical_types import register_logical_type, unregister_logical_type
 import json
 import pytest
 
 from decimal import Decimal
-from io import BytesIO
+from io import BytesIO, StringIO
 from uuid import uuid4
 import datetime
 import sys
@@ -298,6 +299,73 @@ def test_fixed_decimal_binary():
     assert Decimal("-2.80") == data2
 
 
+def test_fixed_decimal_too_big_for_size():
+    schema_small_fixed_decimal = {
+        "name": "n",
+        "namespace": "namespace",
+        "type": "fixed",
+        "size": 2,
+        "logicalType": "decimal",
+        "precision": 4,
+        "scale": 0,
+    }
+    serialize(schema_small_fixed_decimal, Decimal("3E+4"))
+    with pytest.raises(ValueError, match="fixed of size 2"):
+        serialize(schema_small_fixed_decimal, Decimal("4E+4"))
+
+
+def test_decimal_high_precision():
+    schema_decimal = {
+        "type": "bytes",
+        "logicalType": "decimal",
+        "precision": 38,
+        "scale": 10,
+    }
+    data1 = Decimal("-1234567890123456789012345678.0123456789")
+    data2 = deserialize(schema_decimal, serialize(schema_decimal, data1))
+    assert data1 == data2
+
+    # Reading decimals of a different precision does not affect each other
+    data3 = Decimal("1.5")
+    assert (
+        deserialize(schema_bytes_decimal, serialize(schema_bytes_decimal, data3))
+        == data3
+    )
+    assert data1 == deserialize(schema_decimal, serialize(schema_decimal, data1))
+
+
+def test_read_unscaled_decimal():
+    schema_decimal = {
+        "type": "record",
+        "name": "test_read_unscaled_decimal",
+        "fields": [
+            {"name": "bytes", "type": schema_bytes_decimal},
+            {"name": "fixed", "type": schema_fixed_decimal},
+        ],
+    }
+    binary = serialize(
+        schema_decimal, {"bytes": Decimal("-1.23"), "fixed": Decimal("-2.9")}
+    )
+
+    logical_types = {"decimal": fastavro.read.read_unscaled_decimal}
+
+    data = fastavro.schemaless_reader(
+        BytesIO(binary), schema_decimal, None, False, logical_types
+    )
+    assert data == {"bytes": -1230, "fixed": -2900}
+
+    buf = BytesIO()
+    fastavro.writer(buf, schema_decimal, [deserialize(schema_decimal, binary)])
+    buf.seek(0)
+    assert list(fastavro.reader(buf, logical_types=logical_types)) == [data]
+
+    # Other readers still get decimals
+    buf.seek(0)
+    assert list(fastavro.reader(buf)) == [
+        {"bytes": Decimal("-1.23"), "fixed": Decimal("-2.9")}
+    ]
+
+
 def test_clean_json_list():
     values = [
         datetime.datetime.now(),
@@ -442,3 +510,287 @@ def test_pandas_datetime():
         )
     }
     assert serialize(schema, data1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(1, 1, 1, tzinfo=timezone.utc),
+        datetime.datetime(1600, 2, 29, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        datetime.datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        datetime.datetime(1970, 1, 1, tzinfo=timezone.utc),
+        datetime.datetime(2000, 2, 29, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+    ],
+)
+def test_timestamp_and_date_range(value):
+    schema_datetime = {
+        "fields": [
+            {
+                "name": "timestamp-millis",
+                "type": {"type": "long", "logicalType": "timestamp-millis"},
+            },
+            {
+                "name": "timestamp-micros",
+                "type": {"type": "long", "logicalType": "timestamp-micros"},
+            },
+            {"name": "date", "type": {"type": "int", "logicalType": "date"}},
+        ],
+        "namespace": "namespace",
+        "name": "name",
+        "type": "record",
+    }
+
+    data1 = {
+        "timestamp-millis": value,
+        "timestamp-micros": value,
+        "date": value.date(),
+    }
+    binary = serialize(schema_datetime, data1)
+    data2 = deserialize(schema_datetime, binary)
+
+    assert data2["timestamp-micros"] == value
+    assert data2["timestamp-micros"].tzinfo == timezone.utc
+    assert data2["timestamp-millis"] == value.replace(
+        microsecond=value.microsecond // 1000 * 1000
+    )
+    assert data2["date"] == value.date()
+
+
+def test_timestamp_out_of_range():
+    schema_timestamp = {"type": "long", "logicalType": "timestamp-micros"}
+    binary = serialize("long", 253402300800000000)
+    with pytest.raises(OverflowError):
+        deserialize(schema_timestamp, binary)
+
+
+raw_schema = {
+    "type": "record",
+    "name": "raw",
+    "fields": [
+        {"name": "time", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+        {
+            "name": "amount",
+            "type": [
+                "null",
+                {
+                    "type": "bytes",
+                    "logicalType": "decimal",
+                    "precision": 5,
+                    "scale": 2,
+                },
+            ],
+        },
+    ],
+}
+
+
+def test_read_without_logical_types():
+    record = {
+        "time": datetime.datetime(2020, 1, 1, tzinfo=timezone.utc),
+        "amount": Decimal("1.23"),
+    }
+    fo = BytesIO()
+    fastavro.writer(fo, raw_schema, [record])
+
+    fo.seek(0)
+    avro_reader = fastavro.reader(fo, logical_types=False)
+    assert list(avro_reader) == [{"time": 1577836800000000, "amount": b"\x7b"}]
+    # The schemas are left as they are in the file
+    assert avro_reader.writer_schema["fields"][0]["type"]["logicalType"] == (
+        "timestamp-micros"
+    )
+
+    fo.seek(0)
+    records = list(fastavro.reader(fo, logical_types={"timestamp-micros": False}))
+    assert records == [{"time": 1577836800000000, "amount": Decimal("1.23")}]
+
+    fo.seek(0)
+    blocks = list(fastavro.block_reader(fo, logical_types=False))
+    assert list(blocks[0]) == [{"time": 1577836800000000, "amount": b"\x7b"}]
+
+
+def test_write_without_logical_types():
+    fo = BytesIO()
+    fastavro.writer(
+        fo,
+        raw_schema,
+        [{"time": 1577836800000000, "amount": b"\x7b"}],
+        validator=True,
+        logical_types=False,
+    )
+
+    fo.seek(0)
+    avro_reader = fastavro.reader(fo)
+    # The logical types are still written to the schema in the header
+    assert list(avro_reader) == [
+        {
+            "time": datetime.datetime(2020, 1, 1, tzinfo=timezone.utc),
+            "amount": Decimal("1.23"),
+        }
+    ]
+
+
+def test_schemaless_without_logical_types():
+    schema = {"type": "int", "logicalType": "date"}
+    fo = BytesIO()
+    fastavro.schemaless_writer(fo, schema, 18262, logical_types=False)
+    fo.seek(0)
+    assert fastavro.schemaless_reader(fo, schema) == datetime.date(2020, 1, 1)
+    fo.seek(0)
+    assert fastavro.schemaless_reader(fo, schema, logical_types=False) == 18262
+
+
+class GeoPoint:
+    def __init__(self, lat, lon):
+        self.lat = lat
+        self.lon = lon
+
+    def __eq__(self, other):
+        return (self.lat, self.lon) == (other.lat, other.lon)
+
+
+def read_geo_point(data, writer_schema, reader_schema):
+    return GeoPoint(data["lat"], data["lon"])
+
+
+def prepare_geo_point(datum, schema):
+    if isinstance(datum, GeoPoint):
+        return {"lat": datum.lat, "lon": datum.lon}
+    return datum
+
+
+@pytest.fixture
+def geo_point():
+    register_logical_type("geo-point", "record", read_geo_point, prepare_geo_point)
+    yield
+    unregister_logical_type("geo-point", "record")
+
+
+geo_schema = {
+    "type": "record",
+    "name": "place",
+    "fields": [
+        {
+            "name": "location",
+            "type": {
+                "type": "record",
+                "name": "point",
+                "logicalType": "geo-point",
+                "fields": [
+                    {"name": "lat", "type": "double"},
+                    {"name": "lon", "type": "double"},
+                ],
+            },
+        },
+        {"name": "previous", "type": ["null", "point"]},
+    ],
+}
+
+
+def test_register_logical_type(geo_point):
+    records = [
+        {"location": GeoPoint(51.5, -0.1), "previous": None},
+        {"location": GeoPoint(48.9, 2.4), "previous": GeoPoint(51.5, -0.1)},
+    ]
+    fo = BytesIO()
+    fastavro.writer(fo, geo_schema, records, validator=True)
+    fo.seek(0)
+    assert list(fastavro.reader(fo)) == records
+
+    fo = StringIO()
+    fastavro.json_writer(fo, geo_schema, records)
+    fo.seek(0)
+    assert list(fastavro.json_reader(fo, geo_schema)) == records
+
+    unregister_logical_type("geo-point", "record")
+    fo.seek(0)
+    assert next(fastavro.json_reader(fo, geo_schema)) == {
+        "location": {"lat": 51.5, "lon": -0.1},
+        "previous": None,
+    }
+
+
+def test_logical_type_resolved_once(geo_point):
+    records = [{"location": GeoPoint(51.5, -0.1), "previous": None}]
+    fo = BytesIO()
+    avro_writer = fastavro.write.Writer(fo, geo_schema)
+
+    # The function is looked up when the writer and the reader are created,
+    # not for every value
+    unregister_logical_type("geo-point", "record")
+    avro_writer.write(records[0])
+    avro_writer.flush()
+    assert b"__fastavro" not in fo.getvalue()
+
+    fo.seek(0)
+    avro_reader = fastavro.reader(fo)
+    register_logical_type("geo-point", "record", read_geo_point, prepare_geo_point)
+    assert list(avro_reader) == [
+        {"location": {"lat": 51.5, "lon": -0.1}, "previous": None}
+    ]
+
+
+def test_resolved_writer_schema_is_cached(geo_point):
+    fo = BytesIO()
+    records = [{"location": GeoPoint(1.0, 2.0), "previous": None}]
+    fastavro.writer(fo, geo_schema, records)
+
+    def read_all():
+        fo.seek(0)
+        return list(fastavro.reader(fo))
+
+    assert read_all()[0]["location"] == GeoPoint(1.0, 2.0)
+    # A file opened after the logical type changed is read with the change
+    unregister_logical_type("geo-point", "record")
+    assert read_all()[0]["location"] == {"lat": 1.0, "lon": 2.0}
+    register_logical_type("geo-point", "record", read_geo_point, prepare_geo_point)
+    assert read_all()[0]["location"] == GeoPoint(1.0, 2.0)
+
+
+def test_resolve_logical_types_does_not_copy_unchanged_schemas():
+    from fastavro._logical_common import (
+        resolve_logical_types,
+        strip_logical_types,
+    )
+
+    named_schemas = {}
+    schema = fastavro.parse_schema(
+        {
+            "type": "record",
+            "name": "Outer",
+            "fields": [
+                {
+                    "name": "plain",
+                    "type": {
+                        "type": "record",
+                        "name": "Plain",
+                        "fields": [{"name": "a", "type": "long"}],
+                    },
+                },
+                {
+                    "name": "time",
+                    "type": {"type": "long", "logicalType": "timestamp-millis"},
+                },
+            ],
+        },
+        _named_schemas=named_schemas,
+    )
+
+    resolved, resolved_named = resolve_logical_types(
+        schema, named_schemas, True, fastavro.read.LOGICAL_READERS
+    )
+    # Only the schemas with a logical type and the ones containing them change
+    assert resolved is not schema
+    assert resolved["fields"][0] is schema["fields"][0]
+    assert resolved_named["Plain"] is named_schemas["Plain"]
+
+    plain = named_schemas["Plain"]
+    assert strip_logical_types(plain, {"Plain": plain}, False)[0] is plain
+    readers = fastavro.read.LOGICAL_READERS
+    assert resolve_logical_types(plain, {}, False, readers)[0] is plain
+
+
+def test_register_logical_type_not_callable():
+    with pytest.raises(TypeError):
+        register_logical_type("geo-point", "record", reader="read_geo_point")
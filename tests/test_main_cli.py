@@ -109,3 +109,430 @@ def test_cli_arg_codecs():
 
     for codec in default_codecs:
         assert codec in result_codecs
+
+
+def write_logical_avro(path):
+    import datetime
+    from decimal import Decimal
+
+    import fastavro
+
+    schema = {
+        "type": "record",
+        "name": "Payment",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {
+                "name": "time",
+                "type": {"type": "long", "logicalType": "timestamp-millis"},
+            },
+            {
+                "name": "amount",
+                "type": [
+                    "null",
+                    {
+                        "type": "bytes",
+                        "logicalType": "decimal",
+                        "precision": 5,
+                        "scale": 2,
+                    },
+                ],
+            },
+        ],
+    }
+    records = [
+        {
+            "id": i,
+            "time": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            "amount": Decimal("1.23") if i % 2 else None,
+        }
+        for i in range(5)
+    ]
+    with open(path, "wb") as fo:
+        fastavro.writer(fo, schema, records)
+
+
+def test_cli_batched_output(tmpdir):
+    # given,
+    given_avro_input = str(tmpdir.join("payments.avro"))
+    write_logical_avro(given_avro_input)
+    given_cmd_args = [
+        sys.executable,
+        main_py,
+        "--batch-size",
+        "2",
+        "--flush-interval",
+        "0",
+        given_avro_input,
+    ]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+    data = [json.loads(result_line_out) for result_line_out in result_output]
+
+    # verify
+    assert [record["id"] for record in data] == [0, 1, 2, 3, 4]
+    assert data[1] == {
+        "id": 1,
+        "time": "2020-01-01T00:00:00+00:00",
+        "amount": "1.23",
+    }
+
+
+def test_cli_avro_json_output(tmpdir):
+    # given,
+    given_avro_input = str(tmpdir.join("payments.avro"))
+    write_logical_avro(given_avro_input)
+    given_cmd_args = [sys.executable, main_py, "--avro-json", given_avro_input]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+    data = [json.loads(result_line_out) for result_line_out in result_output]
+
+    # verify
+    assert data[0] == {"id": 0, "time": 1577836800000, "amount": None}
+    assert data[1] == {"id": 1, "time": 1577836800000, "amount": {"bytes": "{"}}
+
+
+def test_cli_count():
+    # given,
+    given_avro_input = os.path.join(data_dir, "weather.avro")
+    given_cmd_args = [sys.executable, main_py, "count", given_avro_input]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode()
+
+    # verify
+    assert int(result_output) == 5
+
+
+def test_cli_stats(tmpdir):
+    # given,
+    given_avro_input = str(tmpdir.join("payments.avro"))
+    write_logical_avro(given_avro_input)
+    given_cmd_args = [sys.executable, main_py, "stats", given_avro_input]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode()
+    data = json.loads(result_output)
+
+    # verify
+    assert data["codec"] == "null"
+    assert data["blocks"] == 1
+    assert data["records"] == 5
+    assert data["fields"] == {
+        "id": {"nulls": 0, "min": 0, "max": 4},
+        "time": {
+            "nulls": 0,
+            "min": "2020-01-01T00:00:00+00:00",
+            "max": "2020-01-01T00:00:00+00:00",
+        },
+        "amount": {"nulls": 3, "min": "1.23", "max": "1.23"},
+    }
+
+
+def test_cli_parallel_files(tmpdir):
+    # given,
+    given_avro_inputs = [
+        os.path.join(data_dir, "weather.avro"),
+        str(tmpdir.join("payments.avro")),
+        os.path.join(data_dir, "weather.avro"),
+    ]
+    write_logical_avro(given_avro_inputs[1])
+    given_cmd_args = [sys.executable, main_py, "-j", "2"] + given_avro_inputs
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+    data = [json.loads(result_line_out) for result_line_out in result_output]
+
+    # verify, the records of each file are kept together and in order
+    assert len(data) == 15
+    assert [record.get("station") for record in data[:5]] == [
+        "011990-99999",
+        "011990-99999",
+        "011990-99999",
+        "012650-99999",
+        "012650-99999",
+    ]
+    assert [record["id"] for record in data[5:10]] == [0, 1, 2, 3, 4]
+    assert data[10:] == data[:5]
+
+    # exercise,
+    result_output = subprocess.check_output(
+        [sys.executable, main_py, "count", "-j", "2"] + given_avro_inputs
+    ).decode()
+
+    # verify
+    assert int(result_output) == 15
+
+
+def test_cli_subcommand_after_options(tmpdir):
+    # given,
+    given_avro_input = os.path.join(data_dir, "weather.avro")
+    given_cmd_args = [sys.executable, main_py, "-j", "2", "count", given_avro_input]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode()
+
+    # verify
+    assert int(result_output) == 5
+
+    # given, a file named like a subcommand
+    with open(given_avro_input, "rb") as src:
+        tmpdir.join("count").write_binary(src.read())
+
+    # exercise,
+    result_output = (
+        subprocess.check_output(
+            [sys.executable, main_py, "--", "count"], cwd=str(tmpdir)
+        )
+        .decode()
+        .splitlines()
+    )
+
+    # verify
+    assert len(result_output) == 5
+    assert json.loads(result_output[0])["station"] == "011990-99999"
+
+
+def test_cli_parallel_files_removes_temp_files(tmpdir):
+    # given,
+    temp_dir = tmpdir.mkdir("temp")
+    weather = os.path.join(data_dir, "weather.avro")
+    given_avro_inputs = [weather, str(tmpdir.join("missing.avro")), weather, weather]
+    given_cmd_args = [sys.executable, main_py, "-j", "2"] + given_avro_inputs
+
+    # exercise,
+    process = subprocess.run(
+        given_cmd_args,
+        capture_output=True,
+        env=dict(os.environ, TMPDIR=str(temp_dir)),
+    )
+
+    # verify, the temporary files of the files that were dumped are removed
+    # even though one of the files failed
+    assert process.returncode != 0
+    assert os.listdir(temp_dir) == []
+
+
+def test_cli_recodec(tmpdir):
+    import fastavro
+
+    # given,
+    given_avro_input = str(tmpdir.join("input.avro"))
+    schema = {
+        "type": "record",
+        "name": "Line",
+        "fields": [{"name": "text", "type": "string"}],
+    }
+    records = [{"text": f"line {i}" * 10} for i in range(1000)]
+    with open(given_avro_input, "wb") as fo:
+        fastavro.writer(
+            fo, schema, records, sync_interval=1000, metadata={"source": "test"}
+        )
+    with open(given_avro_input, "rb") as fo:
+        input_blocks = len(list(fastavro.block_reader(fo)))
+
+    for extra_args in ([], ["--threads", "2"], ["--sync-interval", "10000"]):
+        given_avro_output = str(tmpdir.join("output.avro"))
+        given_cmd_args = [
+            sys.executable,
+            main_py,
+            "recodec",
+            "--codec",
+            "deflate",
+            "--level",
+            "1",
+            given_avro_input,
+            given_avro_output,
+        ] + extra_args
+
+        # exercise,
+        subprocess.check_call(given_cmd_args)
+
+        # verify
+        with open(given_avro_output, "rb") as fo:
+            avro_reader = fastavro.block_reader(fo)
+            assert avro_reader.codec == "deflate"
+            assert avro_reader.metadata["source"] == "test"
+            blocks = list(avro_reader)
+        assert [record for block in blocks for record in block] == records
+        if extra_args and extra_args[0] == "--sync-interval":
+            assert len(blocks) < input_blocks
+        else:
+            assert len(blocks) == input_blocks
+
+
+def test_cli_head_tail_sample(tmpdir):
+    import fastavro
+
+    # given,
+    given_avro_input = str(tmpdir.join("input.avro"))
+    schema = {
+        "type": "record",
+        "name": "Line",
+        "fields": [{"name": "number", "type": "long"}],
+    }
+    records = [{"number": i} for i in range(1000)]
+    with open(given_avro_input, "wb") as fo:
+        fastavro.writer(fo, schema, records, codec="deflate", sync_interval=100)
+
+    def run(*args):
+        given_cmd_args = [sys.executable, main_py] + list(args) + [given_avro_input]
+        result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+        return [json.loads(result_line_out) for result_line_out in result_output]
+
+    # exercise, verify
+    assert run("head", "-n", "3") == records[:3]
+    assert run("tail", "-n", "3") == records[-3:]
+    assert run("tail", "-n", "150") == records[-150:]
+    assert run("tail", "-n", "2000") == records
+    assert run("sample", "--fraction", "1") == records
+    assert run("sample", "--fraction", "0") == []
+
+    sample = run("sample", "--fraction", "0.5", "--seed", "1")
+    assert 0 < len(sample) < len(records)
+    assert sample == sorted(sample, key=lambda record: record["number"])
+    assert run("sample", "--fraction", "0.5", "--seed", "1") == sample
+
+
+def write_nested_avro(path):
+    import fastavro
+
+    schema = {
+        "type": "record",
+        "name": "Event",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {"name": "status", "type": "string"},
+            {
+                "name": "user",
+                "type": {
+                    "type": "record",
+                    "name": "User",
+                    "fields": [
+                        {"name": "name", "type": "string"},
+                        {"name": "age", "type": "int"},
+                        {"name": "tags", "type": {"type": "array", "items": "string"}},
+                    ],
+                },
+            },
+            {"name": "owner", "type": ["null", "User"]},
+            {"name": "payload", "type": {"type": "map", "values": "bytes"}},
+        ],
+    }
+    records = [
+        {
+            "id": i,
+            "status": "error" if i % 3 == 0 else "ok",
+            "user": {"name": f"user{i}", "age": 20 + i, "tags": ["a"]},
+            "owner": None if i % 2 else {"name": "root", "age": 1, "tags": []},
+            "payload": {"data": b"\x00" * 10},
+        }
+        for i in range(10)
+    ]
+    with open(path, "wb") as fo:
+        fastavro.writer(fo, schema, records)
+
+
+def test_cli_fields_and_where(tmpdir):
+    # given,
+    given_avro_input = str(tmpdir.join("events.avro"))
+    write_nested_avro(given_avro_input)
+
+    def run(*args):
+        given_cmd_args = [sys.executable, main_py] + list(args) + [given_avro_input]
+        result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+        return [json.loads(result_line_out) for result_line_out in result_output]
+
+    # exercise, verify
+    assert run("--fields", "id,user.name")[:2] == [
+        {"id": 0, "user": {"name": "user0"}},
+        {"id": 1, "user": {"name": "user1"}},
+    ]
+    assert run("--fields", "owner.age,id", "--where", "id < 2") == [
+        {"owner": {"age": 1}, "id": 0},
+        {"owner": None, "id": 1},
+    ]
+    assert run("--where", 'status == "error" and user.age > 21') == [
+        {
+            "id": i,
+            "status": "error",
+            "user": {"name": f"user{i}", "age": 20 + i, "tags": ["a"]},
+            "owner": None if i % 2 else {"name": "root", "age": 1, "tags": []},
+            "payload": {"data": "\x00" * 10},
+        }
+        for i in (3, 6, 9)
+    ]
+    # The fields used by the expression do not need to be output
+    assert run(
+        "--fields", "id", "--where", "owner is not None and not id in [0, 4]"
+    ) == [
+        {"id": 2},
+        {"id": 6},
+        {"id": 8},
+    ]
+    assert run(
+        "--avro-json", "--fields", "owner.name", "--where", "user.name == 'user0'"
+    ) == [{"owner": {"User": {"name": "root"}}}]
+    # Comparisons with the fields of a null owner do not match
+    assert run("--fields", "id", "--where", "owner.age >= 1") == [
+        {"id": i} for i in (0, 2, 4, 6, 8)
+    ]
+    assert run("--fields", "id", "--where", "owner.age > 0 or id == 1") == [
+        {"id": i} for i in (0, 1, 2, 4, 6, 8)
+    ]
+
+
+def test_cli_invalid_fields_and_where(tmpdir):
+    # given,
+    given_avro_input = str(tmpdir.join("events.avro"))
+    write_nested_avro(given_avro_input)
+
+    for args in (
+        ["--fields", "missing"],
+        ["--fields", "status.length"],
+        ["--where", "__import__('os')"],
+        ["--where", "id <"],
+    ):
+        given_cmd_args = [sys.executable, main_py] + args + [given_avro_input]
+
+        # exercise,
+        process = subprocess.run(given_cmd_args, capture_output=True)
+
+        # verify
+        assert process.returncode != 0
+        assert b"error:" in process.stderr
+
+
+def test_cli_json_output_matches_stdlib(tmpdir):
+    from fastavro.__main__ import CleanJSONEncoder
+
+    import fastavro
+
+    # given,
+    given_avro_input = str(tmpdir.join("payments.avro"))
+    write_logical_avro(given_avro_input)
+    with open(given_avro_input, "rb") as fo:
+        expected_data = [
+            json.dumps(record, cls=CleanJSONEncoder) for record in fastavro.reader(fo)
+        ]
+    given_cmd_args = [sys.executable, main_py, given_avro_input]
+
+    # exercise,
+    result_output = subprocess.check_output(given_cmd_args).decode().splitlines()
+
+    # verify, the default output is the one of the standard library even if
+    # orjson is installed
+    assert result_output == expected_data
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return
+    result_output = (
+        subprocess.check_output(given_cmd_args + ["--orjson"]).decode().splitlines()
+    )
+    assert [json.loads(line) for line in result_output] == [
+        json.loads(line) for line in expected_data
+    ]
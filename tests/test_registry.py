@@ -0,0 +1,221 @@
+from io import BytesIO
+import json
+import threading
+import time
+
+import pytest
+
+from fastavro.registry import SchemaNotFound, SchemaRegistry, directory_fetcher
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+schema = {
+    "type": "record",
+    "name": "Test",
+    "namespace": "test",
+    "fields": [{"name": "field", "type": "string"}],
+}
+
+
+def test_confluent_framing_roundtrip():
+    registry = SchemaRegistry({7: schema})
+    buf = BytesIO()
+    registry.schemaless_writer(buf, 7, {"field": "test"})
+
+    assert buf.getvalue()[:5] == b"\x00\x00\x00\x00\x07"
+    buf.seek(0)
+    assert registry.schemaless_reader(buf) == {"field": "test"}
+
+
+def test_single_object_framing_roundtrip():
+    registry = SchemaRegistry()
+    plan = registry.register(schema)
+    expected = fingerprint(to_parsing_canonical_form(schema), "CRC-64-AVRO")
+    assert plan.fingerprint == expected
+
+    buf = BytesIO()
+    registry.schemaless_writer(buf, plan.fingerprint, {"field": "test"})
+    assert buf.getvalue()[:10] == b"\xc3\x01" + bytes.fromhex(expected)
+
+    buf.seek(0)
+    assert registry.schemaless_reader(buf) == {"field": "test"}
+
+
+def test_reader_schema_migration():
+    registry = SchemaRegistry({1: schema})
+    buf = BytesIO()
+    registry.schemaless_writer(buf, 1, {"field": "test"})
+    buf.seek(0)
+
+    reader_schema = {
+        "type": "record",
+        "name": "Test",
+        "namespace": "test",
+        "fields": [
+            {"name": "field", "type": "string"},
+            {"name": "extra", "type": "int", "default": 1},
+        ],
+    }
+    assert registry.schemaless_reader(buf, reader_schema) == {
+        "field": "test",
+        "extra": 1,
+    }
+
+
+def test_fetch_is_cached():
+    calls = []
+
+    def fetch(schema_id):
+        calls.append(schema_id)
+        return json.dumps(schema)
+
+    registry = SchemaRegistry(fetch)
+    assert registry.get(1) is registry.get(1)
+    assert calls == [1]
+
+
+def test_concurrent_gets_fetch_once():
+    calls = []
+
+    def fetch(schema_id):
+        calls.append(schema_id)
+        time.sleep(0.05)
+        return schema
+
+    registry = SchemaRegistry(fetch)
+    plans = []
+    threads = [
+        threading.Thread(target=lambda: plans.append(registry.get(1))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert all(plan is plans[0] for plan in plans)
+
+
+def test_slow_fetch_does_not_block_other_ids():
+    fetching = threading.Event()
+    release = threading.Event()
+
+    def fetch(schema_id):
+        if schema_id == 1:
+            fetching.set()
+            assert release.wait(5)
+        return schema
+
+    registry = SchemaRegistry(fetch)
+    thread = threading.Thread(target=registry.get, args=(1,))
+    thread.start()
+    try:
+        assert fetching.wait(5)
+        assert registry.get(2).schema_id == 2
+        assert 1 not in registry
+    finally:
+        release.set()
+        thread.join()
+    assert 1 in registry
+
+
+def test_reader_schema_is_parsed_once(monkeypatch):
+    import fastavro.registry
+
+    parsed = []
+
+    def parse_schema(schema, **kwargs):
+        parsed.append(schema)
+        return real_parse_schema(schema, **kwargs)
+
+    real_parse_schema = fastavro.registry.parse_schema
+    monkeypatch.setattr("fastavro.registry.parse_schema", parse_schema)
+
+    registry = SchemaRegistry({1: schema})
+    reader_schema = {
+        "type": "record",
+        "name": "Test",
+        "namespace": "test",
+        "fields": [{"name": "other", "type": "int", "default": 1}],
+    }
+    buf = BytesIO()
+    registry.schemaless_writer(buf, 1, {"field": "test"})
+    for _ in range(3):
+        buf.seek(0)
+        assert registry.schemaless_reader(buf, reader_schema) == {"other": 1}
+        buf.seek(0)
+        assert registry.schemaless_reader(buf, schema) == {"field": "test"}
+
+    # The writer schema and each reader schema
+    assert parsed == [schema, reader_schema, schema]
+
+
+def test_lru_eviction():
+    calls = []
+
+    def fetch(schema_id):
+        calls.append(schema_id)
+        return schema
+
+    registry = SchemaRegistry(fetch, maxsize=2)
+    registry.get(1)
+    registry.get(2)
+    registry.get(1)
+    registry.get(3)
+
+    assert 1 in registry
+    assert 2 not in registry
+    assert 3 in registry
+    assert len(registry) == 2
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("fastavro.registry.time.monotonic", lambda: now[0])
+
+    calls = []
+
+    def fetch(schema_id):
+        calls.append(schema_id)
+        return schema
+
+    registry = SchemaRegistry(fetch, ttl=10)
+    registry.get(1)
+    now[0] += 5
+    registry.get(1)
+    assert calls == [1]
+
+    now[0] += 10
+    registry.get(1)
+    assert calls == [1, 1]
+
+
+def test_registered_schemas_do_not_expire():
+    registry = SchemaRegistry(ttl=0)
+    plan = registry.register(schema, 5)
+    assert registry.get(5) is plan
+    assert registry.get(plan.fingerprint) is plan
+
+
+def test_unknown_schema():
+    registry = SchemaRegistry({})
+    with pytest.raises(SchemaNotFound):
+        registry.get(1)
+
+    with pytest.raises(SchemaNotFound):
+        registry.schemaless_reader(BytesIO(b"\x00\x00\x00\x00\x01\x00"))
+
+
+def test_unknown_header():
+    registry = SchemaRegistry({1: schema})
+    with pytest.raises(ValueError, match="known schema header"):
+        registry.schemaless_reader(BytesIO(b"\x01\x02\x03"))
+
+
+def test_directory_fetcher(tmpdir):
+    with open(str(tmpdir.join("3.avsc")), "w") as fd:
+        json.dump(schema, fd)
+
+    registry = SchemaRegistry(directory_fetcher(str(tmpdir)))
+    assert registry.get(3).schema["name"] == "test.Test"
+    with pytest.raises(SchemaNotFound):
+        registry.get(4)
@@ -1,4 +1,5 @@
 from os.path import join, abspath, dirname
+import json
 import pytest
 import fastavro
 from fastavro.schema import (
@@ -998,3 +999,59 @@ def test_load_schema_ordered():
         ],
     }
     assert loaded_schema == expected_schema
+
+
+def test_forced_parse_reuses_cached_result():
+    schema = {
+        "type": "record",
+        "name": "test_forced_parse_reuses_cached_result",
+        "fields": [
+            {"name": "field", "type": {"type": "enum", "name": "E", "symbols": ["A"]}}
+        ],
+    }
+    named_schemas_1 = {}
+    named_schemas_2 = {}
+    parsed_1 = parse_schema(schema, _force=True, _named_schemas=named_schemas_1)
+    parsed_2 = parse_schema(
+        dict(reversed(list(schema.items()))),
+        _force=True,
+        _named_schemas=named_schemas_2,
+    )
+
+    assert parsed_1 is parsed_2
+    assert named_schemas_1 == named_schemas_2
+    assert set(named_schemas_2) == {"test_forced_parse_reuses_cached_result", "E"}
+
+
+def test_load_schema_reloads_changed_dependencies(tmpdir):
+    parent = {
+        "type": "record",
+        "name": "Parent",
+        "namespace": "namespace",
+        "fields": [{"name": "child", "type": "Child"}],
+    }
+    child = {
+        "type": "record",
+        "name": "Child",
+        "namespace": "namespace",
+        "fields": [],
+    }
+    parent_path = str(tmpdir.join("Parent.avsc"))
+    child_path = str(tmpdir.join("namespace.Child.avsc"))
+    with open(parent_path, "w") as fd:
+        json.dump(parent, fd)
+    with open(child_path, "w") as fd:
+        json.dump(child, fd)
+
+    loaded = fastavro.schema.load_schema(parent_path)
+    assert fastavro.schema.load_schema(parent_path) is loaded
+
+    child["fields"] = [{"name": "field", "type": "string"}]
+    with open(child_path, "w") as fd:
+        json.dump(child, fd)
+
+    reloaded = fastavro.schema.load_schema(parent_path)
+    assert reloaded is not loaded
+    assert reloaded["fields"][0]["type"]["fields"] == [
+        {"name": "field", "type": "string"}
+    ]
@@ -4,6 +4,8 @@ from fastavro.validation import (
     ValidationErrorData,
     validate,
     validate_many,
+    compile_validator,
+    iter_invalid,
 )
 from fastavro import parse_schema
 import pytest
@@ -574,3 +576,193 @@ def test_record_name_with_named_type_in_union():
 
     parsed_schema = parse_schema(schema)
     validate_many(records, parsed_schema)
+
+
+compiled_schema = {
+    "type": "record",
+    "name": "Node",
+    "namespace": "test",
+    "fields": [
+        {"name": "value", "type": "int"},
+        {"name": "label", "type": "string", "default": "none"},
+        {"name": "color", "type": {"type": "enum", "name": "C", "symbols": ["R"]}},
+        {"name": "hash", "type": {"type": "fixed", "name": "H", "size": 2}},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+        {"name": "attrs", "type": {"type": "map", "values": ["null", "long"]}},
+        {
+            "name": "when",
+            "type": ["null", {"type": "long", "logicalType": "timestamp-millis"}],
+        },
+        {"name": "children", "type": {"type": "array", "items": "Node"}},
+    ],
+}
+
+valid_node = {
+    "value": 1,
+    "color": "R",
+    "hash": b"ab",
+    "tags": ["a"],
+    "attrs": {"a": None, "b": 2},
+    "when": datetime(2021, 1, 1),
+    "children": [
+        {
+            "value": 2,
+            "label": "child",
+            "color": "R",
+            "hash": b"cd",
+            "tags": [],
+            "attrs": {},
+            "when": None,
+            "children": [],
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"value": 2**31},
+        {"value": True},
+        {"label": 1},
+        {"color": "G"},
+        {"color": ["R"]},
+        {"hash": b"abc"},
+        {"hash": bytearray(b"ab")},
+        {"tags": "abc"},
+        {"attrs": {1: 2}},
+        {"attrs": {"a": "b"}},
+        {"when": "now"},
+        {"children": [{"value": 1}]},
+    ],
+)
+def test_compiled_validator_matches_validate(changes):
+    datum = dict(valid_node, **changes)
+    validator = compile_validator(compiled_schema)
+
+    expected = validate(datum, compiled_schema, raise_errors=False)
+    assert validator(datum, raise_errors=False) is expected
+
+    if expected:
+        assert validator(datum)
+    else:
+        with pytest.raises(ValidationError) as compiled_error:
+            validator(datum)
+        with pytest.raises(ValidationError) as error:
+            validate(datum, compiled_schema)
+        assert compiled_error.value.errors == error.value.errors
+
+
+def test_fixed_accepts_bytearray():
+    datum = dict(valid_node, hash=bytearray(b"ab"))
+    assert validate(datum, compiled_schema)
+    assert compile_validator(compiled_schema)(datum)
+
+
+def test_compiled_validator_union_with_record_name():
+    schema = [
+        {"type": "record", "name": "A", "fields": [{"name": "f", "type": "int"}]},
+        {"type": "record", "name": "B", "fields": [{"name": "f", "type": "string"}]},
+    ]
+    validator = compile_validator(schema)
+    assert validator(("B", {"f": "x"}))
+    assert not validator(("A", {"f": "x"}), raise_errors=False)
+    assert not validator(("C", {"f": "x"}), raise_errors=False)
+
+
+def test_writer_with_compiled_validator():
+    from io import BytesIO
+    from fastavro import writer
+
+    with pytest.raises(ValidationError):
+        writer(
+            BytesIO(), compiled_schema, [dict(valid_node, value="1")], validator=True
+        )
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"value": 2**31},
+        {"color": "G"},
+        {"tags": "abc"},
+        {"attrs": {1: 2}},
+        {"when": "now"},
+        {"children": [dict(valid_node, children=[], hash=b"abc")]},
+    ],
+)
+def test_writer_validation_discards_invalid_record(changes):
+    from io import BytesIO
+    from fastavro import reader
+    from fastavro.write import Writer
+
+    invalid = dict(valid_node, **changes)
+    with pytest.raises(ValidationError) as error:
+        validate(invalid, compiled_schema)
+
+    fo = BytesIO()
+    avro_writer = Writer(fo, compiled_schema, validator=True)
+    avro_writer.write(valid_node)
+    with pytest.raises(ValidationError) as writer_error:
+        avro_writer.write(invalid)
+    assert writer_error.value.errors == error.value.errors
+    avro_writer.write(valid_node)
+    avro_writer.flush()
+
+    fo.seek(0)
+    records = list(reader(fo))
+    assert len(records) == 2
+    assert records[0] == records[1]
+    assert records[0]["children"][0]["label"] == "child"
+
+
+parallel_schema = {
+    "type": "record",
+    "name": "Parallel",
+    "fields": [{"name": "value", "type": "int"}],
+}
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_validate_many_reports_record_indices(workers):
+    records = [{"value": i} if i % 7 else {"value": str(i)} for i in range(50)]
+
+    with pytest.raises(ValidationError) as error:
+        validate_many(records, parallel_schema, workers=workers, chunksize=4)
+    assert list(error.value.indices) == list(range(0, 50, 7))
+    assert [e.datum for e in error.value.errors] == [str(i) for i in range(0, 50, 7)]
+
+    assert not validate_many(
+        records, parallel_schema, raise_errors=False, workers=workers, chunksize=4
+    )
+    assert validate_many(
+        [{"value": 1}] * 10, parallel_schema, workers=workers, chunksize=4
+    )
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_iter_invalid(workers):
+    records = ({"value": i} if i % 10 else {"value": None} for i in range(35))
+
+    invalid = list(iter_invalid(records, parallel_schema, workers=workers, chunksize=3))
+    assert [index for index, _, _ in invalid] == [0, 10, 20, 30]
+    for index, record, error in invalid:
+        assert record == {"value": None}
+        assert isinstance(error, ValidationError)
+        assert error.errors[0].field == "Parallel.value"
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_validate_many_invalid_schema(workers):
+    from fastavro.schema import UnknownType
+
+    schema = {
+        "type": "record",
+        "name": "Invalid",
+        "fields": [{"name": "value", "type": "Unknown"}],
+    }
+    with pytest.raises(UnknownType):
+        validate_many([{"value": 1}], schema, workers=workers)
+    with pytest.raises(UnknownType):
+        list(iter_invalid([{"value": 1}], schema, workers=workers))
@@ -0,0 +1,219 @@
+from io import BytesIO
+import os
+import threading
+
+import pytest
+
+import fastavro
+from fastavro.writers import PartitionedWriter, RollingWriter, ThreadedWriter
+
+schema = {
+    "type": "record",
+    "name": "Event",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+
+def make_records(num_records=1000, start=0):
+    return [{"id": i, "name": f"name{i}"} for i in range(start, start + num_records)]
+
+
+def test_threaded_writer():
+    fo = BytesIO()
+    with ThreadedWriter(
+        fo, schema, codec="deflate", sync_interval=1000, queue_size=10
+    ) as avro_writer:
+        producers = [
+            threading.Thread(
+                target=lambda start: [
+                    avro_writer.write(record) for record in make_records(500, start)
+                ],
+                args=(start,),
+            )
+            for start in range(0, 2000, 500)
+        ]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+
+    fo.seek(0)
+    records = list(fastavro.reader(fo))
+    assert sorted(records, key=lambda record: record["id"]) == make_records(2000)
+
+
+def test_threaded_writer_flush():
+    fo = BytesIO()
+    avro_writer = ThreadedWriter(fo, schema)
+    for record in make_records(10):
+        avro_writer.write(record)
+    avro_writer.flush()
+
+    # The records are in the output before the writer is closed
+    assert list(fastavro.reader(BytesIO(fo.getvalue()))) == make_records(10)
+
+    avro_writer.close()
+    avro_writer.close()
+    with pytest.raises(ValueError, match="closed"):
+        avro_writer.write(make_records(1)[0])
+
+
+def test_threaded_writer_errors():
+    fo = BytesIO()
+    avro_writer = ThreadedWriter(fo, schema, validator=True)
+    avro_writer.write({"id": "not a long", "name": "bad"})
+
+    with pytest.raises(fastavro.validation.ValidationError):
+        avro_writer.flush()
+    with pytest.raises(fastavro.validation.ValidationError):
+        avro_writer.write(make_records(1)[0])
+    with pytest.raises(fastavro.validation.ValidationError):
+        avro_writer.close()
+
+    # The thread is stopped even though closing failed
+    assert not avro_writer._thread.is_alive()
+
+    with pytest.raises(ValueError, match="unrecognized codec"):
+        ThreadedWriter(BytesIO(), schema, codec="unknown")
+
+
+def read_files(paths):
+    records = []
+    for path in paths:
+        with open(path, "rb") as fo:
+            records.append(list(fastavro.reader(fo)))
+    return records
+
+
+def test_rolling_writer_max_records(tmpdir):
+    path_template = str(tmpdir.join("events-{index:03d}.avro"))
+    with RollingWriter(
+        path_template, schema, max_records=300, codec="deflate", sync_interval=1000
+    ) as avro_writer:
+        for record in make_records(1000):
+            avro_writer.write(record)
+        assert avro_writer.path == path_template.format(index=3)
+
+    assert avro_writer.path is None
+    assert sorted(os.listdir(tmpdir)) == [f"events-00{i}.avro" for i in range(4)]
+    files = read_files(path_template.format(index=i) for i in range(4))
+    assert [len(records) for records in files] == [300, 300, 300, 100]
+    assert sum(files, []) == make_records(1000)
+
+
+def test_rolling_writer_max_bytes(tmpdir):
+    path_template = str(tmpdir.join("events-{index}.avro"))
+    with RollingWriter(
+        path_template, schema, max_bytes=2000, sync_interval=1000
+    ) as avro_writer:
+        for record in make_records(1000):
+            avro_writer.write(record)
+
+    paths = [path_template.format(index=i) for i in range(len(os.listdir(tmpdir)))]
+    assert len(paths) > 2
+    for path in paths:
+        with open(path, "rb") as fo:
+            blocks = list(fastavro.block_reader(fo))
+        # A file is finished once a block takes it past the limit
+        assert os.path.getsize(path) - blocks[-1].size < 2000
+    assert sum(read_files(paths), []) == make_records(1000)
+
+
+def test_rolling_writer_max_age(tmpdir):
+    path_template = str(tmpdir.join("{time:%Y}-{index}.avro"))
+    with RollingWriter(path_template, schema, max_age=0) as avro_writer:
+        avro_writer.write(make_records(1)[0])
+        avro_writer.flush()
+        first_path = avro_writer.path
+        # The file is complete once flushed
+        assert read_files([first_path]) == [make_records(1)]
+        avro_writer.write(make_records(1, 1)[0])
+        assert avro_writer.path != first_path
+
+    assert len(os.listdir(tmpdir)) == 2
+    assert read_files([first_path]) == [make_records(1)]
+
+
+def test_partitioned_writer(tmpdir):
+    opened = []
+
+    def open_fn(partition, mode):
+        opened.append((partition, mode))
+        return open(str(tmpdir.join(f"{partition}.avro")), mode)
+
+    records = make_records(1000)
+    with PartitionedWriter(
+        schema,
+        lambda record: record["id"] % 7,
+        open_fn,
+        max_open=3,
+        codec="deflate",
+    ) as avro_writer:
+        # Partitions 0-2 are only written in turns at the start and end, the
+        # others are written all the time
+        for record in records:
+            if record["id"] % 7 >= 3 or record["id"] < 21 or record["id"] >= 980:
+                avro_writer.write(record)
+
+    expected = [
+        r for r in records if r["id"] % 7 >= 3 or r["id"] < 21 or r["id"] >= 980
+    ]
+    for partition in range(7):
+        with open(str(tmpdir.join(f"{partition}.avro")), "rb") as fo:
+            assert list(fastavro.reader(fo)) == [
+                r for r in expected if r["id"] % 7 == partition
+            ]
+    assert sorted(set(opened)) == sorted(
+        [(partition, "wb") for partition in range(7)]
+        + [(partition, "ab") for partition in range(7)]
+    )
+    assert opened.count((0, "wb")) == 1
+
+
+def test_partitioned_writer_keeps_recent_partitions_open(tmpdir):
+    opened = []
+
+    def open_fn(partition, mode):
+        opened.append((partition, mode))
+        return open(str(tmpdir.join(f"{partition}.avro")), mode)
+
+    avro_writer = PartitionedWriter(
+        schema, lambda record: record["name"], open_fn, max_open=2
+    )
+    for name in ["a", "b", "a", "c", "a", "b"]:
+        avro_writer.write({"id": 0, "name": name})
+
+    # b is closed when c is opened because a was written more recently
+    assert opened == [("a", "wb"), ("b", "wb"), ("c", "wb"), ("b", "ab")]
+    avro_writer.flush()
+    with open(str(tmpdir.join("a.avro")), "rb") as fo:
+        assert len(list(fastavro.reader(fo))) == 3
+    avro_writer.close_partition("a")
+    avro_writer.close()
+    with open(str(tmpdir.join("b.avro")), "rb") as fo:
+        assert len(list(fastavro.reader(fo))) == 2
+
+    with pytest.raises(ValueError, match="max_open"):
+        PartitionedWriter(schema, len, open_fn, max_open=0)
+
+
+def test_rolling_writer_does_not_overwrite(tmpdir):
+    path_template = str(tmpdir.join("events-{index}.avro"))
+    for run in range(2):
+        # A restarted process uses the same template
+        with RollingWriter(path_template, schema, max_records=2) as avro_writer:
+            for record in make_records(3, start=3 * run):
+                avro_writer.write(record)
+
+    paths = [path_template.format(index=i) for i in range(4)]
+    assert sorted(os.listdir(tmpdir)) == sorted(os.path.basename(p) for p in paths)
+    assert sum(read_files(paths), []) == make_records(6)
+
+    path_template = str(tmpdir.join("events-0.avro"))
+    with pytest.raises(FileExistsError):
+        with RollingWriter(path_template, schema) as avro_writer:
+            avro_writer.write(make_records(1)[0])
+    assert read_files([path_template]) == [make_records(2)]